@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+pytest 공용 fixture
+"""
+
+import os
+import sys
+
+import pytest
+
+# 현재 스크립트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from docker_manager import DockerImageManager
+from release_manager import ReleaseManager
+
+# 배포 기록 테스트는 JSON 파일 쓰기 위주이므로 가능하면 RAM 디스크에 임시 디렉토리 생성
+TMPFS_DIR = '/dev/shm'
+
+
+def pytest_configure(config):
+    """TMPDIR/--basetemp를 지정하지 않았으면 tmp_path 루트를 tmpfs로 지정"""
+    if config.option.basetemp or 'TMPDIR' in os.environ:
+        return
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK):
+        os.environ.setdefault('PYTEST_DEBUG_TEMPROOT', TMPFS_DIR)
+
+
+@pytest.fixture
+def temp_dir(tmp_path):
+    """테스트별 임시 디렉토리 (pytest가 정리, 병렬 실행 시에도 워커별로 분리)"""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def docker_manager():
+    """테스트용 DockerImageManager (상태를 바꾸는 테스트가 없으므로 세션 전체에서 하나만 생성)"""
+    return DockerImageManager(registry='test.registry.com', repo_hub='test-hub')
+
+
+@pytest.fixture
+def releases_dir(temp_dir):
+    """테스트용 RELEASES 디렉토리"""
+    path = temp_dir / 'RELEASES'
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def manager(releases_dir):
+    """임시 RELEASES 디렉토리를 쓰는 ReleaseManager"""
+    manager = ReleaseManager()
+    manager.releases_dir = str(releases_dir)
+    return manager
@@ -8,7 +8,8 @@ import os
 import sys
 import subprocess
 import re
-from typing import Dict, Optional, Tuple
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
 from datetime import datetime
 
 # 현재 스크립트 디렉토리를 Python 경로에 추가
@@ -16,11 +17,36 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from utils import Logger
 
+# Docker 태그에서 허용되지 않는 문자 / 연속된 하이픈
+TAG_INVALID_CHARS_PATTERN = re.compile(r'[^a-zA-Z0-9._-]')
+MULTI_HYPHEN_PATTERN = re.compile(r'-+')
+
+# Dockerfile의 FROM 명령어 (줄 단위로 검사)
+DOCKERFILE_FROM_PATTERN = re.compile(r'FROM\s+\S+', re.IGNORECASE)
+
+# 이미지 태그의 시각 형식
+TAG_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# 이미지 태그용 시각 문자열 캐시 [epoch 초, 'YYYYmmdd_HHMMSS']
+_TAG_TIMESTAMP_CACHE = [None, None]
+
+
+def _tag_timestamp() -> str:
+    """이미지 태그용 현재 시각 문자열 (같은 초 안에서는 다시 포맷하지 않음)"""
+    now = time.time()
+    second = int(now)
+    if _TAG_TIMESTAMP_CACHE[0] != second:
+        _TAG_TIMESTAMP_CACHE[:] = [second, datetime.fromtimestamp(now).strftime(TAG_TIMESTAMP_FORMAT)]
+    return _TAG_TIMESTAMP_CACHE[1]
+
 
 class DockerImageManager:
     """Docker 이미지 관리"""
     
-    def __init__(self, registry: Optional[str] = None, repo_hub: Optional[str] = None):
+    def __init__(self,
+                 registry: Optional[str] = None,
+                 repo_hub: Optional[str] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
         self.logger = Logger("DockerImageManager")
         self.registry = registry or os.environ.get('DOCKER_REGISTRY', 'docker.io')
         self.repo_hub = repo_hub or os.environ.get('DOCKER_REPO_HUB', 'mycompany')
@@ -28,6 +54,12 @@ class DockerImageManager:
         # 프로젝트 루트 디렉토리
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         
+        # 태그용 현재 시각 (테스트에서 고정 시각 주입 가능, 없으면 캐시된 현재 시각 사용)
+        self._clock = clock
+        
+        # 조회한 Git SHA (프로세스 동안 HEAD는 바뀌지 않으므로 한 번만 조회)
+        self._git_sha: Optional[str] = None
+        
         self.logger.info(f"DockerImageManager 초기화 완료 (레지스트리: {self.registry}, 허브: {self.repo_hub})")
     
     def generate_image_tag(self, 
@@ -41,8 +73,8 @@ class DockerImageManager:
         형식: {registry}/{repo_hub}/{image_name}:{service_kind}-{version}-{branch}-{date}-{sha8}
         """
         try:
-            # 현재 날짜 (YYYYMMDD 형식)
-            current_date = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # 현재 날짜/시각 (YYYYmmdd_HHMMSS 형식)
+            current_date = self._clock().strftime(TAG_TIMESTAMP_FORMAT) if self._clock else _tag_timestamp()
             
             # 커밋 SHA가 없으면 현재 Git SHA 조회 시도
             if not commit_sha:
@@ -66,7 +98,10 @@ class DockerImageManager:
             raise
     
     def _get_current_git_sha(self) -> Optional[str]:
-        """현재 Git 커밋 SHA 조회"""
+        """현재 Git 커밋 SHA 조회 (성공한 결과는 인스턴스에 캐시)"""
+        if self._git_sha:
+            return self._git_sha
+        
         try:
             result = subprocess.run(
                 ['git', 'rev-parse', 'HEAD'],
@@ -78,6 +113,7 @@ class DockerImageManager:
             if result.returncode == 0:
                 sha = result.stdout.strip()
                 self.logger.debug(f"현재 Git SHA: {sha}")
+                self._git_sha = sha
                 return sha
             else:
                 self.logger.warning("Git SHA 조회 실패")
@@ -93,10 +129,10 @@ class DockerImageManager:
         clean_name = branch.replace('/', '-')
         
         # Docker 태그에서 허용되지 않는 문자 제거
-        clean_name = re.sub(r'[^a-zA-Z0-9._-]', '', clean_name)
+        clean_name = TAG_INVALID_CHARS_PATTERN.sub('', clean_name)
         
         # 연속된 하이픈 제거
-        clean_name = re.sub(r'-+', '-', clean_name)
+        clean_name = MULTI_HYPHEN_PATTERN.sub('-', clean_name)
         
         # 앞뒤 하이픈 제거
         clean_name = clean_name.strip('-')
@@ -329,25 +365,28 @@ class DockerImageManager:
             self.logger.error(f"빌드 및 푸시 프로세스 실패: {str(e)}")
             return None, None
     
+    def _validate_dockerfile_stream(self, stream: Iterable[str]) -> bool:
+        """Dockerfile 내용 검사 (파일 객체/줄 목록, FROM 명령어를 찾으면 나머지는 읽지 않음)"""
+        # FROM 명령어가 있는지 확인
+        if not any(DOCKERFILE_FROM_PATTERN.match(line) for line in stream):
+            self.logger.error("Dockerfile에 FROM 명령어가 없습니다.")
+            return False
+        return True
+    
     def validate_dockerfile(self, dockerfile_path: str) -> bool:
         """Dockerfile 유효성 검사"""
         try:
-            if not os.path.exists(dockerfile_path):
-                self.logger.error(f"Dockerfile을 찾을 수 없습니다: {dockerfile_path}")
-                return False
-            
             # 기본적인 Dockerfile 구문 검사
             with open(dockerfile_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # FROM 명령어가 있는지 확인
-            if not re.search(r'^FROM\s+\S+', content, re.MULTILINE | re.IGNORECASE):
-                self.logger.error("Dockerfile에 FROM 명령어가 없습니다.")
-                return False
+                if not self._validate_dockerfile_stream(f):
+                    return False
             
             self.logger.info(f"Dockerfile 유효성 검사 통과: {dockerfile_path}")
             return True
             
+        except FileNotFoundError:
+            self.logger.error(f"Dockerfile을 찾을 수 없습니다: {dockerfile_path}")
+            return False
         except Exception as e:
             self.logger.error(f"Dockerfile 유효성 검사 실패: {str(e)}")
             return False
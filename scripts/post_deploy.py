@@ -8,13 +8,21 @@ import os
 import sys
 import argparse
 import time
+import shutil
 import subprocess
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
 
 # 현재 스크립트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils import Logger, HealthChecker, SlackNotifier, load_env_file
+from utils import Logger, HealthChecker, SlackNotifier, load_env_file, json_loads, create_http_session, split_csv
+
+
+# docker 실행 파일 절대 경로 (subprocess의 posix_spawn 사용 조건)
+_DOCKER_BIN = shutil.which('docker') or 'docker'
 
 
 class PostDeployChecker:
@@ -23,12 +31,12 @@ class PostDeployChecker:
     def __init__(self, 
                  environment: str, 
                  service_kind: str,
-                 deployment_id: str = None):
+                 deployment_id: str = None,
+                 session: Optional[requests.Session] = None):
         self.environment = environment
         self.service_kind = service_kind
         self.deployment_id = deployment_id
         self.logger = Logger(f"PostDeployChecker-{environment}-{service_kind}")
-        self.health_checker = HealthChecker()
         
         # Slack 알림 초기화
         self.slack_notifier = SlackNotifier()
@@ -39,17 +47,63 @@ class PostDeployChecker:
         # 환경 변수 로드
         self._load_environment_variables()
         
+        # 환경 변수 기반 체크 대상 (실행 중 변하지 않으므로 한 번만 계산)
+        self._health_urls = self._build_health_urls()
+        self._db_addr = self._build_db_addr()
+        self._external_apis = tuple(split_csv(os.environ.get('EXTERNAL_APIS', '')))
+        self._checks = self._build_checks()
+        
+        # 재시도 간 공유되는 HTTP 세션 (keep-alive, 풀 크기는 병렬 요청 URL 수에 맞춤)
+        # 호출자가 세션을 넘기면 그대로 사용하고 정리도 호출자에게 맡김
+        self._owns_session = session is None
+        if session is None:
+            url_count = len(self._health_urls) + len(self._external_apis)
+            session = create_http_session(pool_size=min(32, max(10, url_count)))
+        self._session = session
+        self.health_checker = HealthChecker(session=self._session)
+        
         self.logger.info(f"PostDeployChecker 초기화 완료 (환경: {environment}, 서비스: {service_kind})")
     
+    def _build_checks(self) -> List[Tuple[str, Callable[[], bool], bool]]:
+        """서비스 종류/설정에 맞는 헬스 체크 목록 구성 (이름, 함수, 치명적 여부)
+        
+        치명적 검사가 실패하면 나머지 검사는 같은 시도 내에서 건너뜁니다.
+        항상 통과하는 검사(DB 미설정 등)는 목록에서 제외합니다.
+        """
+        checks = [("컨테이너 상태 확인", self.check_container_status, True)]
+        
+        if self._health_urls:
+            checks.append(("서비스 응답 확인", self.check_service_response, False))
+        
+        if self.service_kind == 'be' and self._db_addr:
+            checks.append(("데이터베이스 연결 확인", self.check_database_health, False))
+        
+        if self._external_apis or os.environ.get('REDIS_URL'):
+            checks.append(("외부 의존성 확인", self.check_external_dependencies, False))
+        
+        checks.append(("로그 에러 확인", self.check_application_logs, False))
+        
+        self.logger.debug(f"헬스 체크 목록: {', '.join(name for name, _, _ in checks)}")
+        return checks
+    
+    def close(self):
+        """HTTP 세션 정리"""
+        if self._owns_session:
+            self._session.close()
+    
     def _load_environment_variables(self):
         """환경 변수 로드"""
         try:
             env_runtime_path = os.path.join(self.project_root, '.env.runtime')
             if os.path.exists(env_runtime_path):
                 env_vars = load_env_file(env_runtime_path)
-                for key, value in env_vars.items():
-                    os.environ[key] = value
-                self.logger.info(f".env.runtime에서 {len(env_vars)}개 환경 변수 로드")
+                # 값이 바뀐 키만 한 번에 반영 (불필요한 putenv 호출 방지)
+                changed = {key: value for key, value in env_vars.items() if os.environ.get(key) != value}
+                os.environ.update(changed)
+                self.logger.info(
+                    f".env.runtime에서 {len(env_vars)}개 환경 변수 로드 "
+                    f"({len(changed)}개 갱신, {len(env_vars) - len(changed)}개 동일)"
+                )
         except Exception as e:
             self.logger.warning(f"환경 변수 로드 실패: {str(e)}")
     
@@ -61,14 +115,7 @@ class PostDeployChecker:
             # 서비스 시작 대기
             self._wait_for_service_startup()
             
-            # 헬스 체크 항목들
-            health_checks = [
-                ("컨테이너 상태 확인", self.check_container_status),
-                ("서비스 응답 확인", self.check_service_response),
-                ("데이터베이스 연결 확인", self.check_database_health),
-                ("외부 의존성 확인", self.check_external_dependencies),
-                ("로그 에러 확인", self.check_application_logs),
-            ]
+            health_checks = self._checks
             
             # 재시도 로직
             for attempt in range(max_retries):
@@ -76,17 +123,23 @@ class PostDeployChecker:
                 
                 failed_checks = []
                 
-                for check_name, check_func in health_checks:
+                for check_name, check_func, is_critical in health_checks:
                     try:
                         self.logger.info(f"실행 중: {check_name}")
-                        if not check_func():
-                            failed_checks.append(check_name)
-                            self.logger.error(f"헬스 체크 실패: {check_name}")
-                        else:
+                        passed = check_func()
+                        if passed:
                             self.logger.info(f"헬스 체크 성공: {check_name}")
+                        else:
+                            self.logger.error(f"헬스 체크 실패: {check_name}")
                     except Exception as e:
-                        failed_checks.append(check_name)
+                        passed = False
                         self.logger.error(f"헬스 체크 중 예외 발생 ({check_name}): {str(e)}")
+                    
+                    if not passed:
+                        failed_checks.append(check_name)
+                        if is_critical:
+                            self.logger.warning(f"치명적 검사 실패, 남은 검사 건너뜀: {check_name}")
+                            break
                 
                 if not failed_checks:
                     self.logger.info("모든 헬스 체크 통과")
@@ -109,6 +162,19 @@ class PostDeployChecker:
         try:
             self.logger.info(f"서비스 시작 대기 (최대 {max_wait}초)")
             
+            if self._is_service_ready():
+                self.logger.info("서비스 시작 확인됨")
+                return
+            
+            # Docker 이벤트 스트림으로 대기 (지원하지 않으면 폴링으로 대체)
+            event_result = self._wait_for_start_event(max_wait)
+            if event_result is not None:
+                if event_result:
+                    self.logger.info("서비스 시작 확인됨 (이벤트)")
+                else:
+                    self.logger.warning("서비스 시작 대기 시간 초과")
+                return
+            
             start_time = time.time()
             while time.time() - start_time < max_wait:
                 if self._is_service_ready():
@@ -122,15 +188,83 @@ class PostDeployChecker:
         except Exception as e:
             self.logger.error(f"서비스 시작 대기 중 예외 발생: {str(e)}")
     
+    def _wait_for_start_event(self, max_wait: int) -> Optional[bool]:
+        """컨테이너 start/health_status 이벤트 대기
+        
+        Returns:
+            True: 서비스 준비 확인, False: 시간 초과, None: 이벤트 스트림 사용 불가
+        """
+        cmd = [
+            _DOCKER_BIN, 'events',
+            '--filter', 'type=container',
+            '--filter', 'event=start',
+            '--filter', 'event=health_status',
+            '--since', str(int(time.time())),
+            '--until', str(int(time.time() + max_wait)),
+            '--format', '{{json .}}',
+        ]
+        
+        project = os.environ.get('COMPOSE_PROJECT_NAME')
+        if project:
+            cmd[2:2] = ['--filter', f'label=com.docker.compose.project={project}']
+        
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                close_fds=False
+            )
+        except OSError as e:
+            self.logger.debug(f"Docker 이벤트 스트림 시작 실패: {str(e)}")
+            return None
+        
+        try:
+            # --until 시각이 지나면 docker events가 종료되어 스트림이 끝남
+            for line in process.stdout:
+                if not line.strip():
+                    continue
+                
+                event = json_loads(line)
+                action = event.get('Action') or event.get('status', '')
+                if action.startswith('health_status') and action != 'health_status: healthy':
+                    continue
+                
+                if self._is_service_ready():
+                    return True
+            
+            if process.wait() != 0:
+                return None
+            
+            return self._is_service_ready()
+        
+        except ValueError as e:
+            self.logger.debug(f"Docker 이벤트 파싱 실패: {str(e)}")
+            return None
+        
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+    
+    def _compose_cmd(self, *args: str) -> List[str]:
+        """프로젝트 디렉토리를 지정한 docker compose 명령 구성
+        
+        cwd 대신 --project-directory를 사용하고 close_fds=False로 실행하면
+        subprocess가 fork+exec 대신 posix_spawn 경로를 사용할 수 있습니다.
+        """
+        return [_DOCKER_BIN, 'compose', '--project-directory', self.project_root, *args]
+    
     def _is_service_ready(self) -> bool:
         """서비스 준비 상태 확인"""
         try:
             # Docker Compose 서비스 상태 확인
             result = subprocess.run(
-                ['docker', 'compose', 'ps', '--services', '--filter', 'status=running'],
+                self._compose_cmd('ps', '--services', '--filter', 'status=running'),
                 capture_output=True,
-                text=True,
-                cwd=self.project_root
+                close_fds=False
             )
             
             if result.returncode == 0 and result.stdout.strip():
@@ -146,27 +280,21 @@ class PostDeployChecker:
         try:
             # Docker Compose 서비스 상태 확인
             result = subprocess.run(
-                ['docker', 'compose', 'ps', '--format', 'json'],
+                self._compose_cmd('ps', '--format', '{{json .}}'),
                 capture_output=True,
-                text=True,
-                cwd=self.project_root
+                close_fds=False
             )
             
             if result.returncode != 0:
                 self.logger.error("Docker Compose 상태 확인 실패")
                 return False
             
-            import json
-            
-            # JSON 출력 파싱
-            containers = []
-            for line in result.stdout.strip().split('\n'):
-                if line.strip():
-                    try:
-                        container = json.loads(line)
-                        containers.append(container)
-                    except json.JSONDecodeError:
-                        continue
+            # 줄 단위 JSON 출력 일괄 파싱 (bytes 그대로 파싱하여 디코딩 생략)
+            try:
+                containers = [json_loads(line) for line in result.stdout.splitlines() if line.strip()]
+            except ValueError as e:
+                self.logger.error(f"Docker Compose 상태 출력 파싱 실패: {str(e)}")
+                return False
             
             if not containers:
                 self.logger.error("실행 중인 컨테이너를 찾을 수 없습니다.")
@@ -197,8 +325,7 @@ class PostDeployChecker:
     def check_service_response(self) -> bool:
         """서비스 응답 확인"""
         try:
-            # 서비스별 헬스체크 URL 구성
-            health_urls = self._get_health_check_urls()
+            health_urls = self._health_urls
             
             if not health_urls:
                 self.logger.warning("헬스체크 URL이 설정되지 않았습니다.")
@@ -219,8 +346,8 @@ class PostDeployChecker:
             self.logger.error(f"서비스 응답 확인 실패: {str(e)}")
             return False
     
-    def _get_health_check_urls(self) -> List[str]:
-        """헬스체크 URL 목록 반환"""
+    def _build_health_urls(self) -> List[str]:
+        """헬스체크 URL 목록 구성"""
         urls = []
         
         try:
@@ -235,21 +362,16 @@ class PostDeployChecker:
                     urls.append(f"{frontend_url.rstrip('/')}{health_endpoint}")
                     
             elif self.service_kind == 'be':
-                # 백엔드 헬스체크
-                api_url = os.environ.get('API_URL', 'http://localhost:8000')
-                urls.append(f"{api_url.rstrip('/')}/health")
+                # 백엔드 헬스체크 (기준 URL은 한 번만 정규화)
+                api_base = os.environ.get('API_URL', 'http://localhost:8000').rstrip('/')
+                urls.append(f"{api_base}/health")
                 
                 # 추가 API 엔드포인트
-                additional_endpoints = os.environ.get('HEALTH_CHECK_ENDPOINTS', '').split(',')
-                for endpoint in additional_endpoints:
-                    if endpoint.strip():
-                        urls.append(f"{api_url.rstrip('/')}{endpoint.strip()}")
+                endpoints = split_csv(os.environ.get('HEALTH_CHECK_ENDPOINTS', ''))
+                urls.extend(f"{api_base}{endpoint}" for endpoint in endpoints)
             
             # 커스텀 헬스체크 URL
-            custom_urls = os.environ.get('CUSTOM_HEALTH_URLS', '').split(',')
-            for url in custom_urls:
-                if url.strip():
-                    urls.append(url.strip())
+            urls.extend(split_csv(os.environ.get('CUSTOM_HEALTH_URLS', '')))
             
             return urls
             
@@ -257,6 +379,20 @@ class PostDeployChecker:
             self.logger.error(f"헬스체크 URL 구성 실패: {str(e)}")
             return []
     
+    def _build_db_addr(self) -> Optional[Tuple[str, Optional[int]]]:
+        """데이터베이스 주소 (host, port) 구성
+        
+        DB_PORT가 숫자가 아니면 port를 None으로 두어 데이터베이스 검사에서 실패로 보고합니다.
+        """
+        db_host = os.environ.get('DB_HOST')
+        if not db_host:
+            return None
+        
+        try:
+            return (db_host, int(os.environ.get('DB_PORT', '5432')))
+        except ValueError:
+            return (db_host, None)
+    
     def check_database_health(self) -> bool:
         """데이터베이스 헬스 확인"""
         try:
@@ -265,20 +401,22 @@ class PostDeployChecker:
                 self.logger.info("프론트엔드 서비스, 데이터베이스 헬스 확인 건너뜀")
                 return True
             
-            db_host = os.environ.get('DB_HOST')
-            db_port = os.environ.get('DB_PORT', '5432')
-            
-            if not db_host:
+            if not self._db_addr:
                 self.logger.info("DB_HOST가 설정되지 않음, 데이터베이스 헬스 확인 건너뜀")
                 return True
             
+            db_host, db_port = self._db_addr
+            if db_port is None:
+                self.logger.error(f"잘못된 DB_PORT 값: {os.environ.get('DB_PORT')!r}")
+                return False
+            
             # 데이터베이스 연결 테스트
             import socket
             
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(10)
-                result = sock.connect_ex((db_host, int(db_port)))
+                result = sock.connect_ex(self._db_addr)
                 sock.close()
                 
                 if result == 0:
@@ -299,13 +437,17 @@ class PostDeployChecker:
     def check_external_dependencies(self) -> bool:
         """외부 의존성 확인"""
         try:
-            # 외부 API 의존성 확인
-            external_apis = os.environ.get('EXTERNAL_APIS', '').split(',')
-            
+            # 외부 API 의존성 확인 (URL별 독립 요청이므로 병렬 실행)
             all_healthy = True
-            for api_url in external_apis:
-                if api_url.strip():
-                    if not self.health_checker.check_url(api_url.strip(), timeout=10):
+            if self._external_apis:
+                with ThreadPoolExecutor(max_workers=min(16, len(self._external_apis))) as executor:
+                    results = list(executor.map(
+                        lambda url: (url, self.health_checker.check_url(url, timeout=10)),
+                        self._external_apis
+                    ))
+                
+                for api_url, healthy in results:
+                    if not healthy:
                         self.logger.warning(f"외부 API 연결 실패: {api_url}")
                         # 외부 의존성 실패는 경고로만 처리
                     else:
@@ -328,16 +470,16 @@ class PostDeployChecker:
         try:
             # Docker Compose 로그에서 에러 확인
             result = subprocess.run(
-                ['docker', 'compose', 'logs', '--tail=100'],
+                self._compose_cmd('logs', '--tail=100'),
                 capture_output=True,
-                text=True,
-                cwd=self.project_root
+                close_fds=False
             )
             
             if result.returncode != 0:
                 self.logger.warning("Docker Compose 로그 조회 실패")
                 return True  # 로그 조회 실패는 배포를 중단하지 않음
             
+            # 패턴이 모두 ASCII이므로 디코딩 없이 bytes로 비교
             logs = result.stdout.lower()
             
             # 심각한 에러 패턴 확인
@@ -353,7 +495,7 @@ class PostDeployChecker:
             
             found_errors = []
             for pattern in error_patterns:
-                if pattern in logs:
+                if pattern.encode() in logs:
                     found_errors.append(pattern)
             
             if found_errors:
@@ -427,6 +569,38 @@ class PostDeployChecker:
         try:
             self.logger.info("자동 롤백 트리거")
             
+            if os.environ.get('ROLLBACK_MODE') == 'subprocess':
+                return self._trigger_rollback_subprocess()
+            
+            # 같은 프로세스에서 롤백 실행 (인터프리터 기동 및 환경 변수 재로드 생략)
+            from rollback import RollbackManager
+            
+            rollback_manager = RollbackManager(
+                self.environment,
+                self.service_kind,
+                load_environment=False
+            )
+            rollback_manager.slack_notifier = self.slack_notifier
+            
+            try:
+                success = rollback_manager.execute_rollback()
+            finally:
+                rollback_manager.close()
+            
+            if success:
+                self.logger.info("자동 롤백 성공")
+                return True
+            else:
+                self.logger.error("자동 롤백 실패")
+                return False
+                
+        except Exception as e:
+            self.logger.error(f"롤백 트리거 실패: {str(e)}")
+            return False
+    
+    def _trigger_rollback_subprocess(self) -> bool:
+        """별도 프로세스로 롤백 스크립트 실행 (ROLLBACK_MODE=subprocess)"""
+        try:
             # 롤백 스크립트 실행
             rollback_script = os.path.join(
                 os.path.dirname(os.path.abspath(__file__)),
@@ -460,6 +634,19 @@ class PostDeployChecker:
             return False
 
 
+def run_health_check(environment: str,
+                     service_kind: str,
+                     max_retries: int = 5,
+                     retry_delay: int = 30,
+                     session: Optional[requests.Session] = None) -> bool:
+    """같은 프로세스에서 사후 배포 헬스 체크 실행 (롤백 후 검증용)"""
+    checker = PostDeployChecker(environment, service_kind, session=session)
+    try:
+        return checker.run_health_checks(max_retries=max_retries, retry_delay=retry_delay)
+    finally:
+        checker.close()
+
+
 def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description="사후 배포 헬스 체크 및 알림")
@@ -518,6 +705,7 @@ def main():
     
     # 로거 초기화
     logger = Logger("post_deploy")
+    checker = None
     
     try:
         # PostDeployChecker 초기화
@@ -550,25 +738,27 @@ def main():
             # 실패 처리
             error_message = "헬스 체크 실패"
             
-            # 실패 알림 전송
-            checker.send_failure_notification(deployment_info, error_message)
-            
-            # 자동 롤백 실행
-            if args.auto_rollback:
-                logger.info("자동 롤백 시작")
-                rollback_success = checker.trigger_rollback()
+            # 실패/롤백 알림을 한 번의 Slack 요청으로 묶어 전송
+            with checker.slack_notifier.batch():
+                # 실패 알림 전송
+                checker.send_failure_notification(deployment_info, error_message)
                 
-                if rollback_success:
-                    # 롤백 성공 알림
-                    rollback_info = deployment_info.copy()
-                    rollback_info['action'] = 'rollback'
-                    checker.slack_notifier.send_rollback_notification(
-                        rollback_info, 
-                        "previous_digest"  # 실제 구현에서는 이전 다이제스트 조회
-                    )
-                    logger.info("자동 롤백 완료")
-                else:
-                    logger.error("자동 롤백 실패")
+                # 자동 롤백 실행
+                if args.auto_rollback:
+                    logger.info("자동 롤백 시작")
+                    rollback_success = checker.trigger_rollback()
+                
+                    if rollback_success:
+                        # 롤백 성공 알림
+                        rollback_info = deployment_info.copy()
+                        rollback_info['action'] = 'rollback'
+                        checker.slack_notifier.send_rollback_notification(
+                            rollback_info, 
+                            "previous_digest"  # 실제 구현에서는 이전 다이제스트 조회
+                        )
+                        logger.info("자동 롤백 완료")
+                    else:
+                        logger.error("자동 롤백 실패")
             
             logger.error("사후 배포 헬스 체크 실패")
             print("ERROR: Post-deployment health checks failed", file=sys.stderr)
@@ -578,6 +768,9 @@ def main():
         logger.error(f"사후 배포 헬스 체크 중 예외 발생: {str(e)}")
         print(f"ERROR: {str(e)}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if checker:
+            checker.close()
 
 
 if __name__ == "__main__":
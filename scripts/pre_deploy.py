@@ -6,100 +6,418 @@
 
 import os
 import sys
+import json
+import errno
+import time
 import argparse
+import asyncio
+import hashlib
+import functools
+import shutil
+import socket
+import stat
+import tempfile
 import subprocess
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 
 # 현재 스크립트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils import Logger, HealthChecker, load_env_file, validate_environment_variables
+try:
+    import docker
+except ImportError:
+    docker = None  # 선택적 의존성: 없으면 docker CLI 사용
+
+from utils import Logger, HealthChecker, create_http_session, load_env_file_cached, run_bounded, split_csv, validate_environment_variables
+
+
+# Docker 데이터 디렉토리 (이미지 pull 시 사용되는 파티션)
+DOCKER_DATA_ROOT = '/var/lib/docker'
+
+# 필수 환경 변수 (공통)
+REQUIRED_ENV_VARS = (
+    'ENVIRONMENT',
+    'SERVICE_KIND',
+    'DOCKER_REGISTRY',
+)
+
+# 서비스별 추가 필수 환경 변수
+REQUIRED_ENV_VARS_BY_KIND = {
+    'fe': (
+        'NODE_ENV',
+        'API_URL',
+    ),
+    'be': (
+        'DRIVE_DEFAULT_COMPANY',
+        'DRIVE_DEFAULT_WORKSPACE',
+    ),
+}
+
+
+# 기본 인터넷 연결 확인 대상 (UDP connect로 라우팅만 확인, PREDEPLOY_NETCHECK_URL로 HTTP 검사 지정 가능)
+NETWORK_ROUTE_PROBE_ADDR = ('1.1.1.1', 443)
+
+
+# 동시에 실행되는 검사기들이 함께 사용하는 고정 DNS 테이블 (중첩 진입 시 병합)
+_pinned_hosts: Dict[str, list] = {}
+_pinned_depth = 0
+_original_getaddrinfo = socket.getaddrinfo
+
+
+def _pinned_lookup(host, port, family=0, type=0, proto=0, flags=0):
+    """고정 테이블을 우선 사용하는 socket.getaddrinfo 대체 함수"""
+    addrs = _pinned_hosts.get(host.decode() if isinstance(host, bytes) else host)
+    if addrs is None or flags or type not in (0, socket.SOCK_STREAM):
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    
+    try:
+        port = int(port or 0)
+    except ValueError:
+        return _original_getaddrinfo(host, port, family, type, proto, flags)
+    
+    return [
+        (af, socktype, sproto, canonname, (sockaddr[0], port) + tuple(sockaddr[2:]))
+        for af, socktype, sproto, canonname, sockaddr in addrs
+        if family in (0, af)
+    ]
+
+
+@contextmanager
+def _pinned_getaddrinfo(table: Dict[str, list]):
+    """미리 조회한 호스트 → 주소 테이블로 socket.getaddrinfo 응답
+    
+    requests(urllib3)와 asyncio 모두 socket.getaddrinfo를 사용하므로
+    블록 안의 모든 검사가 같은 조회 결과를 공유합니다.
+    테이블에 없는 호스트나 특수 옵션 호출은 원래 함수로 위임합니다.
+    여러 검사기가 동시에 진입해도 마지막 블록이 끝날 때 원래 함수를 복원합니다.
+    """
+    global _pinned_depth, _original_getaddrinfo
+    
+    if _pinned_depth == 0:
+        _original_getaddrinfo = socket.getaddrinfo
+        socket.getaddrinfo = _pinned_lookup
+    _pinned_depth += 1
+    _pinned_hosts.update(table)
+    try:
+        yield
+    finally:
+        _pinned_depth -= 1
+        if _pinned_depth == 0:
+            socket.getaddrinfo = _original_getaddrinfo
+            _pinned_hosts.clear()
+
+
+# docker compose CLI 플러그인 설치 경로 (Docker CLI 탐색 순서)
+COMPOSE_PLUGIN_DIRS = [
+    os.path.join(os.environ.get('DOCKER_CONFIG', os.path.expanduser('~/.docker')), 'cli-plugins'),
+    '/usr/local/lib/docker/cli-plugins',
+    '/usr/local/libexec/docker/cli-plugins',
+    '/usr/lib/docker/cli-plugins',
+    '/usr/libexec/docker/cli-plugins',
+]
+
+
+# 성공한 검사 결과 캐시 (재실행 시 동일 검사 생략)
+CHECK_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'pre_deploy_cache.json')
+CHECK_CACHE_TTL = 30  # 초
+
+
+def cached_check(*env_keys: str, ttl: int = CHECK_CACHE_TTL):
+    """성공 결과를 TTL 동안 캐시하는 검사 데코레이터
+    
+    캐시 키는 (검사 이름, 프로젝트 루트, 환경, 서비스 종류, 관련 환경 변수 값)으로 구성됩니다.
+    실패 결과는 캐시하지 않습니다.
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                key = self._cache_key(func.__name__, env_keys)
+                if key and self._is_cache_fresh(key, ttl):
+                    self.logger.info(f"캐시된 검사 결과 사용: {func.__name__}")
+                    return True
+                result = await func(self, *args, **kwargs)
+                if key and result:
+                    self._cache[key] = time.time()
+                return result
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = self._cache_key(func.__name__, env_keys)
+            if key and self._is_cache_fresh(key, ttl):
+                self.logger.info(f"캐시된 검사 결과 사용: {func.__name__}")
+                return True
+            result = func(self, *args, **kwargs)
+            if key and result:
+                self._cache[key] = time.time()
+            return result
+        return wrapper
+    
+    return decorator
 
 
 class PreDeployChecker:
     """사전 배포 검사"""
     
-    def __init__(self, environment: str, service_kind: str):
+    def __init__(self, environment: str, service_kind: str, use_cache: bool = True):
         self.environment = environment
         self.service_kind = service_kind
+        self.use_cache = use_cache
         self.logger = Logger(f"PreDeployChecker-{environment}-{service_kind}")
-        self.health_checker = HealthChecker()
+        # 모든 HTTP 검사가 공유하는 keep-alive 세션 (동시 실행 검사 수에 맞춘 풀)
+        self._session = create_http_session(pool_size=16)
+        self.health_checker = HealthChecker(session=self._session)
         
         # 프로젝트 루트 디렉토리
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         
+        # 검사별 구조화된 결과 (--json 출력용: 메서드 이름, 성공 여부, 소요 시간 ms)
+        self._results: List[Dict] = []
+        
+        # Docker SDK 클라이언트 (docker 패키지가 있을 때만, 첫 검사에서 생성)
+        self.docker_client = None
+        
+        # 검사 결과 캐시 로드
+        self._cache: Dict[str, float] = self._load_cache() if use_cache else {}
+        
         self.logger.info(f"PreDeployChecker 초기화 완료 (환경: {environment}, 서비스: {service_kind})")
     
-    def run_all_checks(self) -> bool:
-        """모든 사전 배포 검사 실행"""
+    def close(self):
+        """HTTP 세션 및 Docker 클라이언트 정리"""
+        self._session.close()
+        if self.docker_client is not None:
+            self.docker_client.close()
+    
+    def _load_cache(self) -> Dict[str, float]:
+        """검사 결과 캐시 파일 로드 (만료 항목 제외)
+        
+        공용 임시 디렉토리에 있으므로 다른 사용자가 만들었거나
+        그룹/기타 사용자가 쓸 수 있는 캐시 파일은 무시합니다.
+        """
         try:
-            self.logger.info("사전 배포 검사 시작")
-            
-            checks = [
-                ("환경 변수 검증", self.check_environment_variables),
-                ("Docker 환경 검사", self.check_docker_environment),
-                ("디스크 공간 검사", self.check_disk_space),
-                ("네트워크 연결 검사", self.check_network_connectivity),
-                ("서비스 의존성 검사", self.check_service_dependencies),
-                ("데이터베이스 연결 검사", self.check_database_connectivity),
-                ("포트 가용성 검사", self.check_port_availability),
-            ]
-            
-            failed_checks = []
-            
-            for check_name, check_func in checks:
-                try:
-                    self.logger.info(f"실행 중: {check_name}")
-                    if not check_func():
-                        failed_checks.append(check_name)
-                        self.logger.error(f"검사 실패: {check_name}")
-                    else:
-                        self.logger.info(f"검사 성공: {check_name}")
-                except Exception as e:
-                    failed_checks.append(check_name)
-                    self.logger.error(f"검사 중 예외 발생 ({check_name}): {str(e)}")
-            
-            if failed_checks:
-                self.logger.error(f"사전 배포 검사 실패: {', '.join(failed_checks)}")
-                return False
+            with open(CHECK_CACHE_PATH, 'r', encoding='utf-8') as f:
+                st = os.fstat(f.fileno())
+                if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                    return {}
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(cache, dict):
+            return {}
+        
+        now = time.time()
+        return {key: checked_at for key, checked_at in cache.items() if now - checked_at < CHECK_CACHE_TTL}
+    
+    def _save_cache(self):
+        """검사 결과 캐시 파일 저장"""
+        if not self.use_cache:
+            return
+        
+        try:
+            # 함께 실행된 다른 서비스 검사기의 결과를 덮어쓰지 않도록 병합
+            cache = self._load_cache()
+            cache.update(self._cache)
+            # mkstemp는 0600 권한으로 생성하므로 교체 후에도 현재 사용자만 쓸 수 있음
+            fd, tmp_path = tempfile.mkstemp(prefix='.pre_deploy_cache.', dir=os.path.dirname(CHECK_CACHE_PATH))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, CHECK_CACHE_PATH)
+        except OSError as e:
+            self.logger.warning(f"검사 결과 캐시 저장 실패: {str(e)}")
+    
+    def _cache_key(self, check_name: str, env_keys: Tuple[str, ...]) -> Optional[str]:
+        """검사 캐시 키 생성 (캐시 비활성화 시 None)"""
+        if not self.use_cache:
+            return None
+        
+        material = [check_name, os.path.abspath(self.project_root), self.environment, self.service_kind,
+                    [os.environ.get(k) for k in env_keys]]
+        return hashlib.sha256(json.dumps(material).encode('utf-8')).hexdigest()
+    
+    def _is_cache_fresh(self, key: str, ttl: int) -> bool:
+        """캐시된 성공 결과가 TTL 이내인지 확인"""
+        checked_at = self._cache.get(key)
+        return checked_at is not None and time.time() - checked_at < ttl
+    
+    async def run_all_checks(self,
+                             only: Optional[Set[str]] = None,
+                             shared_checks: Optional[Dict[Tuple[str, str], 'asyncio.Task']] = None) -> bool:
+        """모든 사전 배포 검사 실행
+        
+        환경 변수 검증은 .env.runtime을 로드하므로 먼저 실행하고,
+        나머지 I/O 위주 검사는 서로 독립적이므로 동시에 실행합니다.
+        
+        Args:
+            only: 실행할 검사 메서드 이름 (None이면 전체, 환경 변수 검증은 항상 실행)
+            shared_checks: 함께 실행되는 검사기들과 공유할 공통 검사 Task ((검사 이름, 환경) → Task).
+                None이면 이번 실행에서만 쓰는 새 사전을 사용합니다.
+        """
+        if shared_checks is None:
+            shared_checks = {}
+        
+        self.logger.info("사전 배포 검사 시작")
+        
+        # (검사 이름, 검사 함수, 서비스 간 공유 여부)
+        checks = [
+            ("Docker 환경 검사", self.check_docker_environment, True),
+            ("디스크 공간 검사", self.check_disk_space, True),
+            ("네트워크 연결 검사", self.check_network_connectivity, False),  # 프론트엔드는 API 헬스체크 포함
+            ("서비스 의존성 검사", self.check_service_dependencies, False),  # 데이터베이스 연결 포함
+        ]
+        if only:
+            checks = [check for check in checks if check[1].__name__ in only]
+        
+        failed_checks = []
+        
+        check_name = "환경 변수 검증"
+        self.logger.info(f"실행 중: {check_name}")
+        if await self._run_check(check_name, self.check_environment_variables):
+            self.logger.info(f"검사 성공: {check_name}")
+        else:
+            failed_checks.append(check_name)
+        
+        # bind 시도만 하는 즉시 반환 검사라 동시 실행 대상에서 제외
+        if not only or 'check_port_availability' in only:
+            check_name = "포트 가용성 검사"
+            self.logger.info(f"실행 중: {check_name}")
+            started = time.perf_counter()
+            passed = self.check_port_availability()
+            self._record_result(check_name, self.check_port_availability, passed, started)
+            if passed:
+                self.logger.info(f"검사 성공: {check_name}")
             else:
-                self.logger.info("모든 사전 배포 검사 통과")
-                return True
-                
+                failed_checks.append(check_name)
+        
+        for check_name, _, _ in checks:
+            self.logger.info(f"실행 중: {check_name}")
+        
+        # 검사들이 공통으로 사용하는 호스트는 미리 한 번만 DNS 조회
+        dns_table = await self._resolve_hosts(self._collect_probe_hosts())
+        
+        with _pinned_getaddrinfo(dns_table):
+            results = await asyncio.gather(
+                *(self._run_shared_check(check_name, check_func, shared_checks) if shared
+                  else self._run_check(check_name, check_func)
+                  for check_name, check_func, shared in checks)
+            )
+        
+        for (check_name, _, _), passed in zip(checks, results):
+            if passed:
+                self.logger.info(f"검사 성공: {check_name}")
+            else:
+                failed_checks.append(check_name)
+        
+        self._save_cache()
+        
+        if failed_checks:
+            self.logger.error(f"사전 배포 검사 실패: {', '.join(failed_checks)}")
+            return False
+        else:
+            self.logger.info("모든 사전 배포 검사 통과")
+            return True
+    
+    def _collect_probe_hosts(self) -> Set[str]:
+        """검사 대상 URL/DB의 호스트명 수집"""
+        env = os.environ
+        docker_registry = env.get('DOCKER_REGISTRY', 'docker.io')
+        db_host = env.get('DB_HOST')
+        
+        urls = [env.get('PREDEPLOY_NETCHECK_URL'), env.get('API_URL'), env.get('CDN_URL')]
+        if docker_registry != 'docker.io':
+            urls.append(f'https://{docker_registry}')
+        urls.extend(split_csv(env.get('EXTERNAL_APIS', '')))
+        
+        hosts = {urlparse(url).hostname for url in urls if url}
+        if self.service_kind == 'be' and db_host:
+            hosts.add(db_host)
+        
+        hosts.discard(None)
+        return hosts
+    
+    async def _resolve_hosts(self, hosts: Set[str]) -> Dict[str, list]:
+        """호스트별 주소를 동시에 한 번씩 조회 (실패한 호스트는 제외)"""
+        loop = asyncio.get_running_loop()
+        hosts = sorted(hosts)
+        results = await asyncio.gather(
+            *(loop.getaddrinfo(host, None, type=socket.SOCK_STREAM) for host in hosts),
+            return_exceptions=True
+        )
+        
+        table = {host: addrs for host, addrs in zip(hosts, results) if not isinstance(addrs, BaseException)}
+        self.logger.debug(f"DNS 사전 조회: {len(table)}/{len(hosts)}개 호스트")
+        return table
+    
+    def _record_result(self, check_name: str, check_func: Callable, passed: bool, started: float):
+        """검사 결과와 소요 시간을 구조화된 결과 목록에 기록"""
+        self._results.append({
+            'name': check_func.__name__,
+            'title': check_name,
+            'service': self.service_kind,
+            'ok': bool(passed),
+            'ms': round((time.perf_counter() - started) * 1000, 1),
+        })
+    
+    async def _run_check(self, check_name: str, check_func: Callable) -> bool:
+        """단일 검사 실행 후 결과 기록"""
+        started = time.perf_counter()
+        passed = await self._invoke_check(check_name, check_func)
+        self._record_result(check_name, check_func, passed, started)
+        return passed
+    
+    async def _invoke_check(self, check_name: str, check_func: Callable) -> bool:
+        """검사 함수 호출 (동기 검사는 스레드에서 실행, 예외는 검사 실패로 처리)"""
+        try:
+            if asyncio.iscoroutinefunction(check_func):
+                passed = await check_func()
+            else:
+                passed = await asyncio.to_thread(check_func)
         except Exception as e:
-            self.logger.error(f"사전 배포 검사 중 예외 발생: {str(e)}")
+            # 예상하지 못한 예외는 검사 실패로 기록 (다른 검사는 계속 진행)
+            self.logger.error(f"검사 중 예외 발생 ({check_name}): {type(e).__name__}: {str(e)}")
             return False
+        
+        if not passed:
+            self.logger.error(f"검사 실패: {check_name}")
+        return passed
+    
+    async def _run_shared_check(self,
+                                check_name: str,
+                                check_func: Callable,
+                                shared_checks: Dict[Tuple[str, str], 'asyncio.Task']) -> bool:
+        """서비스와 무관한 검사를 같은 환경의 검사기들 사이에서 한 번만 실행"""
+        started = time.perf_counter()
+        key = (check_name, self.environment)
+        task = shared_checks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._invoke_check(check_name, check_func))
+            shared_checks[key] = task
+        else:
+            self.logger.info(f"다른 서비스와 검사 결과 공유: {check_name}")
+        
+        # 공유한 검사기마다 결과를 기록 (소요 시간은 결과를 기다린 시간)
+        passed = await task
+        self._record_result(check_name, check_func, passed, started)
+        return passed
     
     def check_environment_variables(self) -> bool:
         """환경 변수 검증"""
         try:
-            # 기본 필수 환경 변수
-            required_vars = [
-                'ENVIRONMENT',
-                'SERVICE_KIND',
-                'DOCKER_REGISTRY',
-            ]
-            
-            # 서비스별 추가 필수 변수
-            if self.service_kind == 'fe':
-                required_vars.extend([
-                    'NODE_ENV',
-                    'API_URL',
-                ])
-            elif self.service_kind == 'be':
-                required_vars.extend([
-                    'DRIVE_DEFAULT_COMPANY',
-                    'DRIVE_DEFAULT_WORKSPACE',
-                ])
+            # 기본 필수 환경 변수 + 서비스별 추가 필수 변수
+            required_vars = REQUIRED_ENV_VARS + REQUIRED_ENV_VARS_BY_KIND.get(self.service_kind, ())
             
             # .env.runtime 파일에서 환경 변수 로드
             env_runtime_path = os.path.join(self.project_root, '.env.runtime')
             if os.path.exists(env_runtime_path):
-                env_vars = load_env_file(env_runtime_path)
+                # 파일이 바뀌지 않았으면 같은 프로세스의 파싱 결과 재사용 (디스크에는 남기지 않음)
+                env_vars = load_env_file_cached(env_runtime_path)
                 
-                # 환경 변수를 현재 프로세스에 설정
-                for key, value in env_vars.items():
-                    os.environ[key] = value
+                # 환경 변수를 현재 프로세스에 일괄 설정
+                os.environ.update(env_vars)
                 
                 self.logger.info(f".env.runtime에서 {len(env_vars)}개 환경 변수 로드")
             else:
@@ -108,36 +426,29 @@ class PreDeployChecker:
             # 필수 환경 변수 검증
             return validate_environment_variables(required_vars)
             
-        except Exception as e:
+        except (OSError, ValueError) as e:
             self.logger.error(f"환경 변수 검증 실패: {str(e)}")
             return False
     
     def check_docker_environment(self) -> bool:
         """Docker 환경 검사"""
+        if docker is not None:
+            result = self._check_docker_sdk()
+            if result is not None:
+                return result
+        
         try:
-            # Docker 데몬 실행 상태 확인
+            # 데몬/Compose 확인을 한 번의 프로세스 실행으로 처리
             result = subprocess.run(
-                ['docker', 'info'],
+                ['sh', '-c', 'docker info >/dev/null && docker compose version >/dev/null'],
                 capture_output=True,
                 text=True,
-                timeout=10
+                timeout=15
             )
             
             if result.returncode != 0:
-                self.logger.error("Docker 데몬이 실행되지 않았습니다.")
-                return False
-            
-            # Docker Compose 설치 확인
-            result = subprocess.run(
-                ['docker', 'compose', 'version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
-                self.logger.error("Docker Compose가 설치되지 않았습니다.")
-                return False
+                # 실패한 경우에만 개별 실행으로 원인 파악
+                return self._diagnose_docker_environment()
             
             self.logger.info("Docker 환경 검사 통과")
             return True
@@ -145,141 +456,224 @@ class PreDeployChecker:
         except subprocess.TimeoutExpired:
             self.logger.error("Docker 명령 실행 시간 초과")
             return False
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"Docker 환경 검사 실패: {str(e)}")
             return False
     
+    def _check_docker_sdk(self) -> Optional[bool]:
+        """Docker SDK로 데몬 소켓에 직접 ping (CLI 프로세스 실행 없음)
+        
+        Returns:
+            검사 결과, Compose 플러그인 위치를 확인할 수 없으면 None (CLI 검사로 대체)
+        """
+        try:
+            if self.docker_client is None:
+                self.docker_client = docker.from_env(timeout=10)
+            self.docker_client.ping()
+        except docker.errors.DockerException as e:
+            self.logger.error(f"Docker 데몬이 실행되지 않았습니다: {str(e)}")
+            return False
+        
+        # Docker Compose 플러그인 설치 확인
+        if not any(os.path.exists(os.path.join(path, 'docker-compose')) for path in COMPOSE_PLUGIN_DIRS):
+            self.logger.debug("Docker Compose 플러그인 경로를 찾을 수 없음, CLI로 확인")
+            return None
+        
+        self.logger.info("Docker 환경 검사 통과")
+        return True
+    
+    def _diagnose_docker_environment(self) -> bool:
+        """Docker 데몬/Compose를 개별 확인하여 실패 원인 기록"""
+        # Docker 데몬 실행 상태 확인
+        result = subprocess.run(
+            ['docker', 'info'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode != 0:
+            self.logger.error("Docker 데몬이 실행되지 않았습니다.")
+            return False
+        
+        # Docker Compose 설치 확인
+        result = subprocess.run(
+            ['docker', 'compose', 'version'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode != 0:
+            self.logger.error("Docker Compose가 설치되지 않았습니다.")
+            return False
+        
+        # 개별 실행은 성공한 경우 (일시적 실패)
+        self.logger.info("Docker 환경 검사 통과")
+        return True
+    
+    @cached_check()
     def check_disk_space(self, min_free_gb: float = 5.0) -> bool:
-        """디스크 공간 검사"""
+        """디스크 공간 검사 (프로젝트 디렉토리 및 Docker 데이터 디렉토리)"""
         try:
-            # 현재 디렉토리의 디스크 사용량 확인
-            statvfs = os.statvfs(self.project_root)
-            
-            # 사용 가능한 공간 계산 (GB)
-            free_bytes = statvfs.f_frsize * statvfs.f_bavail
-            free_gb = free_bytes / (1024 ** 3)
+            # 이미지 pull은 Docker 데이터 디렉토리를 사용하므로 다른 파티션이면 함께 확인
+            paths = [self.project_root]
+            if os.path.isdir(DOCKER_DATA_ROOT) and os.stat(DOCKER_DATA_ROOT).st_dev != os.stat(self.project_root).st_dev:
+                paths.append(DOCKER_DATA_ROOT)
+            
+            all_sufficient = True
+            for path in paths:
+                statvfs = os.statvfs(path)
+                
+                # 사용 가능한 공간 계산 (GB)
+                free_bytes = statvfs.f_frsize * statvfs.f_bavail
+                free_gb = free_bytes / (1 << 30)
+                
+                if free_gb < min_free_gb:
+                    self.logger.error(f"디스크 공간 부족 ({path}): {free_gb:.2f}GB (최소 {min_free_gb}GB 필요)")
+                    all_sufficient = False
+                else:
+                    self.logger.info(f"디스크 공간 충분 ({path}): {free_gb:.2f}GB 사용 가능")
             
-            if free_gb < min_free_gb:
-                self.logger.error(f"디스크 공간 부족: {free_gb:.2f}GB (최소 {min_free_gb}GB 필요)")
-                return False
+            return all_sufficient
             
-            self.logger.info(f"디스크 공간 충분: {free_gb:.2f}GB 사용 가능")
-            return True
-            
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"디스크 공간 검사 실패: {str(e)}")
             return False
     
+    @cached_check('DOCKER_REGISTRY', 'API_URL', 'PREDEPLOY_NETCHECK_URL')
     def check_network_connectivity(self) -> bool:
         """네트워크 연결 검사"""
-        try:
-            # 기본 연결 확인할 URL들
-            test_urls = [
-                'https://httpbin.org/status/200',  # 기본 인터넷 연결
-            ]
-            
-            # Docker 레지스트리 연결 확인
-            docker_registry = os.environ.get('DOCKER_REGISTRY', 'docker.io')
-            if docker_registry != 'docker.io':
-                test_urls.append(f'https://{docker_registry}')
-            
-            # API URL 연결 확인 (프론트엔드인 경우)
-            if self.service_kind == 'fe':
-                api_url = os.environ.get('API_URL')
-                if api_url:
-                    # 헬스체크 엔드포인트가 있다면 확인
-                    health_url = f"{api_url.rstrip('/')}/health"
-                    test_urls.append(health_url)
-            
-            # 모든 URL 연결 테스트
-            all_connected = True
-            for url in test_urls:
-                try:
-                    if not self.health_checker.check_url(url, timeout=10):
-                        all_connected = False
-                except Exception as e:
-                    self.logger.warning(f"네트워크 연결 테스트 실패 ({url}): {str(e)}")
-                    # 일부 URL 실패는 경고로만 처리
-            
-            if all_connected:
-                self.logger.info("네트워크 연결 검사 통과")
-            else:
-                self.logger.warning("일부 네트워크 연결 실패 (배포 계속 진행)")
-            
-            return True  # 네트워크 연결 실패는 배포를 중단하지 않음
-            
-        except Exception as e:
-            self.logger.error(f"네트워크 연결 검사 실패: {str(e)}")
-            return False
+        env = os.environ
+        netcheck_url = env.get('PREDEPLOY_NETCHECK_URL')
+        docker_registry = env.get('DOCKER_REGISTRY', 'docker.io')
+        api_url = env.get('API_URL')
+        
+        all_connected = True
+        test_urls = []
+        
+        # 기본 인터넷 연결 확인 (URL 지정 시 HTTP, 아니면 라우팅 가능 여부만 확인)
+        if netcheck_url:
+            test_urls.append(netcheck_url)
+        elif not self._has_outbound_route():
+            self.logger.warning(f"외부 네트워크 경로 없음: {NETWORK_ROUTE_PROBE_ADDR[0]}")
+            all_connected = False
+        
+        # Docker 레지스트리 연결 확인
+        if docker_registry != 'docker.io':
+            test_urls.append(f'https://{docker_registry}')
+        
+        # API URL 연결 확인 (프론트엔드인 경우, 헬스체크 엔드포인트)
+        if self.service_kind == 'fe' and api_url:
+            test_urls.append(f"{api_url.rstrip('/')}/health")
+        
+        # 모든 URL 연결 테스트 (동시에 HEAD 요청)
+        if test_urls:
+            with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+                results = list(executor.map(
+                    lambda url: self.health_checker.check_url(url, timeout=10, method='HEAD'),
+                    test_urls
+                ))
+            if not all(results):
+                all_connected = False
+        
+        if all_connected:
+            self.logger.info("네트워크 연결 검사 통과")
+        else:
+            self.logger.warning("일부 네트워크 연결 실패 (배포 계속 진행)")
+        
+        return True  # 네트워크 연결 실패는 배포를 중단하지 않음
     
-    def check_service_dependencies(self) -> bool:
-        """서비스 의존성 검사"""
+    def _has_outbound_route(self) -> bool:
+        """UDP connect로 외부 라우팅 가능 여부 확인 (패킷 전송 없음)"""
         try:
-            # 서비스별 의존성 확인
-            if self.service_kind == 'be':
-                # 백엔드 서비스 의존성
-                return self._check_backend_dependencies()
-            elif self.service_kind == 'fe':
-                # 프론트엔드 서비스 의존성
-                return self._check_frontend_dependencies()
-            else:
-                self.logger.info("알 수 없는 서비스 종류, 의존성 검사 건너뜀")
-                return True
-                
-        except Exception as e:
-            self.logger.error(f"서비스 의존성 검사 실패: {str(e)}")
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.connect(NETWORK_ROUTE_PROBE_ADDR)
+                local_ip = sock.getsockname()[0]
+        except OSError:
             return False
+        
+        self.logger.debug(f"외부 네트워크 경로 확인 (로컬 주소: {local_ip})")
+        return True
     
-    def _check_backend_dependencies(self) -> bool:
-        """백엔드 서비스 의존성 검사"""
-        try:
-            # 데이터베이스 연결 확인은 별도 메서드에서 처리
-            # 여기서는 기타 백엔드 의존성 확인
-            
-            # Redis 연결 확인 (있는 경우)
-            redis_url = os.environ.get('REDIS_URL')
-            if redis_url:
-                # Redis 연결 테스트는 실제 구현에서 추가
-                self.logger.info("Redis 연결 확인 (구현 필요)")
-            
-            # 외부 API 의존성 확인
-            external_apis = os.environ.get('EXTERNAL_APIS', '').split(',')
-            for api_url in external_apis:
-                if api_url.strip():
-                    if not self.health_checker.check_url(api_url.strip(), timeout=5):
-                        self.logger.warning(f"외부 API 연결 실패: {api_url}")
-            
+    @cached_check('API_URL', 'CDN_URL', 'REDIS_URL', 'EXTERNAL_APIS', 'DB_HOST', 'DB_PORT')
+    async def check_service_dependencies(self) -> bool:
+        """서비스 의존성 검사 (백엔드는 데이터베이스 연결 검사 포함)"""
+        # 서비스별 의존성 확인
+        if self.service_kind == 'be':
+            # 백엔드 서비스 의존성
+            return await self._check_backend_dependencies()
+        elif self.service_kind == 'fe':
+            # 프론트엔드 서비스 의존성
+            return await asyncio.to_thread(self._check_frontend_dependencies)
+        else:
+            self.logger.info("알 수 없는 서비스 종류, 의존성 검사 건너뜀")
             return True
-            
-        except Exception as e:
-            self.logger.error(f"백엔드 의존성 검사 실패: {str(e)}")
-            return False
+    
+    async def _check_backend_dependencies(self) -> bool:
+        """백엔드 서비스 의존성 검사
+        
+        데이터베이스 포트 확인과 외부 API 확인을 함께 실행합니다.
+        외부 API 실패는 경고로만 처리하고, 결과는 데이터베이스 연결 여부를 따릅니다.
+        """
+        env = os.environ
+        redis_url = env.get('REDIS_URL')
+        external_apis = split_csv(env.get('EXTERNAL_APIS', ''))
+        
+        # Redis 연결 확인 (있는 경우)
+        if redis_url:
+            # Redis 연결 테스트는 실제 구현에서 추가
+            self.logger.info("Redis 연결 확인 (구현 필요)")
+        
+        # 외부 API 의존성 확인
+        
+        db_connected, *api_results = await asyncio.gather(
+            self._probe_database(),
+            *(asyncio.to_thread(self.health_checker.check_url, api_url, 5, method='HEAD') for api_url in external_apis)
+        )
+        
+        for api_url, connected in zip(external_apis, api_results):
+            if not connected:
+                self.logger.warning(f"외부 API 연결 실패: {api_url}")
+        
+        return db_connected
     
     def _check_frontend_dependencies(self) -> bool:
         """프론트엔드 서비스 의존성 검사"""
+        env = os.environ
+        api_url = env.get('API_URL')
+        cdn_url = env.get('CDN_URL')
+        
+        # API 서버 연결 확인
+        if api_url:
+            health_url = f"{api_url.rstrip('/')}/health"
+            if not self.health_checker.check_url(health_url, timeout=10, method='HEAD'):
+                self.logger.warning(f"API 서버 연결 실패: {health_url}")
+                # 프론트엔드는 API 서버 연결 실패해도 배포 진행
+        
+        # CDN 연결 확인 (있는 경우)
+        if cdn_url:
+            if not self.health_checker.check_url(cdn_url, timeout=5, method='HEAD'):
+                self.logger.warning(f"CDN 연결 실패: {cdn_url}")
+        
+        return True
+    
+    async def _probe_tcp(self, host: str, port: int, timeout: float) -> bool:
+        """TCP 연결 가능 여부 확인 (이벤트 루프를 막지 않음)"""
         try:
-            # API 서버 연결 확인
-            api_url = os.environ.get('API_URL')
-            if api_url:
-                health_url = f"{api_url.rstrip('/')}/health"
-                if not self.health_checker.check_url(health_url, timeout=10):
-                    self.logger.warning(f"API 서버 연결 실패: {health_url}")
-                    # 프론트엔드는 API 서버 연결 실패해도 배포 진행
-            
-            # CDN 연결 확인 (있는 경우)
-            cdn_url = os.environ.get('CDN_URL')
-            if cdn_url:
-                if not self.health_checker.check_url(cdn_url, timeout=5):
-                    self.logger.warning(f"CDN 연결 실패: {cdn_url}")
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"프론트엔드 의존성 검사 실패: {str(e)}")
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (OSError, asyncio.TimeoutError):
             return False
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return True
     
-    def check_database_connectivity(self) -> bool:
-        """데이터베이스 연결 검사"""
+    async def _probe_database(self) -> bool:
+        """데이터베이스 포트 연결 확인 (서비스 의존성 검사에서 사용)"""
         try:
             # 백엔드 서비스만 데이터베이스 연결 확인
             if self.service_kind != 'be':
@@ -294,121 +688,178 @@ class PreDeployChecker:
                 return True  # 데이터베이스가 필수가 아닐 수 있음
             
             # 간단한 포트 연결 테스트
-            import socket
+            if await self._probe_tcp(db_host, int(db_port), timeout=5):
+                self.logger.info(f"데이터베이스 연결 성공: {db_host}:{db_port}")
+                return True
             
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex((db_host, int(db_port)))
-                sock.close()
-                
-                if result == 0:
-                    self.logger.info(f"데이터베이스 연결 성공: {db_host}:{db_port}")
-                    return True
-                else:
-                    self.logger.error(f"데이터베이스 연결 실패: {db_host}:{db_port}")
-                    return False
-                    
-            except Exception as e:
-                self.logger.error(f"데이터베이스 연결 테스트 실패: {str(e)}")
-                return False
+            self.logger.error(f"데이터베이스 연결 실패: {db_host}:{db_port}")
+            return False
                 
-        except Exception as e:
-            self.logger.error(f"데이터베이스 연결 검사 실패: {str(e)}")
+        except ValueError as e:
+            self.logger.error(f"데이터베이스 연결 검사 실패 (잘못된 DB_PORT): {str(e)}")
             return False
     
+    @staticmethod
+    def _is_port_in_use(port: int) -> bool:
+        """IPv4/IPv6 와일드카드 주소에 bind를 시도해 포트 점유 여부 확인"""
+        for family, addr in ((socket.AF_INET, '0.0.0.0'), (socket.AF_INET6, '::')):
+            try:
+                sock = socket.socket(family, socket.SOCK_STREAM)
+            except OSError:
+                continue  # 해당 주소 체계를 지원하지 않는 호스트
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 0)
+                if family == socket.AF_INET6:
+                    sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+                sock.bind((addr, port))
+            except OSError as e:
+                if e.errno == errno.EADDRINUSE:
+                    return True
+            finally:
+                sock.close()
+        return False
+    
     def check_port_availability(self) -> bool:
         """포트 가용성 검사"""
         try:
             # 서비스에서 사용할 포트 확인
             service_port = os.environ.get('PORT', '3000' if self.service_kind == 'fe' else '8000')
             
-            import socket
-            
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', int(service_port)))
-                sock.close()
-                
-                if result == 0:
-                    self.logger.warning(f"포트 {service_port}가 이미 사용 중입니다.")
-                    # 포트가 사용 중이어도 Docker Compose가 처리할 수 있으므로 경고만
-                    return True
-                else:
-                    self.logger.info(f"포트 {service_port} 사용 가능")
-                    return True
-                    
-            except Exception as e:
-                self.logger.warning(f"포트 가용성 검사 실패: {str(e)}")
-                return True  # 포트 검사 실패는 배포를 중단하지 않음
+            if self._is_port_in_use(int(service_port)):
+                self.logger.warning(f"포트 {service_port}가 이미 사용 중입니다.")
+                # 포트가 사용 중이어도 Docker Compose가 처리할 수 있으므로 경고만
+            else:
+                self.logger.info(f"포트 {service_port} 사용 가능")
+            return True
                 
-        except Exception as e:
-            self.logger.error(f"포트 가용성 검사 실패: {str(e)}")
-            return False
+        except ValueError as e:
+            self.logger.warning(f"포트 가용성 검사 실패 (잘못된 PORT): {str(e)}")
+            return True  # 포트 검사 실패는 배포를 중단하지 않음
+    
+    def _detect_migration_commands(self) -> List[List[str]]:
+        """프로젝트 파일 구성으로 마이그레이션 명령 결정 (판별 불가 시 모든 후보 반환)"""
+        # 마이그레이션 명령어 (프로젝트에 따라 다름)
+        candidates = {
+            # Django
+            'django': ['python', 'manage.py', 'migrate'],
+            # Rails
+            'rails': ['rails', 'db:migrate'],
+            # Node.js (Sequelize)
+            'sequelize': ['npx', 'sequelize-cli', 'db:migrate'],
+            # Node.js (Prisma)
+            'prisma': ['npx', 'prisma', 'migrate', 'deploy'],
+        }
+        
+        try:
+            entries = set(os.listdir(self.project_root))
+        except OSError:
+            entries = set()
+        
+        if 'manage.py' in entries:
+            return [candidates['django']]
+        if 'Gemfile' in entries:
+            return [candidates['rails']]
+        if 'package.json' in entries:
+            try:
+                with open(os.path.join(self.project_root, 'package.json'), 'r', encoding='utf-8') as f:
+                    package = json.load(f)
+                dependencies = {**package.get('dependencies', {}), **package.get('devDependencies', {})}
+            except (OSError, ValueError, AttributeError):
+                dependencies = {}
+            
+            if 'prisma' in dependencies or '@prisma/client' in dependencies or 'prisma' in entries:
+                return [candidates['prisma']]
+            if 'sequelize-cli' in dependencies or 'sequelize' in dependencies or '.sequelizerc' in entries:
+                return [candidates['sequelize']]
+        
+        return list(candidates.values())
     
     def run_database_migrations(self) -> bool:
         """데이터베이스 마이그레이션 실행"""
-        try:
-            # 백엔드 서비스만 마이그레이션 실행
-            if self.service_kind != 'be':
-                self.logger.info("프론트엔드 서비스, 마이그레이션 건너뜀")
-                return True
-            
-            # 마이그레이션 명령어 (프로젝트에 따라 다름)
-            migration_commands = [
-                # Django
-                ['python', 'manage.py', 'migrate'],
-                # Rails
-                ['rails', 'db:migrate'],
-                # Node.js (Sequelize)
-                ['npx', 'sequelize-cli', 'db:migrate'],
-                # Node.js (Prisma)
-                ['npx', 'prisma', 'migrate', 'deploy'],
-            ]
-            
-            # 환경 변수로 마이그레이션 명령어 지정 가능
-            custom_migration = os.environ.get('MIGRATION_COMMAND')
-            if custom_migration:
-                migration_commands = [custom_migration.split()]
+        # 백엔드 서비스만 마이그레이션 실행
+        if self.service_kind != 'be':
+            self.logger.info("프론트엔드 서비스, 마이그레이션 건너뜀")
+            return True
+        
+        # 환경 변수로 마이그레이션 명령어 지정 가능
+        custom_migration = os.environ.get('MIGRATION_COMMAND')
+        if custom_migration:
+            migration_commands = [custom_migration.split()]
+        else:
+            migration_commands = self._detect_migration_commands()
+        
+        # 마이그레이션 실행
+        for cmd in migration_commands:
+            # 실행 파일이 없으면 프로세스 생성 없이 다음 명령으로
+            if shutil.which(cmd[0]) is None:
+                self.logger.debug(f"마이그레이션 명령을 찾을 수 없음: {cmd[0]}")
+                continue
             
-            # 마이그레이션 실행
-            for cmd in migration_commands:
-                try:
-                    self.logger.info(f"마이그레이션 시도: {' '.join(cmd)}")
-                    
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=300,  # 5분 타임아웃
-                        cwd=self.project_root
-                    )
-                    
-                    if result.returncode == 0:
-                        self.logger.info("데이터베이스 마이그레이션 성공")
-                        return True
-                    else:
-                        self.logger.debug(f"마이그레이션 명령 실패: {' '.join(cmd)}")
-                        continue
-                        
-                except subprocess.TimeoutExpired:
-                    self.logger.error("마이그레이션 시간 초과")
-                    return False
-                except FileNotFoundError:
-                    # 명령어가 없으면 다음 시도
-                    continue
-                except Exception as e:
-                    self.logger.warning(f"마이그레이션 명령 실행 실패: {str(e)}")
+            try:
+                self.logger.info(f"마이그레이션 시도: {' '.join(cmd)}")
+                
+                # 타임아웃 시 자식 프로세스까지 정리 (npx 등)
+                result = run_bounded(
+                    cmd,
+                    timeout=300,  # 5분 타임아웃
+                    cwd=self.project_root
+                )
+                
+                if result.returncode == 0:
+                    self.logger.info("데이터베이스 마이그레이션 성공")
+                    return True
+                else:
+                    self.logger.debug(f"마이그레이션 명령 실패: {' '.join(cmd)}")
                     continue
-            
-            # 모든 마이그레이션 명령이 실패한 경우
-            self.logger.warning("마이그레이션 명령을 찾을 수 없습니다. 수동 확인 필요")
-            return True  # 마이그레이션 실패가 배포를 중단하지 않도록
-            
-        except Exception as e:
-            self.logger.error(f"데이터베이스 마이그레이션 실패: {str(e)}")
-            return False
+                    
+            except subprocess.TimeoutExpired:
+                self.logger.error("마이그레이션 시간 초과")
+                return False
+            except OSError as e:
+                # 실행할 수 없는 명령이면 다음 시도
+                self.logger.warning(f"마이그레이션 명령 실행 실패: {str(e)}")
+                continue
+        
+        # 모든 마이그레이션 명령이 실패한 경우
+        self.logger.warning("마이그레이션 명령을 찾을 수 없습니다. 수동 확인 필요")
+        return True  # 마이그레이션 실패가 배포를 중단하지 않도록
+
+
+# --only로 선택할 수 있는 검사 메서드 이름
+CHECK_NAMES = (
+    'check_environment_variables',
+    'check_port_availability',
+    'check_docker_environment',
+    'check_disk_space',
+    'check_network_connectivity',
+    'check_service_dependencies',
+)
+
+
+async def run_service_checks(checkers: List[PreDeployChecker], only: Optional[Set[str]] = None) -> bool:
+    """여러 서비스의 사전 배포 검사를 동시에 실행 (Docker/디스크 검사는 한 번만 수행)"""
+    # 공통 검사 Task는 이번 호출(이벤트 루프) 안에서만 공유
+    shared_checks: Dict[Tuple[str, str], asyncio.Task] = {}
+    results = await asyncio.gather(*(checker.run_all_checks(only, shared_checks) for checker in checkers))
+    return all(results)
+
+
+def _parse_service_kinds(value: str) -> List[str]:
+    """쉼표로 구분된 서비스 종류 파싱 (예: fe,be)"""
+    kinds = list(dict.fromkeys(kind.strip() for kind in value.split(',') if kind.strip()))
+    invalid = [kind for kind in kinds if kind not in ('fe', 'be')]
+    if not kinds or invalid:
+        raise argparse.ArgumentTypeError(f"잘못된 서비스 종류: {value} (fe, be 또는 fe,be)")
+    return kinds
+
+
+def _parse_check_names(value: str) -> Set[str]:
+    """쉼표로 구분된 검사 메서드 이름 파싱 (예: check_network_connectivity)"""
+    names = set(split_csv(value))
+    invalid = sorted(names.difference(CHECK_NAMES))
+    if not names or invalid:
+        raise argparse.ArgumentTypeError(f"알 수 없는 검사: {', '.join(invalid) or value} (선택 가능: {', '.join(CHECK_NAMES)})")
+    return names
 
 
 def main():
@@ -422,8 +873,8 @@ def main():
     
     parser.add_argument(
         'service_kind',
-        choices=['fe', 'be'],
-        help='서비스 종류 (fe: 프론트엔드, be: 백엔드)'
+        type=_parse_service_kinds,
+        help='서비스 종류 (fe: 프론트엔드, be: 백엔드, 모노레포는 fe,be)'
     )
     
     parser.add_argument(
@@ -438,6 +889,26 @@ def main():
         help='네트워크 연결 검사 건너뛰기'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'검사 결과 캐시 사용 안 함 (기본: 성공 결과를 {CHECK_CACHE_TTL}초간 재사용)'
+    )
+    
+    parser.add_argument(
+        '--only',
+        type=_parse_check_names,
+        help='지정한 검사만 실행 (쉼표 구분 메서드 이름, 예: check_network_connectivity). '
+             '환경 변수 검증은 .env.runtime 로드를 위해 항상 실행하며 마이그레이션은 건너뜀'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='종료 시 전체 성공 여부와 검사별 결과를 JSON 한 줄로 stdout에 출력 '
+             '({"ok", "checks": [{"name", "ok", "ms", ...}]}, 로그와 안내 메시지는 stderr로 출력)'
+    )
+    
     parser.add_argument(
         '--use-hooks',
         action='store_true',
@@ -448,20 +919,28 @@ def main():
     
     # 환경 변수 설정
     os.environ['ENVIRONMENT'] = args.environment
-    os.environ['SERVICE_KIND'] = args.service_kind
+    os.environ['SERVICE_KIND'] = ','.join(args.service_kind)
+    
+    # --json이면 stdout에는 JSON만 출력 (이후 생성되는 로거와 안내 메시지는 stderr로)
+    json_stdout = sys.stdout
+    if args.json:
+        sys.stdout = sys.stderr
     
     # 로거 초기화
     logger = Logger("pre_deploy")
+    checkers = []
+    succeeded = False
     
     try:
         # 새로운 훅 시스템 사용
         if args.use_hooks:
             try:
                 from deploy_hooks import run_pre_deploy_hooks
-                success = run_pre_deploy_hooks(args.environment, args.service_kind)
+                success = all(run_pre_deploy_hooks(args.environment, kind) for kind in args.service_kind)
                 
                 if success:
                     logger.info("Pre-deploy 훅 시스템 완료")
+                    succeeded = True
                     print("SUCCESS: Pre-deployment hooks passed")
                 else:
                     logger.error("Pre-deploy 훅 시스템 실패")
@@ -473,27 +952,40 @@ def main():
         
         # 기본 시스템 사용
         if not args.use_hooks:
-            # PreDeployChecker 초기화
-            checker = PreDeployChecker(args.environment, args.service_kind)
+            # 서비스별 PreDeployChecker 초기화
+            checkers = [
+                PreDeployChecker(args.environment, kind, use_cache=not args.no_cache)
+                for kind in args.service_kind
+            ]
             
             # 사전 배포 검사 실행
-            if not checker.run_all_checks():
+            if not asyncio.run(run_service_checks(checkers, args.only)):
                 logger.error("사전 배포 검사 실패")
                 sys.exit(1)
             
             # 데이터베이스 마이그레이션 실행
-            if not args.skip_migrations:
-                if not checker.run_database_migrations():
+            if not args.skip_migrations and not args.only:
+                if not all(checker.run_database_migrations() for checker in checkers):
                     logger.error("데이터베이스 마이그레이션 실패")
                     sys.exit(1)
             
             logger.info("사전 배포 검사 완료")
+            succeeded = True
             print("SUCCESS: Pre-deployment checks passed")
         
     except Exception as e:
         logger.error(f"사전 배포 검사 중 예외 발생: {str(e)}")
         print(f"ERROR: {str(e)}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        for checker in checkers:
+            checker.close()
+        
+        if args.json:
+            # ok는 개별 검사가 아니라 실제 종료 상태 기준 (훅/마이그레이션 실패, 예외 포함)
+            sys.stdout = json_stdout
+            results = [result for checker in checkers for result in checker._results]
+            print(json.dumps({'ok': succeeded, 'checks': results}, ensure_ascii=False))
 
 
 if __name__ == "__main__":
@@ -5,23 +5,50 @@ RELEASES 디렉토리에 배포 정보를 기록하고 관리합니다.
 """
 
 import os
+import re
 import sys
-import json
-from typing import Dict, List, Optional
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 # 현재 스크립트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils import Logger, get_current_timestamp
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from utils import Logger, get_current_timestamp, json_dumps, json_loads
+
+
+# 배포 기록 파일명 형식: {YYYYmmdd-HHMMSS}-{service_kind}-{environment}.json
+DEPLOYMENT_FILE_PATTERN = re.compile(r'^(\d{8}-\d{6})-([^-]+)-(.+)\.json$')
+
+# 인덱스 파일에 기록하는 필터/정렬용 필드
+INDEX_FIELDS = ('deployment_id', 'timestamp', 'service_kind', 'environment', 'status')
+
+# 인덱스 줄 수가 배포 수의 이 배수를 넘으면 배포당 한 줄로 압축
+INDEX_COMPACT_RATIO = 2
+
+# 오래된 기록 삭제 시 동시에 실행할 최대 unlink 수
+CLEANUP_UNLINK_WORKERS = 16
+
+# SHA256 이미지 다이제스트 형식
+DIGEST_PATTERN = re.compile(r'sha256:[0-9a-fA-F]{64}\Z')
 
 
 class ReleaseManager:
     """릴리스 및 배포 히스토리 관리"""
     
-    def __init__(self):
+    def __init__(self, timestamp_fn: Optional[Callable[[], str]] = None):
         self.logger = Logger("ReleaseManager")
         
+        # 배포 ID/내보내기 파일명용 타임스탬프 함수 (테스트에서 고정 값 주입 가능)
+        self.timestamp_fn = timestamp_fn or get_current_timestamp
+        
         # 프로젝트 루트 및 RELEASES 디렉토리
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.releases_dir = os.path.join(self.project_root, 'RELEASES')
@@ -29,8 +56,31 @@ class ReleaseManager:
         # RELEASES 디렉토리 생성
         os.makedirs(self.releases_dir, exist_ok=True)
         
+        # 파싱된 배포 기록 캐시 (파일 경로 → (mtime_ns, 크기, 기록))
+        self._record_cache: Dict[str, Tuple[int, int, Dict]] = {}
+        
         self.logger.info(f"ReleaseManager 초기화 완료 (RELEASES: {self.releases_dir})")
     
+    @property
+    def index_file(self) -> str:
+        """배포 메타데이터 인덱스 파일 경로 (배포 기록이 저장/수정될 때마다 한 줄씩 추가, 마지막 줄 우선)"""
+        return os.path.join(self.releases_dir, 'index.jsonl')
+    
+    @contextmanager
+    def _index_lock(self):
+        """인덱스 추가/재작성 잠금 (다른 프로세스의 추가 줄이 재작성으로 사라지지 않도록)"""
+        try:
+            lock_file = open(f"{self.index_file}.lock", 'w')
+        except OSError as e:
+            self.logger.warning(f"배포 인덱스 잠금 파일을 열 수 없습니다: {str(e)}")
+            yield
+            return
+        
+        with lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+    
     def create_deployment_record(self,
                                source_repo: str,
                                ref: str,
@@ -43,7 +93,7 @@ class ReleaseManager:
         """배포 기록 생성"""
         try:
             # 배포 ID 생성 (타임스탬프 기반)
-            timestamp = get_current_timestamp()
+            timestamp = self.timestamp_fn()
             deployment_id = f"{timestamp}-{service_kind}-{environment}"
             
             # 배포 기록 데이터
@@ -67,8 +117,7 @@ class ReleaseManager:
             record_file = os.path.join(self.releases_dir, f"{deployment_id}.json")
             
             # 파일 저장
-            with open(record_file, 'w', encoding='utf-8') as f:
-                json.dump(deployment_record, f, indent=2, ensure_ascii=False)
+            self._write_record(record_file, deployment_record)
             
             self.logger.info(f"배포 기록 생성: {deployment_id}")
             return deployment_id
@@ -77,6 +126,182 @@ class ReleaseManager:
             self.logger.error(f"배포 기록 생성 실패: {str(e)}")
             raise
     
+    def _read_record(self, record_file: str, stat: Optional[os.stat_result] = None) -> Dict:
+        """배포 기록 파일 로드 (mtime/크기가 같으면 이전 파싱 결과 재사용)"""
+        if stat is None:
+            stat = os.stat(record_file)
+        
+        cached = self._record_cache.get(record_file)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return dict(cached[2])
+        
+        with open(record_file, 'rb') as f:
+            record = json_loads(f.read())
+        
+        self._record_cache[record_file] = (stat.st_mtime_ns, stat.st_size, record)
+        return dict(record)
+    
+    def _write_record(self, record_file: str, record: Dict):
+        """배포 기록 파일 저장 (임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않음)"""
+        tmp_path = f"{record_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(json_dumps(record, indent=True))
+            os.replace(tmp_path, record_file)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        
+        # 방금 쓴 내용으로 캐시 갱신 (다음 조회 시 다시 파싱하지 않음)
+        stat = os.stat(record_file)
+        self._record_cache[record_file] = (stat.st_mtime_ns, stat.st_size, dict(record))
+        
+        self._append_index(record)
+    
+    def _invalidate_index(self):
+        """인덱스 파일 삭제 (다음 조회 시 기록 파일로 재생성, 잠금을 잡은 상태에서 호출)"""
+        try:
+            os.unlink(self.index_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error(f"배포 인덱스 삭제 실패: {str(e)}")
+    
+    def _append_index(self, record: Dict):
+        """인덱스 파일에 배포 메타데이터 한 줄 추가
+        
+        추가에 실패하면 인덱스에 이전 상태가 남으므로 인덱스를 삭제해 다음 조회 시 재생성되게 합니다.
+        """
+        line = json_dumps({field: record.get(field) for field in INDEX_FIELDS}) + b'\n'
+        with self._index_lock():
+            try:
+                with open(self.index_file, 'ab') as f:
+                    f.write(line)
+            except OSError as e:
+                # 기록 저장 자체는 성공했으므로 실패로 처리하지 않음
+                self.logger.warning(f"배포 인덱스 추가 실패, 인덱스를 재생성합니다: {str(e)}")
+                self._invalidate_index()
+    
+    def _write_index(self, index: Dict[str, Dict]):
+        """인덱스 파일을 배포당 한 줄로 다시 작성 (잠금을 잡은 상태에서 호출)"""
+        tmp_path = f"{self.index_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for entry in index.values():
+                    f.write(json_dumps(entry) + b'\n')
+            os.replace(tmp_path, self.index_file)
+        except OSError as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            # 이전 인덱스는 최신이 아닐 수 있으므로 남기지 않음
+            self.logger.warning(f"배포 인덱스 저장 실패: {str(e)}")
+            self._invalidate_index()
+    
+    def _read_index_file(self) -> Optional[Tuple[Dict[str, Dict], int]]:
+        """인덱스 파일 읽기 ((배포 ID별 마지막 줄, 줄 수), 없거나 손상되었으면 None)"""
+        index = {}
+        line_count = 0
+        try:
+            with open(self.index_file, 'rb') as f:
+                for line in f:
+                    entry = json_loads(line)
+                    index[entry['deployment_id']] = entry
+                    line_count += 1
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"배포 인덱스 손상, 다시 생성합니다: {str(e)}")
+            return None
+        return index, line_count
+    
+    def _load_index(self) -> Optional[Dict[str, Dict]]:
+        """인덱스 파일 로드 (배포 ID별 마지막 줄 사용, 없거나 손상되었으면 None)"""
+        loaded = self._read_index_file()
+        if loaded is None:
+            return None
+        index, line_count = loaded
+        
+        # 상태 변경으로 쌓인 이전 줄 정리 (잠금 안에서 다시 읽어 그 사이 추가된 줄도 포함)
+        if line_count > len(index) * INDEX_COMPACT_RATIO:
+            with self._index_lock():
+                loaded = self._read_index_file()
+                if loaded is None:
+                    return None
+                index = loaded[0]
+                self._write_index(index)
+        
+        return index
+    
+    def _rebuild_index(self) -> Dict[str, Dict]:
+        """모든 배포 기록 파일을 읽어 인덱스 재생성
+        
+        잠금을 잡은 채로 스캔하므로 재생성 중에 저장된 기록의 인덱스 줄은 재생성 뒤에 추가됩니다.
+        """
+        index = {}
+        with self._index_lock():
+            for entry in self._scan_record_entries():
+                try:
+                    record = self._read_record(entry.path, entry.stat(follow_symlinks=False))
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"배포 기록 파일 읽기 실패: {entry.name} - {str(e)}")
+                    continue
+                index[entry.name[:-len('.json')]] = {field: record.get(field) for field in INDEX_FIELDS}
+            
+            self._write_index(index)
+        
+        self.logger.info(f"배포 인덱스 재생성 완료: {len(index)}개")
+        return index
+    
+    def _get_index(self, entries: List[os.DirEntry]) -> Dict[str, Dict]:
+        """주어진 기록 파일을 모두 포함하는 인덱스 반환 (빠진 기록이 있으면 전체 스캔으로 재생성)"""
+        index = self._load_index()
+        if index is None or any(entry.name[:-len('.json')] not in index for entry in entries):
+            index = self._rebuild_index()
+        return index
+    
+    @contextmanager
+    def edit(self, deployment_id: str):
+        """배포 기록 수정 트랜잭션
+        
+        기록을 한 번 읽어 dict로 넘기고, 블록이 정상 종료되면 updated_at을 갱신해 한 번만 저장합니다.
+        블록에서 예외가 발생하면 저장하지 않습니다.
+        
+            with manager.edit(deployment_id) as record:
+                record['status'] = 'success'
+                record['rollback_digest'] = digest
+        
+        Raises:
+            FileNotFoundError: 배포 기록이 없는 경우
+        """
+        record_file = os.path.join(self.releases_dir, f"{deployment_id}.json")
+        record = self._read_record(record_file)
+        
+        yield record
+        
+        record['updated_at'] = datetime.now().isoformat()
+        self._write_record(record_file, record)
+    
+    def bulk_update(self, deployment_ids: Iterable[str], mutator: Callable[[Dict], None]) -> int:
+        """여러 배포 기록에 같은 수정을 적용 (기록마다 읽기/쓰기 한 번씩)
+        
+        Returns:
+            수정된 기록 수
+        """
+        updated_count = 0
+        for deployment_id in deployment_ids:
+            try:
+                with self.edit(deployment_id) as record:
+                    mutator(record)
+                updated_count += 1
+            except FileNotFoundError:
+                self.logger.warning(f"배포 기록을 찾을 수 없습니다: {deployment_id}")
+            except Exception as e:
+                self.logger.error(f"배포 기록 수정 실패: {deployment_id} - {str(e)}")
+        
+        self.logger.info(f"배포 기록 일괄 수정 완료: {updated_count}개")
+        return updated_count
+    
     def update_deployment_status(self, 
                                deployment_id: str, 
                                status: str, 
@@ -89,20 +314,12 @@ class ReleaseManager:
                 self.logger.error(f"배포 기록을 찾을 수 없습니다: {deployment_id}")
                 return False
             
-            # 기존 기록 로드
-            with open(record_file, 'r', encoding='utf-8') as f:
-                record = json.load(f)
-            
-            # 상태 업데이트
-            record['status'] = status
-            record['updated_at'] = datetime.now().isoformat()
-            
-            if rollback_digest:
-                record['rollback_digest'] = rollback_digest
-            
-            # 파일 저장
-            with open(record_file, 'w', encoding='utf-8') as f:
-                json.dump(record, f, indent=2, ensure_ascii=False)
+            # 기존 기록을 한 번 읽어 수정하고 한 번 저장
+            with self.edit(deployment_id) as record:
+                record['status'] = status
+                
+                if rollback_digest:
+                    record['rollback_digest'] = rollback_digest
             
             self.logger.info(f"배포 상태 업데이트: {deployment_id} -> {status}")
             return True
@@ -120,10 +337,7 @@ class ReleaseManager:
                 self.logger.warning(f"배포 기록을 찾을 수 없습니다: {deployment_id}")
                 return None
             
-            with open(record_file, 'r', encoding='utf-8') as f:
-                record = json.load(f)
-            
-            return record
+            return self._read_record(record_file)
             
         except Exception as e:
             self.logger.error(f"배포 기록 조회 실패: {str(e)}")
@@ -134,15 +348,16 @@ class ReleaseManager:
                                        environment: str) -> Optional[Dict]:
         """최신 성공 배포 기록 조회"""
         try:
+            # 최신 파일부터 읽으며 첫 번째 성공 기록에서 중단
             deployments = self.list_deployments(
                 service_kind=service_kind,
                 environment=environment,
-                status="success"
+                status="success",
+                limit=1
             )
             
             if deployments:
-                # 타임스탬프 기준으로 정렬하여 최신 것 반환
-                latest = max(deployments, key=lambda x: x['timestamp'])
+                latest = deployments[0]
                 self.logger.info(f"최신 성공 배포 조회: {latest['deployment_id']}")
                 return latest
             else:
@@ -153,49 +368,88 @@ class ReleaseManager:
             self.logger.error(f"최신 성공 배포 조회 실패: {str(e)}")
             return None
     
+    def _scan_record_entries(self,
+                             service_kind: str = None,
+                             environment: str = None,
+                             since: datetime = None) -> List[os.DirEntry]:
+        """RELEASES 디렉토리의 배포 기록 파일 조회 (파일명으로 필터링, 파일은 열지 않음)"""
+        # 파일명의 타임스탬프 접두사는 문자열 비교로 시간 순서가 유지됨
+        since_prefix = since.strftime('%Y%m%d-%H%M%S') if since else None
+        entries = []
+        with os.scandir(self.releases_dir) as it:
+            for entry in it:
+                match = DEPLOYMENT_FILE_PATTERN.match(entry.name)
+                if not match:
+                    continue
+                if service_kind and match.group(2) != service_kind:
+                    continue
+                if environment and match.group(3) != environment:
+                    continue
+                if since_prefix and match.group(1) < since_prefix:
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                entries.append(entry)
+        return entries
+    
+    def _iter_records_uncached(self, entries: List[os.DirEntry]):
+        """기록 파일을 하나씩 읽어 반환 (캐시에 보관하지 않음, 내보내기용)"""
+        for entry in entries:
+            try:
+                with open(entry.path, 'rb') as f:
+                    yield json_loads(f.read())
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"배포 기록 파일 읽기 실패: {entry.name} - {str(e)}")
+    
     def list_deployments(self,
                         service_kind: str = None,
                         environment: str = None,
                         status: str = None,
-                        limit: int = None) -> List[Dict]:
-        """배포 기록 목록 조회"""
+                        limit: int = None,
+                        since: datetime = None) -> List[Dict]:
+        """배포 기록 목록 조회
+        
+        서비스 종류/환경/기간(since 이후) 필터와 정렬은 파일명(배포 ID)만으로, 상태 필터는 인덱스 파일로 처리하여
+        결과에 포함될 기록 파일만 읽습니다.
+        """
         try:
-            deployments = []
+            entries = self._scan_record_entries(service_kind, environment, since)
+            
+            if status:
+                index = self._get_index(entries)
+                entries = [
+                    entry for entry in entries
+                    if index.get(entry.name[:-len('.json')], {}).get('status') == status
+                ]
             
-            # RELEASES 디렉토리의 모든 JSON 파일 조회
-            for filename in os.listdir(self.releases_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.releases_dir, filename)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            record = json.load(f)
-                        
-                        # 필터링
-                        if service_kind and record.get('service_kind') != service_kind:
-                            continue
-                        if environment and record.get('environment') != environment:
-                            continue
-                        if status and record.get('status') != status:
-                            continue
-                        
-                        deployments.append(record)
-                        
-                    except Exception as e:
-                        self.logger.warning(f"배포 기록 파일 읽기 실패: {filename} - {str(e)}")
-                        continue
-            
-            # 타임스탬프 기준으로 내림차순 정렬 (최신 순)
-            deployments.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-            # 제한 개수 적용
+            # 파일명의 타임스탬프 접두사 기준으로 내림차순 정렬 (최신 순)
             if limit:
-                deployments = deployments[:limit]
+                entries = heapq.nlargest(limit, entries, key=lambda entry: entry.name)
+            else:
+                entries.sort(key=lambda entry: entry.name, reverse=True)
+            
+            deployments = []
+            for entry in entries:
+                try:
+                    record = self._read_record(entry.path, entry.stat(follow_symlinks=False))
+                except (OSError, ValueError) as e:
+                    self.logger.warning(f"배포 기록 파일 읽기 실패: {entry.name} - {str(e)}")
+                    continue
+                
+                if status and record.get('status') != status:
+                    continue
+                
+                deployments.append(record)
+                
+                # 제한 개수에 도달하면 나머지 파일은 읽지 않음
+                if limit and len(deployments) >= limit:
+                    break
             
             self.logger.info(f"배포 기록 조회 완료: {len(deployments)}개")
             return deployments
             
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"배포 기록 목록 조회 실패: {str(e)}")
             return []
     
@@ -205,11 +459,12 @@ class ReleaseManager:
                           current_deployment_id: str = None) -> Optional[Dict]:
         """롤백 대상 배포 조회"""
         try:
-            # 성공한 배포들을 최신 순으로 조회
+            # 성공한 배포들을 최신 순으로 조회 (현재 배포를 제외해도 하나가 남도록 최대 2개)
             successful_deployments = self.list_deployments(
                 service_kind=service_kind,
                 environment=environment,
-                status="success"
+                status="success",
+                limit=2 if current_deployment_id else 1
             )
             
             # 현재 배포를 제외하고 가장 최근 성공 배포 찾기
@@ -227,82 +482,118 @@ class ReleaseManager:
             self.logger.error(f"롤백 대상 조회 실패: {str(e)}")
             return None
     
+    @staticmethod
+    def _unlink_quietly(path: str) -> Optional[OSError]:
+        """파일 삭제 (실패하면 예외를 던지지 않고 반환)"""
+        try:
+            os.unlink(path)
+            return None
+        except OSError as e:
+            return e
+    
     def cleanup_old_records(self, keep_count: int = 50) -> int:
-        """오래된 배포 기록 정리"""
+        """오래된 배포 기록 정리 (파일명의 타임스탬프로 정렬하므로 기록 파일을 읽지 않음)"""
         try:
-            all_deployments = self.list_deployments()
+            entries = self._scan_record_entries()
             
-            if len(all_deployments) <= keep_count:
-                self.logger.info(f"정리할 배포 기록이 없습니다 (현재: {len(all_deployments)}개)")
+            if len(entries) <= keep_count:
+                self.logger.info(f"정리할 배포 기록이 없습니다 (현재: {len(entries)}개)")
                 return 0
             
-            # 삭제할 기록들 (오래된 순)
-            to_delete = all_deployments[keep_count:]
-            deleted_count = 0
+            # 삭제할 기록들 (최신 keep_count개 이후, 전체 정렬 없이 남길 기록만 선택)
+            to_keep = {entry.name for entry in heapq.nlargest(keep_count, entries, key=lambda entry: entry.name)}
+            to_delete = [entry for entry in entries if entry.name not in to_keep]
+            deleted_ids = set()
             
-            for record in to_delete:
-                try:
-                    record_file = os.path.join(self.releases_dir, f"{record['deployment_id']}.json")
-                    if os.path.exists(record_file):
-                        os.remove(record_file)
-                        deleted_count += 1
-                        self.logger.debug(f"배포 기록 삭제: {record['deployment_id']}")
-                except Exception as e:
-                    self.logger.warning(f"배포 기록 삭제 실패: {record['deployment_id']} - {str(e)}")
+            # 파일 삭제는 스레드로 병렬 실행 (unlink 시스템 콜 동안 GIL을 놓음)
+            with ThreadPoolExecutor(max_workers=min(CLEANUP_UNLINK_WORKERS, len(to_delete))) as executor:
+                errors = list(executor.map(self._unlink_quietly, [entry.path for entry in to_delete]))
             
-            self.logger.info(f"오래된 배포 기록 정리 완료: {deleted_count}개 삭제")
-            return deleted_count
-            
-        except Exception as e:
+            for entry, error in zip(to_delete, errors):
+                deployment_id = entry.name[:-len('.json')]
+                if error:
+                    self.logger.warning(f"배포 기록 삭제 실패: {deployment_id} - {str(error)}")
+                    continue
+                
+                self._record_cache.pop(entry.path, None)
+                deleted_ids.add(deployment_id)
+                self.logger.debug(f"배포 기록 삭제: {deployment_id}")
+            
+            # 삭제한 기록을 인덱스에서도 제거 (잠금 안에서 읽고 다시 작성)
+            if deleted_ids:
+                with self._index_lock():
+                    loaded = self._read_index_file()
+                    if loaded is not None:
+                        self._write_index({
+                            deployment_id: entry for deployment_id, entry in loaded[0].items()
+                            if deployment_id not in deleted_ids
+                        })
+            
+            self.logger.info(f"오래된 배포 기록 정리 완료: {len(deleted_ids)}개 삭제")
+            return len(deleted_ids)
+            
+        except OSError as e:
             self.logger.error(f"배포 기록 정리 실패: {str(e)}")
             return 0
     
     def export_deployment_history(self, output_file: str = None) -> str:
-        """배포 히스토리 내보내기"""
+        """배포 히스토리 내보내기
+        
+        기록을 하나씩 읽어 바로 파일에 쓰므로 전체 기록을 메모리에 올리지 않습니다.
+        total_deployments는 실제로 쓴 기록 수로 마지막에 기록합니다.
+        """
         try:
             if output_file is None:
-                timestamp = get_current_timestamp()
+                timestamp = self.timestamp_fn()
                 output_file = os.path.join(self.releases_dir, f"deployment_history_{timestamp}.json")
             
-            all_deployments = self.list_deployments()
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "total_deployments": len(all_deployments),
-                "deployments": all_deployments
-            }
+            entries = sorted(self._scan_record_entries(), key=lambda entry: entry.name, reverse=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            total = 0
+            with open(output_file, 'wb') as f:
+                f.write(b'{\n  "export_timestamp": ' + json_dumps(datetime.now().isoformat()) + b',\n  "deployments": [')
+                for record in self._iter_records_uncached(entries):
+                    f.write(b',\n    ' if total else b'\n    ')
+                    f.write(json_dumps(record, indent=True).replace(b'\n', b'\n    '))
+                    total += 1
+                f.write(b'\n  ],\n  "total_deployments": ' + str(total).encode() + b'\n}\n')
             
-            self.logger.info(f"배포 히스토리 내보내기 완료: {output_file}")
+            self.logger.info(f"배포 히스토리 내보내기 완료: {output_file} ({total}개)")
             return output_file
             
         except Exception as e:
             self.logger.error(f"배포 히스토리 내보내기 실패: {str(e)}")
             raise
     
-    def validate_digest(self, digest: str) -> bool:
-        """다이제스트 형식 검증"""
+    def export_deployment_history_jsonl(self, output_file: str = None) -> str:
+        """배포 히스토리를 JSON Lines 형식으로 내보내기
+        
+        첫 줄은 내보내기 정보(export_timestamp, total_deployments), 이후 한 줄에 기록 하나씩 씁니다.
+        """
         try:
-            # SHA256 다이제스트 형식 검증
-            if not digest.startswith('sha256:'):
-                return False
+            if output_file is None:
+                timestamp = self.timestamp_fn()
+                output_file = os.path.join(self.releases_dir, f"deployment_history_{timestamp}.jsonl")
             
-            # 해시 부분 길이 검증 (64자)
-            hash_part = digest[7:]  # 'sha256:' 제거
-            if len(hash_part) != 64:
-                return False
+            # 기록 수는 파일명 목록으로만 계산 (파일을 열지 않음)
+            entries = sorted(self._scan_record_entries(), key=lambda entry: entry.name, reverse=True)
             
-            # 16진수 문자만 포함하는지 검증
-            try:
-                int(hash_part, 16)
-                return True
-            except ValueError:
-                return False
-                
-        except Exception:
-            return False
+            with open(output_file, 'wb') as f:
+                header = {"export_timestamp": datetime.now().isoformat(), "total_deployments": len(entries)}
+                f.write(json_dumps(header) + b'\n')
+                for record in self._iter_records_uncached(entries):
+                    f.write(json_dumps(record) + b'\n')
+            
+            self.logger.info(f"배포 히스토리 내보내기 완료: {output_file}")
+            return output_file
+            
+        except Exception as e:
+            self.logger.error(f"배포 히스토리 내보내기 실패: {str(e)}")
+            raise
+    
+    def validate_digest(self, digest: str) -> bool:
+        """다이제스트 형식 검증 (sha256: + 16진수 64자)"""
+        return isinstance(digest, str) and DIGEST_PATTERN.match(digest) is not None
 
 
 def main():
@@ -310,7 +601,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description="릴리스 관리 도구")
-    parser.add_argument('action', choices=['create', 'update', 'list', 'get', 'cleanup'], 
+    parser.add_argument('action', choices=['create', 'update', 'list', 'get', 'cleanup', 'export'], 
                        help='실행할 작업')
     parser.add_argument('--deployment-id', help='배포 ID')
     parser.add_argument('--source-repo', help='소스 저장소')
@@ -322,6 +613,8 @@ def main():
     parser.add_argument('--image-digest', help='이미지 다이제스트')
     parser.add_argument('--status', help='상태')
     parser.add_argument('--limit', type=int, help='조회 제한 개수')
+    parser.add_argument('--output', help='내보내기 파일 경로')
+    parser.add_argument('--jsonl', action='store_true', help='JSON Lines 형식으로 내보내기')
     
     args = parser.parse_args()
     
@@ -367,7 +660,7 @@ def main():
             
             record = manager.get_deployment_record(args.deployment_id)
             if record:
-                print(json.dumps(record, indent=2, ensure_ascii=False))
+                print(json_dumps(record, indent=True).decode('utf-8'))
             else:
                 print("Deployment record not found")
                 sys.exit(1)
@@ -376,6 +669,13 @@ def main():
             deleted_count = manager.cleanup_old_records()
             print(f"Cleaned up {deleted_count} old records")
             
+        elif args.action == 'export':
+            if args.jsonl:
+                output_file = manager.export_deployment_history_jsonl(args.output)
+            else:
+                output_file = manager.export_deployment_history(args.output)
+            print(f"Exported deployment history: {output_file}")
+            
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -6,22 +6,51 @@
 
 import os
 import sys
+import json
+import time
+import stat
+import shutil
 import hashlib
+import functools
 import tempfile
+import threading
 import subprocess
 import requests
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import urlparse
 
 # 현재 스크립트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils import Logger
+from utils import Logger, create_http_session, terminate_process_group
+
+
+# 스크립트 임시 파일용 메모리 기반 파일시스템 (없으면 기본 임시 디렉토리 사용)
+SHM_DIR = '/dev/shm'
+
+# 스크립트 타입별 인터프리터
+INTERPRETERS = {
+    'bash': 'bash',
+    'shell': 'sh',
+    'python': 'python3',
+    'node': 'node',
+    'ruby': 'ruby',
+    'perl': 'perl'
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_interpreter(name: str) -> str:
+    """인터프리터 절대 경로 (PATH 탐색은 프로세스당 한 번, 찾지 못하면 이름 그대로)"""
+    return shutil.which(name) or name
 
 
 class RemoteHookExecutor:
     """원격 훅 실행기"""
     
+    # 훅마다 실행기를 새로 만들어도 같은 호스트로의 TCP/TLS 연결을 재사용하도록 세션 공유
+    _session = None
+    
     def __init__(self, environment: str, service_kind: str):
         self.environment = environment
         self.service_kind = service_kind
@@ -32,14 +61,27 @@ class RemoteHookExecutor:
         self.verify_ssl = os.environ.get('VERIFY_SSL', 'true').lower() == 'true'
         self.max_script_size = int(os.environ.get('MAX_SCRIPT_SIZE', '1048576'))  # 1MB
         
+        # 스크립트 다운로드용 HTTP 세션 (연결 실패 시 짧게 재시도)
+        if RemoteHookExecutor._session is None:
+            RemoteHookExecutor._session = create_http_session(pool_size=8, retries=2)
+        self.session = RemoteHookExecutor._session
+        
         # 캐시 디렉토리
         self.cache_dir = os.path.join(tempfile.gettempdir(), 'deploy_hooks_cache')
         os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # URL -> (만료 시각, 스크립트 내용, SHA256): TTL 이내 재요청은 파일시스템 접근 없이 처리
+        self._mem_cache: Dict[str, Tuple[float, bytes, str]] = {}
+    
+    def _get_allowed_domains(self) -> FrozenSet[str]:
+        """허용된 도메인 집합 반환"""
+        return self._parse_allowed_domains(os.environ.get('ALLOWED_HOOK_DOMAINS', ''))
     
-    def _get_allowed_domains(self) -> List[str]:
-        """허용된 도메인 목록 반환"""
-        allowed = os.environ.get('ALLOWED_HOOK_DOMAINS', '').split(',')
-        allowed = [domain.strip() for domain in allowed if domain.strip()]
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_allowed_domains(allowed_env: str) -> FrozenSet[str]:
+        """ALLOWED_HOOK_DOMAINS 값을 기본 허용 도메인과 합친 집합으로 변환 (값별로 캐시)"""
+        allowed = [domain.strip() for domain in allowed_env.split(',') if domain.strip()]
         
         # 기본 허용 도메인
         default_domains = [
@@ -47,7 +89,7 @@ class RemoteHookExecutor:
             'gist.githubusercontent.com',
         ]
         
-        return list(set(allowed + default_domains))
+        return frozenset(allowed + default_domains)
     
     def execute_remote_hook(self, 
                           hook_url: str, 
@@ -63,18 +105,19 @@ class RemoteHookExecutor:
                 self.logger.error(f"허용되지 않은 URL: {hook_url}")
                 return False
             
-            # 스크립트 다운로드
-            script_content = self._download_script(hook_url)
-            if not script_content:
+            # 스크립트 다운로드 (SHA256은 다운로드하면서 함께 계산)
+            downloaded = self._download_script(hook_url)
+            if not downloaded:
                 return False
+            script_content, actual_hash = downloaded
             
             # 해시 검증 (제공된 경우)
-            if expected_hash and not self._verify_hash(script_content, expected_hash):
+            if expected_hash and not self._verify_hash(actual_hash, expected_hash):
                 self.logger.error("스크립트 해시 검증 실패")
                 return False
             
             # 스크립트 실행
-            return self._execute_script(script_content, hook_type, args or [])
+            return self._execute_script(script_content, hook_type, args or [], content_hash=actual_hash)
             
         except Exception as e:
             self.logger.error(f"원격 훅 실행 실패: {str(e)}")
@@ -101,22 +144,60 @@ class RemoteHookExecutor:
             self.logger.error(f"URL 검증 실패: {str(e)}")
             return False
     
-    def _download_script(self, url: str) -> Optional[str]:
-        """스크립트 다운로드"""
+    def _read_cache(self, cache_file: str, meta_file: str) -> Optional[Tuple[bytes, str, Dict]]:
+        """캐시된 스크립트와 메타데이터 로드 (내용이 메타데이터의 해시와 다르면 None)"""
+        try:
+            # 다운로드한 바이트 그대로 저장되어 있으므로 바이너리로 읽어 해시 비교
+            with open(cache_file, 'rb') as f:
+                data = f.read()
+            with open(meta_file, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        actual_hash = hashlib.sha256(data).hexdigest()
+        if meta.get('sha256') != actual_hash:
+            self.logger.warning("캐시된 스크립트가 메타데이터와 일치하지 않아 다시 다운로드합니다.")
+            return None
+        
+        return data, actual_hash, meta
+    
+    def _download_script(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """스크립트 다운로드
+        
+        캐시가 HOOK_CACHE_TTL 이내면 그대로 사용하고, 지났으면 ETag/Last-Modified로
+        조건부 요청을 보내 304 응답이면 본문 전송 없이 캐시를 재사용합니다.
+        
+        Returns:
+            (스크립트 내용 바이트, SHA256 hex 다이제스트), 실패 시 None
+        """
         try:
-            # 캐시 확인
-            cache_key = hashlib.md5(url.encode()).hexdigest()
+            max_cache_age = int(os.environ.get('HOOK_CACHE_TTL', '3600'))  # 1시간
+            
+            # 같은 실행기에서 이미 받은 스크립트면 stat 없이 사용
+            mem_cached = self._mem_cache.get(url)
+            if mem_cached and mem_cached[0] > time.time():
+                self.logger.info("캐시된 스크립트 사용")
+                return mem_cached[1], mem_cached[2]
+            
+            # 캐시 확인 (파일명용 키이므로 빠른 BLAKE2b 사용)
+            cache_key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
             cache_file = os.path.join(self.cache_dir, f"{cache_key}.cache")
+            meta_file = os.path.join(self.cache_dir, f"{cache_key}.meta")
             
-            # 캐시된 파일이 있고 최근 것이면 사용
-            if os.path.exists(cache_file):
-                cache_age = time.time() - os.path.getmtime(cache_file)
-                max_cache_age = int(os.environ.get('HOOK_CACHE_TTL', '3600'))  # 1시간
-                
-                if cache_age < max_cache_age:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        self.logger.info("캐시된 스크립트 사용")
-                        return f.read()
+            # 존재 여부와 수정 시각을 stat 한 번으로 확인
+            try:
+                cache_stat = os.stat(cache_file)
+            except FileNotFoundError:
+                cache_stat = None
+            
+            cached = self._read_cache(cache_file, meta_file) if cache_stat else None
+            
+            # 캐시된 파일이 최근 것이면 요청 없이 사용
+            if cached and time.time() - cache_stat.st_mtime < max_cache_age:
+                self._mem_cache[url] = (cache_stat.st_mtime + max_cache_age, cached[0], cached[1])
+                self.logger.info("캐시된 스크립트 사용")
+                return cached[0], cached[1]
             
             # 다운로드
             headers = {
@@ -128,7 +209,15 @@ class RemoteHookExecutor:
             if auth_token:
                 headers['Authorization'] = f'Bearer {auth_token}'
             
-            response = requests.get(
+            # 캐시 재검증용 조건부 요청 헤더
+            if cached:
+                meta = cached[2]
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            
+            response = self.session.get(
                 url, 
                 headers=headers,
                 verify=self.verify_ssl,
@@ -136,6 +225,14 @@ class RemoteHookExecutor:
                 stream=True
             )
             
+            # 변경 없음: 캐시 시각만 갱신하고 재사용
+            if response.status_code == 304 and cached:
+                response.close()
+                os.utime(cache_file)
+                self._mem_cache[url] = (time.time() + max_cache_age, cached[0], cached[1])
+                self.logger.info("원격 스크립트 변경 없음 (304), 캐시된 스크립트 사용")
+                return cached[0], cached[1]
+            
             response.raise_for_status()
             
             # 크기 제한 확인
@@ -144,24 +241,35 @@ class RemoteHookExecutor:
                 self.logger.error(f"스크립트 크기 초과: {content_length} bytes")
                 return None
             
-            # 내용 읽기
-            content = ''
-            total_size = 0
+            # 내용 읽기 (바이트 그대로 누적, 실행 파일에도 그대로 쓰므로 디코딩하지 않음)
+            buf = bytearray()
+            digest = hashlib.sha256()
             
-            for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
+            for chunk in response.iter_content(chunk_size=65536):
                 if chunk:
-                    total_size += len(chunk.encode('utf-8'))
-                    if total_size > self.max_script_size:
-                        self.logger.error(f"스크립트 크기 초과: {total_size} bytes")
+                    if len(buf) + len(chunk) > self.max_script_size:
+                        self.logger.error(f"스크립트 크기 초과: {len(buf) + len(chunk)} bytes")
                         return None
-                    content += chunk
+                    digest.update(chunk)
+                    buf.extend(chunk)
             
-            # 캐시에 저장
-            with open(cache_file, 'w', encoding='utf-8') as f:
+            total_size = len(buf)
+            content = bytes(buf)
+            actual_hash = digest.hexdigest()
+            
+            # 캐시 및 재검증용 메타데이터 저장
+            with open(cache_file, 'wb') as f:
                 f.write(content)
+            with open(meta_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'sha256': actual_hash
+                }, f)
+            self._mem_cache[url] = (time.time() + max_cache_age, content, actual_hash)
             
-            self.logger.info(f"스크립트 다운로드 완료: {len(content)} bytes")
-            return content
+            self.logger.info(f"스크립트 다운로드 완료: {total_size} bytes")
+            return content, actual_hash
             
         except requests.RequestException as e:
             self.logger.error(f"스크립트 다운로드 실패: {str(e)}")
@@ -170,13 +278,10 @@ class RemoteHookExecutor:
             self.logger.error(f"스크립트 다운로드 중 예외: {str(e)}")
             return None
     
-    def _verify_hash(self, content: str, expected_hash: str) -> bool:
-        """스크립트 해시 검증"""
+    def _verify_hash(self, actual_hash: str, expected_hash: str) -> bool:
+        """스크립트 해시 검증 (다운로드 시 계산한 SHA256과 비교)"""
         try:
-            # SHA256 해시 계산
-            actual_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-            
-            if actual_hash == expected_hash:
+            if actual_hash == expected_hash.lower():
                 self.logger.info("스크립트 해시 검증 성공")
                 return True
             else:
@@ -188,27 +293,33 @@ class RemoteHookExecutor:
             return False
     
     def _execute_script(self, 
-                       content: str, 
+                       content: bytes, 
                        script_type: str, 
-                       args: List[str]) -> bool:
+                       args: List[str],
+                       content_hash: Optional[str] = None) -> bool:
         """스크립트 실행"""
         try:
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(
-                mode='w', 
-                suffix=self._get_script_extension(script_type),
-                delete=False,
-                encoding='utf-8'
-            ) as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-            
-            try:
+            # 같은 내용의 스크립트 파일이 있으면 재사용, 준비할 수 없으면 일회용 임시 파일 사용
+            temp_file_path = None
+            script_path = self._get_cached_executable(content, script_type, content_hash)
+            if script_path is None:
+                # 임시 파일 생성 (인터프리터로 실행하는 스크립트는 메모리 기반 파일시스템에)
+                with tempfile.NamedTemporaryFile(
+                    mode='wb', 
+                    suffix=self._get_script_extension(script_type),
+                    dir=self._get_script_temp_dir(script_type),
+                    delete=False
+                ) as temp_file:
+                    temp_file.write(content)
+                    temp_file_path = temp_file.name
+                
                 # 실행 권한 부여
                 os.chmod(temp_file_path, 0o755)
-                
+                script_path = temp_file_path
+            
+            try:
                 # 실행 명령 구성
-                cmd = self._build_command(script_type, temp_file_path, args)
+                cmd = self._build_command(script_type, script_path, args)
                 
                 # 환경 변수 설정
                 env = os.environ.copy()
@@ -221,34 +332,53 @@ class RemoteHookExecutor:
                 # 스크립트 실행
                 self.logger.info(f"스크립트 실행: {' '.join(cmd)}")
                 
-                result = subprocess.run(
+                # 새 세션에서 실행하여 타임아웃 시 스크립트가 띄운 자식 프로세스까지 함께 종료
+                # (Python이 여는 fd는 기본적으로 상속되지 않으므로 close_fds=False)
+                proc = subprocess.Popen(
                     cmd,
                     env=env,
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=300  # 5분 타임아웃
+                    bufsize=1,
+                    close_fds=False,
+                    start_new_session=True
                 )
                 
-                # 결과 로깅
-                if result.stdout:
-                    self.logger.info(f"스크립트 출력: {result.stdout}")
+                # 출력은 모아두지 않고 도착하는 대로 한 줄씩 로깅
+                readers = [
+                    threading.Thread(target=self._log_stream, args=(proc.stdout, self.logger.info, "스크립트 출력"), daemon=True),
+                    threading.Thread(target=self._log_stream, args=(proc.stderr, self.logger.warning, "스크립트 에러"), daemon=True)
+                ]
+                for reader in readers:
+                    reader.start()
+                
+                try:
+                    returncode = proc.wait(timeout=300)  # 5분 타임아웃
+                except subprocess.TimeoutExpired:
+                    # 프로세스 그룹 전체를 종료하므로 파이프가 닫혀 읽기 스레드도 끝남
+                    terminate_process_group(proc)
+                    for reader in readers:
+                        reader.join(timeout=5)
+                    raise
                 
-                if result.stderr:
-                    self.logger.warning(f"스크립트 에러: {result.stderr}")
+                for reader in readers:
+                    reader.join(timeout=5)
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     self.logger.info("스크립트 실행 성공")
                     return True
                 else:
-                    self.logger.error(f"스크립트 실행 실패 (exit code: {result.returncode})")
+                    self.logger.error(f"스크립트 실행 실패 (exit code: {returncode})")
                     return False
                     
             finally:
-                # 임시 파일 정리
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
+                # 임시 파일 정리 (재사용 파일은 유지)
+                if temp_file_path:
+                    try:
+                        os.unlink(temp_file_path)
+                    except OSError:
+                        pass
                     
         except subprocess.TimeoutExpired:
             self.logger.error("스크립트 실행 시간 초과")
@@ -257,6 +387,66 @@ class RemoteHookExecutor:
             self.logger.error(f"스크립트 실행 실패: {str(e)}")
             return False
     
+    @staticmethod
+    def _log_stream(stream, log, prefix: str):
+        """스크립트 출력 스트림을 한 줄씩 읽어 로깅"""
+        with stream:
+            for line in stream:
+                log(f"{prefix}: {line.rstrip()}")
+    
+    def _get_cached_executable(self, content: bytes, script_type: str, content_hash: Optional[str] = None) -> Optional[str]:
+        """내용 해시를 이름으로 하는 실행 파일 반환 (없으면 생성, 안전하게 재사용할 수 없으면 None)
+        
+        현재 사용자 소유의 디렉토리/파일만 사용하여 다른 사용자가 미리 만든 파일을 실행하지 않습니다.
+        """
+        content_hash = content_hash or hashlib.sha256(content).hexdigest()
+        
+        shm_dir = self._get_script_temp_dir(script_type)
+        bin_dir = os.path.join(shm_dir, 'deploy_hooks_bin') if shm_dir else os.path.join(self.cache_dir, 'bin')
+        exec_path = os.path.join(bin_dir, f"{content_hash}{self._get_script_extension(script_type)}")
+        
+        try:
+            os.makedirs(bin_dir, mode=0o700, exist_ok=True)
+            dir_stat = os.lstat(bin_dir)
+            if not stat.S_ISDIR(dir_stat.st_mode) or dir_stat.st_uid != os.getuid():
+                return None
+            
+            try:
+                file_stat = os.lstat(exec_path)
+            except FileNotFoundError:
+                file_stat = None
+            
+            if file_stat is not None:
+                if stat.S_ISREG(file_stat.st_mode) and file_stat.st_uid == os.getuid() and not file_stat.st_mode & 0o022:
+                    self.logger.debug(f"준비된 스크립트 파일 재사용: {exec_path}")
+                    return exec_path
+                return None
+            
+            # 임시 파일에 쓴 뒤 교체 (동시 실행 시에도 완성된 파일만 보이도록)
+            fd, tmp_path = tempfile.mkstemp(dir=bin_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+                os.chmod(tmp_path, 0o500)
+                os.replace(tmp_path, exec_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+            return exec_path
+            
+        except OSError as e:
+            self.logger.debug(f"스크립트 실행 파일 캐시 사용 불가: {str(e)}")
+            return None
+    
+    def _get_script_temp_dir(self, script_type: str) -> Optional[str]:
+        """스크립트 임시 파일 위치 (None이면 기본 임시 디렉토리)
+        
+        /dev/shm은 noexec로 마운트되는 경우가 많아 인터프리터로 실행하는 스크립트만 사용합니다.
+        """
+        if script_type in INTERPRETERS and os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+            return SHM_DIR
+        return None
+    
     def _get_script_extension(self, script_type: str) -> str:
         """스크립트 타입별 확장자 반환"""
         extensions = {
@@ -271,17 +461,8 @@ class RemoteHookExecutor:
     
     def _build_command(self, script_type: str, script_path: str, args: List[str]) -> List[str]:
         """실행 명령 구성"""
-        interpreters = {
-            'bash': ['bash'],
-            'shell': ['sh'],
-            'python': ['python3'],
-            'node': ['node'],
-            'ruby': ['ruby'],
-            'perl': ['perl']
-        }
-        
-        if script_type in interpreters:
-            return interpreters[script_type] + [script_path] + args
+        if script_type in INTERPRETERS:
+            return [_resolve_interpreter(INTERPRETERS[script_type]), script_path] + args
         else:
             # 기본값은 직접 실행
             return [script_path] + args
@@ -2,54 +2,211 @@
 """
 자동 롤백 시스템
 이전 성공한 배포로 롤백을 수행합니다.
+
+레지스트리 인증 (롤백 이미지 존재 확인):
+  DOCKER_REGISTRY_USER / DOCKER_REGISTRY_PASS  레지스트리 계정 (우선 사용)
+  DOCKER_USERNAME / DOCKER_PASSWORD            위 값이 없을 때 사용
+  둘 다 없으면 docker login으로 저장된 ~/.docker/config.json(DOCKER_CONFIG)의 auths를 사용하고,
+  그래도 401/403이면 docker manifest inspect로 다시 확인합니다 (credsStore/credHelpers 사용).
 """
 
 import os
+import re
 import sys
+import json
+import time
+import base64
 import argparse
+import tempfile
+import threading
 import subprocess
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import requests
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 스크립트/프로젝트 경로 (모듈 로드 시 한 번만 계산)
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+POST_DEPLOY_SCRIPT = os.path.join(SCRIPTS_DIR, 'post_deploy.py')
+POST_DEPLOY_EXISTS = os.path.exists(POST_DEPLOY_SCRIPT)
 
 # 현재 스크립트 디렉토리를 Python 경로에 추가
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(SCRIPTS_DIR)
+
+from utils import Logger, SlackNotifier, load_env_file_cached, create_http_session, run_bounded, terminate_process_group
+
+
+# 매니페스트 HEAD 요청 시 허용하는 형식 (단일 이미지/멀티 아키텍처, Docker/OCI)
+MANIFEST_ACCEPT = ', '.join([
+    'application/vnd.docker.distribution.manifest.v2+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.oci.image.manifest.v1+json',
+    'application/vnd.oci.image.index.v1+json',
+])
+
+# Docker Hub는 레지스트리 API 호스트가 별도
+DOCKER_HUB_HOSTS = ('docker.io', 'index.docker.io', 'registry-1.docker.io')
+DOCKER_HUB_API_HOST = 'registry-1.docker.io'
+
+# docker login 인증 정보 파일
+DOCKER_CONFIG_PATH = os.path.join(os.environ.get('DOCKER_CONFIG') or os.path.expanduser('~/.docker'), 'config.json')
+
+# docker login이 Docker Hub 인증 정보를 저장하는 키
+DOCKER_HUB_AUTH_KEY = 'https://index.docker.io/v1/'
+
+# WWW-Authenticate 헤더의 key="value" 항목
+AUTH_PARAM_PATTERN = re.compile(r'(\w+)="([^"]*)"')
 
-from utils import Logger, SlackNotifier, load_env_file
-from release_manager import ReleaseManager
+# 이미지 존재 확인 결과 캐시 (다이제스트 참조는 내용이 바뀌지 않으므로 만료 없음)
+MANIFEST_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'universal-makefile',
+    'manifests.json'
+)
+
+# --since 기간 단위 (예: 30m, 12h, 7d, 2w)
+SINCE_PATTERN = re.compile(r'^(\d+)([mhdw])$')
+SINCE_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days', 'w': 'weeks'}
+
+# 레지스트리 요청용 HTTP 세션 (프로세스 내에서 TLS 연결 재사용)
+_registry_session = None
+
+
+def _get_registry_session() -> requests.Session:
+    """레지스트리 API용 공유 HTTP 세션 반환"""
+    global _registry_session
+    if _registry_session is None:
+        _registry_session = create_http_session(pool_size=8)
+    return _registry_session
+
+
+class _ManifestCache:
+    """레지스트리에서 존재를 확인한 이미지 참조({이미지}@{다이제스트}) 캐시
+    
+    존재하지 않는 결과는 이후에 푸시될 수 있으므로 기록하지 않습니다.
+    """
+    
+    def __init__(self, path: str = MANIFEST_CACHE_PATH):
+        self.path = path
+        self._entries: Optional[Dict[str, Dict]] = None
+    
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def get(self, image_ref: str) -> Optional[str]:
+        """캐시된 상태('ok') 반환, 없으면 None"""
+        if self._entries is None:
+            self._entries = self._load()
+        entry = self._entries.get(image_ref)
+        return entry.get('status') if isinstance(entry, dict) else None
+    
+    def put(self, image_ref: str, ok: bool):
+        """확인 결과 저장 (다른 프로세스가 추가한 항목과 병합)"""
+        if not ok:
+            return
+        
+        try:
+            cache_dir = os.path.dirname(self.path)
+            os.makedirs(cache_dir, exist_ok=True)
+            
+            with open(f"{self.path}.lock", 'w') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                
+                entries = self._load()
+                entries[image_ref] = {'status': 'ok', 'verified_at': time.time()}
+                
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(entries, f)
+                    os.replace(tmp_path, self.path)
+                except OSError:
+                    os.unlink(tmp_path)
+                    raise
+            
+            self._entries = entries
+        except OSError:
+            # 캐시는 최적화일 뿐이므로 저장 실패는 무시
+            pass
 
 
 class RollbackManager:
     """롤백 관리"""
     
-    def __init__(self, environment: str, service_kind: str):
+    def __init__(self, environment: str, service_kind: str, load_environment: bool = True):
         self.environment = environment
         self.service_kind = service_kind
-        self.logger = Logger(f"RollbackManager-{environment}-{service_kind}")
+        self.logger = Logger.get_logger(f"RollbackManager-{environment}-{service_kind}")
         
-        # 릴리스 매니저 초기화
+        # 릴리스 매니저 초기화 (모듈 import 시점이 아니라 실제로 사용할 때 로드)
+        from release_manager import ReleaseManager
         self.release_manager = ReleaseManager()
         
-        # Slack 알림 초기화
-        self.slack_notifier = SlackNotifier()
+        # Slack 알림은 롤백 완료 시에만 필요하므로 그때 생성 (호출자가 미리 지정할 수 있음)
+        self.slack_notifier = None
         
         # 프로젝트 루트 디렉토리
-        self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.project_root = PROJECT_ROOT
+        
+        # 저장소별 레지스트리 Bearer 토큰
+        self._registry_tokens: Dict[str, str] = {}
+        
+        # 이미지 존재 확인 결과 캐시
+        self._manifest_cache = _ManifestCache()
+        
+        # 롤백 대상 조회/다이제스트 검증 결과 캐시 (시뮬레이션 후 실제 롤백 시 재조회 방지)
+        self._target_cache: Dict[Tuple[Optional[str], str, str], Dict] = {}
+        self._digest_validity: Dict[str, bool] = {}
+        
+        # 검증 작업(레지스트리 요청)을 겹쳐 실행하기 위한 스레드 풀 (필요할 때 생성)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        
+        # 환경 변수 로드 (호출자가 이미 로드한 경우 생략)
+        if load_environment:
+            self._load_environment_variables()
         
-        # 환경 변수 로드
-        self._load_environment_variables()
+        # 레지스트리 설정은 환경 로드 후 한 번만 해석
+        self._registry = os.environ.get('DOCKER_REGISTRY', 'docker.io')
+        self._repo_hub = os.environ.get('DOCKER_REPO_HUB', 'mycompany')
+        self._image_ref_prefix = f"{self._registry}/{self._repo_hub}/app"
         
-        self.logger.info(f"RollbackManager 초기화 완료 (환경: {environment}, 서비스: {service_kind})")
+        # DOCKER_REGISTRY에 경로가 포함된 경우(예: docker.io/team) 저장소 경로 앞에 붙임
+        host, _, prefix = self._registry.partition('/')
+        self._registry_api_host = DOCKER_HUB_API_HOST if host in DOCKER_HUB_HOSTS else host
+        self._registry_repository = '/'.join(part for part in (prefix, self._repo_hub, 'app') if part)
+        
+        self.logger.info("RollbackManager 초기화 완료 (환경: %s, 서비스: %s)", environment, service_kind)
     
     def _load_environment_variables(self):
         """환경 변수 로드"""
         try:
             env_runtime_path = os.path.join(self.project_root, '.env.runtime')
-            if os.path.exists(env_runtime_path):
-                env_vars = load_env_file(env_runtime_path)
-                for key, value in env_vars.items():
-                    os.environ[key] = value
-                self.logger.info(f".env.runtime에서 {len(env_vars)}개 환경 변수 로드")
+            if not os.path.exists(env_runtime_path):
+                return
+            
+            # 인스턴스를 여러 번 만들어도 파일이 바뀌지 않았으면 다시 파싱하지 않음
+            env_vars = load_env_file_cached(env_runtime_path)
+            
+            # 값이 바뀐 키만 한 번에 반영
+            changed = {key: value for key, value in env_vars.items() if os.environ.get(key) != value}
+            os.environ.update(changed)
+            self.logger.info(".env.runtime에서 %s개 환경 변수 로드 (%s개 갱신)", len(env_vars), len(changed))
         except Exception as e:
-            self.logger.warning(f"환경 변수 로드 실패: {str(e)}")
+            self.logger.warning("환경 변수 로드 실패: %s", e)
     
     def execute_rollback(self, target_deployment_id: str = None) -> bool:
         """롤백 실행"""
@@ -62,125 +219,302 @@ class RollbackManager:
                 self.logger.error("롤백 대상을 찾을 수 없습니다.")
                 return False
             
-            self.logger.info(f"롤백 대상: {rollback_target['deployment_id']} (다이제스트: {rollback_target['image_digest']})")
+            self.logger.info("롤백 대상: %s (다이제스트: %s)", rollback_target['deployment_id'], rollback_target['image_digest'])
             
             # 2. 롤백 전 검증
             if not self._validate_rollback_target(rollback_target):
                 self.logger.error("롤백 대상 검증 실패")
                 return False
             
-            # 3. 현재 서비스 중지
-            if not self._stop_current_services():
-                self.logger.error("현재 서비스 중지 실패")
-                return False
-            
-            # 4. 이전 이미지로 배포
+            # 3. 이전 이미지로 배포 (앱 서비스만 교체, 실패 시 전체 재시작)
             if not self._deploy_rollback_image(rollback_target):
                 self.logger.error("롤백 이미지 배포 실패")
                 return False
             
-            # 5. 롤백 후 헬스 체크
+            # 4. 롤백 후 헬스 체크
             if not self._verify_rollback_health():
                 self.logger.error("롤백 후 헬스 체크 실패")
                 return False
             
-            # 6. 롤백 완료 처리
+            # 5. 롤백 완료 처리
             self._finalize_rollback(rollback_target)
             
+            # 배포 상태가 바뀌었으므로 다음 롤백은 새로 조회
+            self._target_cache.clear()
+            
             self.logger.info("롤백 프로세스 완료")
             return True
             
         except Exception as e:
-            self.logger.error(f"롤백 실행 중 예외 발생: {str(e)}")
+            self.logger.error("롤백 실행 중 예외 발생: %s", e)
             return False
     
     def _determine_rollback_target(self, target_deployment_id: str = None) -> Optional[Dict]:
-        """롤백 대상 결정"""
-        try:
-            if target_deployment_id:
-                # 특정 배포 ID로 롤백
-                target = self.release_manager.get_deployment_record(target_deployment_id)
-                if target and target.get('status') == 'success':
-                    self.logger.info(f"지정된 배포로 롤백: {target_deployment_id}")
-                    return target
-                else:
-                    self.logger.error(f"지정된 배포를 찾을 수 없거나 성공 상태가 아닙니다: {target_deployment_id}")
-                    return None
+        """롤백 대상 결정 (같은 조건의 조회 결과는 인스턴스 내에서 재사용)"""
+        cache_key = (target_deployment_id, self.service_kind, self.environment)
+        cached = self._target_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info("롤백 대상 (캐시): %s", cached['deployment_id'])
+            return cached
+        
+        target = self._lookup_rollback_target(target_deployment_id)
+        if target is not None:
+            self._target_cache[cache_key] = target
+        return target
+    
+    def _lookup_rollback_target(self, target_deployment_id: str = None) -> Optional[Dict]:
+        """릴리스 기록에서 롤백 대상 조회"""
+        if target_deployment_id:
+            # 특정 배포 ID로 롤백
+            target = self.release_manager.get_deployment_record(target_deployment_id)
+            if target and target.get('status') == 'success':
+                self.logger.info("지정된 배포로 롤백: %s", target_deployment_id)
+                return target
             else:
-                # 가장 최근 성공한 배포로 롤백
-                target = self.release_manager.get_rollback_target(
-                    self.service_kind, 
-                    self.environment
-                )
-                if target:
-                    self.logger.info(f"최근 성공 배포로 롤백: {target['deployment_id']}")
-                    return target
-                else:
-                    self.logger.error("롤백할 성공한 배포를 찾을 수 없습니다.")
-                    return None
-                    
-        except Exception as e:
-            self.logger.error(f"롤백 대상 결정 실패: {str(e)}")
-            return None
+                self.logger.error("지정된 배포를 찾을 수 없거나 성공 상태가 아닙니다: %s", target_deployment_id)
+                return None
+        else:
+            # 가장 최근 성공한 배포로 롤백
+            target = self.release_manager.get_rollback_target(
+                self.service_kind, 
+                self.environment
+            )
+            if target:
+                self.logger.info("최근 성공 배포로 롤백: %s", target['deployment_id'])
+                return target
+            else:
+                self.logger.error("롤백할 성공한 배포를 찾을 수 없습니다.")
+                return None
     
     def _validate_rollback_target(self, rollback_target: Dict) -> bool:
         """롤백 대상 검증"""
-        try:
-            # 필수 필드 확인
-            required_fields = ['deployment_id', 'image_digest', 'image_tag']
-            for field in required_fields:
-                if not rollback_target.get(field):
-                    self.logger.error(f"롤백 대상에 필수 필드가 없습니다: {field}")
-                    return False
-            
-            # 다이제스트 형식 검증
-            if not self.release_manager.validate_digest(rollback_target['image_digest']):
-                self.logger.error("롤백 대상의 다이제스트 형식이 잘못되었습니다.")
+        # 필수 필드 확인
+        required_fields = ['deployment_id', 'image_digest', 'image_tag']
+        for field in required_fields:
+            if not rollback_target.get(field):
+                self.logger.error("롤백 대상에 필수 필드가 없습니다: %s", field)
                 return False
-            
-            # 이미지 존재 확인
-            if not self._verify_image_exists(rollback_target['image_digest']):
-                self.logger.error("롤백 대상 이미지를 찾을 수 없습니다.")
-                return False
-            
-            self.logger.info("롤백 대상 검증 통과")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"롤백 대상 검증 실패: {str(e)}")
+        
+        # 이미지 존재 확인(네트워크)을 먼저 시작하고 그동안 다이제스트 형식 검증
+        image_digest = rollback_target['image_digest']
+        image_check = self._get_pool().submit(self._verify_image_exists, image_digest)
+        
+        if not self._is_valid_digest(image_digest):
+            image_check.cancel()
+            self.logger.error("롤백 대상의 다이제스트 형식이 잘못되었습니다.")
             return False
+        
+        if not image_check.result():
+            self.logger.error("롤백 대상 이미지를 찾을 수 없습니다.")
+            return False
+        
+        self.logger.info("롤백 대상 검증 통과")
+        return True
     
-    def _verify_image_exists(self, image_digest: str) -> bool:
-        """이미지 존재 확인"""
+    def close(self):
+        """검증용 스레드 풀 정리"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """검증용 스레드 풀 반환 (처음 사용할 때 생성)"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=4)
+        return self._pool
+    
+    def _is_valid_digest(self, digest: str) -> bool:
+        """다이제스트 형식 검증 (결과 재사용)"""
+        valid = self._digest_validity.get(digest)
+        if valid is None:
+            valid = self.release_manager.validate_digest(digest)
+            self._digest_validity[digest] = valid
+        return valid
+    
+    def _get_registry_credentials(self) -> Optional[Tuple[str, str]]:
+        """레지스트리 인증 정보 (환경 변수 → docker login 설정 순, 없으면 None으로 익명 토큰 사용)"""
+        username = os.environ.get('DOCKER_REGISTRY_USER') or os.environ.get('DOCKER_USERNAME')
+        password = os.environ.get('DOCKER_REGISTRY_PASS') or os.environ.get('DOCKER_PASSWORD')
+        if username and password:
+            return username, password
+        return self._get_docker_config_credentials()
+    
+    def _get_docker_config_credentials(self) -> Optional[Tuple[str, str]]:
+        """docker login이 config.json auths에 저장한 인증 정보 (credsStore/credHelpers 사용 시 None)"""
         try:
-            # Docker 레지스트리에서 이미지 존재 확인
-            registry = os.environ.get('DOCKER_REGISTRY', 'docker.io')
-            repo_hub = os.environ.get('DOCKER_REPO_HUB', 'mycompany')
+            with open(DOCKER_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                auths = json.load(f).get('auths') or {}
+        except (OSError, ValueError, AttributeError):
+            return None
+        
+        host = self._registry.partition('/')[0]
+        keys = [DOCKER_HUB_AUTH_KEY] if host in DOCKER_HUB_HOSTS else [host, f"https://{host}"]
+        for key in keys:
+            encoded = (auths.get(key) or {}).get('auth')
+            if not encoded:
+                continue
+            try:
+                username, _, password = base64.b64decode(encoded).decode('utf-8').partition(':')
+            except ValueError:
+                continue
+            if username and password:
+                return username, password
+        return None
+    
+    def _get_registry_token(self, challenge: str, repository: str) -> Optional[str]:
+        """WWW-Authenticate Bearer 챌린지에 따라 pull 토큰 발급"""
+        params = dict(AUTH_PARAM_PATTERN.findall(challenge))
+        realm = params.pop('realm', None)
+        if not realm:
+            return None
+        params.setdefault('scope', f"repository:{repository}:pull")
+        
+        response = _get_registry_session().get(
+            realm,
+            params=params,
+            auth=self._get_registry_credentials(),
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data.get('token') or data.get('access_token')
+    
+    def _head_manifest(self, image_digest: str) -> int:
+        """레지스트리 v2 API에 매니페스트 HEAD 요청을 보내고 상태 코드 반환 (본문은 받지 않음)"""
+        api_host, repository = self._registry_api_host, self._registry_repository
+        manifest_url = f"https://{api_host}/v2/{repository}/manifests/{quote(image_digest, safe=':')}"
+        
+        session = _get_registry_session()
+        headers = {'Accept': MANIFEST_ACCEPT}
+        auth = None
+        
+        token = self._registry_tokens.get(repository)
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        
+        response = session.head(manifest_url, headers=headers, timeout=10)
+        
+        # 인증이 필요하면 챌린지에 맞춰 토큰 발급(또는 Basic 인증) 후 한 번 더 요청
+        if response.status_code == 401:
+            challenge = response.headers.get('WWW-Authenticate', '')
+            if challenge.lower().startswith('bearer'):
+                token = self._get_registry_token(challenge, repository)
+                if token:
+                    self._registry_tokens[repository] = token
+                    headers['Authorization'] = f'Bearer {token}'
+            else:
+                headers.pop('Authorization', None)
+                auth = self._get_registry_credentials()
             
+            if token or auth:
+                response = session.head(manifest_url, headers=headers, auth=auth, timeout=10)
+        
+        # 인증 정보가 credential helper에만 있으면 docker CLI로 다시 확인
+        if response.status_code in (401, 403):
+            return self._inspect_manifest_cli(image_digest, response.status_code)
+        
+        return response.status_code
+    
+    def _inspect_manifest_cli(self, image_digest: str, status_code: int) -> int:
+        """docker manifest inspect로 이미지 확인 (docker login 인증 정보 사용)
+        
+        확인되면 200, 실패하면 레지스트리가 돌려준 상태 코드를 그대로 반환합니다.
+        """
+        image_ref = f"{self._image_ref_prefix}@{image_digest}"
+        try:
+            result = run_bounded(['docker', 'manifest', 'inspect', image_ref], timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.debug("docker manifest inspect 실패: %s - %s", image_ref, e)
+            return status_code
+        
+        return 200 if result.returncode == 0 else status_code
+    
+    def _verify_image_exists(self, image_digest: str) -> bool:
+        """이미지 존재 확인
+        
+        레지스트리 v2 API에 매니페스트 HEAD 요청을 보내 본문 없이 존재 여부만 확인합니다.
+        """
+        try:
             # 다이제스트로 이미지 참조
-            image_ref = f"{registry}/{repo_hub}/app@{image_digest}"
-            
-            # docker manifest inspect로 이미지 존재 확인
-            result = subprocess.run(
-                ['docker', 'manifest', 'inspect', image_ref],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            image_ref = f"{self._image_ref_prefix}@{image_digest}"
             
-            if result.returncode == 0:
-                self.logger.info(f"롤백 이미지 존재 확인: {image_ref}")
+            # 이미 확인한 다이제스트면 레지스트리에 다시 묻지 않음
+            if self._manifest_cache.get(image_ref) == 'ok':
+                self.logger.info("롤백 이미지 존재 확인 (캐시): %s", image_ref)
+                return True
+            
+            status_code = self._head_manifest(image_digest)
+            
+            if status_code == 200:
+                self._manifest_cache.put(image_ref, True)
+                self.logger.info("롤백 이미지 존재 확인: %s", image_ref)
                 return True
             else:
-                self.logger.error(f"롤백 이미지 존재하지 않음: {image_ref}")
+                self.logger.error("롤백 이미지 존재하지 않음: %s (HTTP %s)", image_ref, status_code)
                 return False
                 
-        except subprocess.TimeoutExpired:
+        except requests.Timeout:
             self.logger.error("이미지 존재 확인 시간 초과")
             return False
         except Exception as e:
-            self.logger.error(f"이미지 존재 확인 실패: {str(e)}")
+            self.logger.error("이미지 존재 확인 실패: %s", e)
+            return False
+    
+    def _is_pullable(self, image_digest: str) -> bool:
+        """롤백 후보 이미지를 받을 수 있는지 확인 (실패는 DEBUG로만 기록)"""
+        if not self._is_valid_digest(image_digest):
+            return False
+        
+        image_ref = f"{self._image_ref_prefix}@{image_digest}"
+        if self._manifest_cache.get(image_ref) == 'ok':
+            return True
+        
+        try:
+            status_code = self._head_manifest(image_digest)
+        except Exception as e:
+            self.logger.debug("이미지 확인 실패: %s - %s", image_ref, e)
+            return False
+        
+        if status_code != 200:
+            self.logger.debug("이미지 없음: %s (HTTP %s)", image_ref, status_code)
             return False
+        
+        self._manifest_cache.put(image_ref, True)
+        return True
+    
+    def _run_compose(self, args: List[str], timeout: int) -> int:
+        """docker compose 실행 (출력은 모아두지 않고 한 줄씩 로깅), 종료 코드 반환
+        
+        Raises:
+            subprocess.TimeoutExpired: 제한 시간 초과 (프로세스는 종료됨)
+        """
+        proc = subprocess.Popen(
+            ['docker', 'compose'] + args,
+            cwd=self.project_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            start_new_session=True
+        )
+        
+        def log_output():
+            with proc.stdout:
+                for line in proc.stdout:
+                    self.logger.info("[compose] %s", line.rstrip())
+        
+        reader = threading.Thread(target=log_output, daemon=True)
+        reader.start()
+        
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # docker compose가 띄운 자식 프로세스까지 그룹 단위로 종료
+            terminate_process_group(proc, kill_grace=2)
+            raise
+        
+        reader.join(timeout=5)
+        return returncode
     
     def _stop_current_services(self) -> bool:
         """현재 서비스 중지"""
@@ -188,30 +522,25 @@ class RollbackManager:
             self.logger.info("현재 서비스 중지")
             
             # Docker Compose로 서비스 중지
-            result = subprocess.run(
-                ['docker', 'compose', 'down'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=120
-            )
+            returncode = self._run_compose(['down'], timeout=120)
             
-            if result.returncode == 0:
+            if returncode == 0:
                 self.logger.info("현재 서비스 중지 완료")
                 return True
             else:
-                self.logger.error(f"서비스 중지 실패: {result.stderr}")
+                self.logger.error("서비스 중지 실패 (exit code: %s)", returncode)
                 return False
                 
         except subprocess.TimeoutExpired:
             self.logger.error("서비스 중지 시간 초과")
             return False
-        except Exception as e:
-            self.logger.error(f"서비스 중지 실패: {str(e)}")
-            return False
     
     def _deploy_rollback_image(self, rollback_target: Dict) -> bool:
-        """롤백 이미지 배포"""
+        """롤백 이미지 배포
+        
+        이미지가 바뀐 앱 서비스만 다시 만들고 나머지 서비스(DB, 프록시 등)는 그대로 둡니다.
+        실패하면 전체 서비스를 내렸다가 다시 올립니다.
+        """
         try:
             self.logger.info("롤백 이미지 배포 시작")
             
@@ -219,82 +548,87 @@ class RollbackManager:
             os.environ['ROLLBACK_IMAGE_DIGEST'] = rollback_target['image_digest']
             os.environ['ROLLBACK_IMAGE_TAG'] = rollback_target['image_tag']
             
+            # 다이제스트로 이미지 참조
+            image_ref = f"{self._image_ref_prefix}@{rollback_target['image_digest']}"
+            
             # Docker Compose 파일에서 이미지를 다이제스트로 참조하도록 수정
-            if not self._update_compose_for_rollback(rollback_target):
+            if not self._update_compose_for_rollback(rollback_target, image_ref):
                 self.logger.error("Docker Compose 파일 업데이트 실패")
                 return False
             
-            # Docker Compose로 서비스 시작
-            result = subprocess.run(
-                ['docker', 'compose', 'up', '-d', '--remove-orphans'],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
+            # 앱 서비스만 새 이미지로 교체
+            compose_service = os.environ.get('COMPOSE_SERVICE', 'app')
+            returncode = self._run_compose(
+                ['up', '-d', '--remove-orphans', '--force-recreate', '--no-deps', compose_service],
                 timeout=300
             )
             
-            if result.returncode == 0:
+            if returncode != 0:
+                self.logger.warning("%s 서비스 교체 실패, 전체 서비스를 재시작합니다.", compose_service)
+                if not self._stop_current_services():
+                    return False
+                returncode = self._run_compose(['up', '-d', '--remove-orphans'], timeout=300)
+            
+            if returncode == 0:
                 self.logger.info("롤백 이미지 배포 완료")
                 return True
             else:
-                self.logger.error(f"롤백 이미지 배포 실패: {result.stderr}")
+                self.logger.error("롤백 이미지 배포 실패 (exit code: %s)", returncode)
                 return False
                 
         except subprocess.TimeoutExpired:
             self.logger.error("롤백 이미지 배포 시간 초과")
             return False
-        except Exception as e:
-            self.logger.error(f"롤백 이미지 배포 실패: {str(e)}")
-            return False
     
-    def _update_compose_for_rollback(self, rollback_target: Dict) -> bool:
-        """롤백을 위한 Docker Compose 파일 업데이트"""
-        try:
-            # 실제 구현에서는 Docker Compose 파일을 동적으로 수정하거나
-            # 환경 변수를 통해 이미지를 지정할 수 있도록 구성
-            
-            # 여기서는 환경 변수를 통한 방식 사용
-            registry = os.environ.get('DOCKER_REGISTRY', 'docker.io')
-            repo_hub = os.environ.get('DOCKER_REPO_HUB', 'mycompany')
-            
-            # 다이제스트로 이미지 참조
-            rollback_image = f"{registry}/{repo_hub}/app@{rollback_target['image_digest']}"
-            
-            # 환경 변수에 롤백 이미지 설정
-            os.environ['DEPLOY_IMAGE'] = rollback_image
-            
-            self.logger.info(f"롤백 이미지 설정: {rollback_image}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Docker Compose 파일 업데이트 실패: {str(e)}")
-            return False
+    def _update_compose_for_rollback(self, rollback_target: Dict, image_ref: str) -> bool:
+        """롤백을 위한 Docker Compose 파일 업데이트 (image_ref: 호출자가 만든 다이제스트 참조)"""
+        # 실제 구현에서는 Docker Compose 파일을 동적으로 수정하거나
+        # 환경 변수를 통해 이미지를 지정할 수 있도록 구성
+        
+        # 여기서는 환경 변수를 통한 방식 사용
+        os.environ['DEPLOY_IMAGE'] = image_ref
+        
+        self.logger.info("롤백 이미지 설정: %s (배포 ID: %s)", image_ref, rollback_target['deployment_id'])
+        return True
     
     def _verify_rollback_health(self) -> bool:
         """롤백 후 헬스 체크"""
         try:
             self.logger.info("롤백 후 헬스 체크 시작")
             
-            # post_deploy.py 스크립트를 사용하여 헬스 체크
-            post_deploy_script = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)),
-                'post_deploy.py'
-            )
+            # 같은 프로세스에서 헬스 체크 (인터프리터 기동 생략, 레지스트리 확인에 쓴 HTTP 세션 재사용)
+            try:
+                from post_deploy import run_health_check
+            except ImportError:
+                run_health_check = None
+            
+            if run_health_check is not None:
+                if run_health_check(
+                    self.environment,
+                    self.service_kind,
+                    max_retries=3,
+                    retry_delay=20,
+                    session=_get_registry_session()
+                ):
+                    self.logger.info("롤백 후 헬스 체크 성공")
+                    return True
+                else:
+                    self.logger.error("롤백 후 헬스 체크 실패")
+                    return False
             
-            if not os.path.exists(post_deploy_script):
+            # 모듈을 가져올 수 없으면 post_deploy.py 스크립트를 별도 프로세스로 실행
+            if not POST_DEPLOY_EXISTS:
                 self.logger.error("post_deploy.py 스크립트를 찾을 수 없습니다.")
                 return False
             
             # 헬스 체크 실행 (자동 롤백 비활성화)
-            result = subprocess.run(
+            result = run_bounded(
                 [
-                    'python', post_deploy_script,
+                    'python', POST_DEPLOY_SCRIPT,
                     self.environment, self.service_kind,
                     '--max-retries', '3',
                     '--retry-delay', '20'
                 ],
-                capture_output=True,
-                text=True,
                 timeout=300
             )
             
@@ -302,14 +636,14 @@ class RollbackManager:
                 self.logger.info("롤백 후 헬스 체크 성공")
                 return True
             else:
-                self.logger.error(f"롤백 후 헬스 체크 실패: {result.stderr}")
+                self.logger.error("롤백 후 헬스 체크 실패: %s", result.stderr)
                 return False
                 
         except subprocess.TimeoutExpired:
             self.logger.error("롤백 후 헬스 체크 시간 초과")
             return False
         except Exception as e:
-            self.logger.error(f"롤백 후 헬스 체크 실패: {str(e)}")
+            self.logger.error("롤백 후 헬스 체크 실패: %s", e)
             return False
     
     def _finalize_rollback(self, rollback_target: Dict):
@@ -323,6 +657,9 @@ class RollbackManager:
                 'rollback_version': rollback_target.get('version', 'unknown'),
             }
             
+            if self.slack_notifier is None:
+                self.slack_notifier = SlackNotifier()
+            
             self.slack_notifier.send_rollback_notification(
                 rollback_info,
                 rollback_target['image_digest']
@@ -331,47 +668,72 @@ class RollbackManager:
             self.logger.info("롤백 완료 알림 전송")
             
         except Exception as e:
-            self.logger.error(f"롤백 완료 처리 실패: {str(e)}")
+            self.logger.error("롤백 완료 처리 실패: %s", e)
     
-    def list_rollback_candidates(self) -> list:
-        """롤백 가능한 배포 목록 조회"""
+    def list_rollback_candidates(self,
+                                 verify_pullable: bool = False,
+                                 since: Optional[datetime] = None,
+                                 limit: int = 10) -> list:
+        """롤백 가능한 배포 목록 조회
+        
+        verify_pullable=True이면 레지스트리에 이미지가 남아있는 후보만 반환합니다
+        (매니페스트 HEAD 요청을 병렬로 보내고 HTTP 연결은 공유 세션에서 재사용).
+        since를 지정하면 그 이후 배포만 조회합니다.
+        """
         try:
             candidates = self.release_manager.list_deployments(
                 service_kind=self.service_kind,
                 environment=self.environment,
                 status='success',
-                limit=10
+                limit=limit,
+                since=since
             )
             
-            self.logger.info(f"롤백 가능한 배포 {len(candidates)}개 조회")
+            if verify_pullable and candidates:
+                with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+                    pullable = list(executor.map(
+                        lambda candidate: self._is_pullable(candidate.get('image_digest')),
+                        candidates
+                    ))
+                candidates = [candidate for candidate, ok in zip(candidates, pullable) if ok]
+            
+            self.logger.info("롤백 가능한 배포 %s개 조회", len(candidates))
             return candidates
             
         except Exception as e:
-            self.logger.error(f"롤백 후보 조회 실패: {str(e)}")
+            self.logger.error("롤백 후보 조회 실패: %s", e)
             return []
     
     def dry_run_rollback(self, target_deployment_id: str = None) -> bool:
         """롤백 시뮬레이션 (실제 실행 없이 검증만)"""
-        try:
-            self.logger.info("롤백 시뮬레이션 시작")
-            
-            # 1. 롤백 대상 결정
-            rollback_target = self._determine_rollback_target(target_deployment_id)
-            if not rollback_target:
-                self.logger.error("롤백 대상을 찾을 수 없습니다.")
-                return False
-            
-            # 2. 롤백 대상 검증
-            if not self._validate_rollback_target(rollback_target):
-                self.logger.error("롤백 대상 검증 실패")
-                return False
-            
-            self.logger.info(f"롤백 시뮬레이션 성공: {rollback_target['deployment_id']}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"롤백 시뮬레이션 실패: {str(e)}")
+        self.logger.info("롤백 시뮬레이션 시작")
+        
+        # 1. 롤백 대상 결정
+        rollback_target = self._determine_rollback_target(target_deployment_id)
+        if not rollback_target:
+            self.logger.error("롤백 대상을 찾을 수 없습니다.")
             return False
+        
+        # 2. 롤백 대상 검증
+        if not self._validate_rollback_target(rollback_target):
+            self.logger.error("롤백 대상 검증 실패")
+            return False
+        
+        self.logger.info("롤백 시뮬레이션 성공: %s", rollback_target['deployment_id'])
+        return True
+
+
+def parse_since(value: str) -> datetime:
+    """--since 값 파싱 (기간: 30m/12h/7d/2w, 또는 ISO 날짜/시각)"""
+    match = SINCE_PATTERN.match(value.strip())
+    if match:
+        amount, unit = match.groups()
+        return datetime.now() - timedelta(**{SINCE_UNITS[unit]: int(amount)})
+    
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"잘못된 --since 형식: {value} (예: 7d, 12h, 2024-01-31)")
 
 
 def main():
@@ -400,6 +762,18 @@ def main():
         help='롤백 가능한 배포 목록 조회'
     )
     
+    parser.add_argument(
+        '--verify-pullable',
+        action='store_true',
+        help='--list-candidates와 함께 사용: 레지스트리에 이미지가 남아있는 후보만 표시'
+    )
+    
+    parser.add_argument(
+        '--since',
+        type=parse_since,
+        help='--list-candidates와 함께 사용: 이 기간/시각 이후 배포만 표시 (예: 7d, 12h, 2024-01-31)'
+    )
+    
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -413,15 +787,19 @@ def main():
     os.environ['SERVICE_KIND'] = args.service_kind
     
     # 로거 초기화
-    logger = Logger("rollback")
+    logger = Logger.get_logger("rollback")
     
+    rollback_manager = None
     try:
         # RollbackManager 초기화
         rollback_manager = RollbackManager(args.environment, args.service_kind)
         
         if args.list_candidates:
             # 롤백 후보 목록 조회
-            candidates = rollback_manager.list_rollback_candidates()
+            candidates = rollback_manager.list_rollback_candidates(
+                verify_pullable=args.verify_pullable,
+                since=args.since
+            )
             
             print(f"롤백 가능한 배포 목록 ({len(candidates)}개):")
             for candidate in candidates:
@@ -450,9 +828,12 @@ def main():
                 sys.exit(1)
         
     except Exception as e:
-        logger.error(f"롤백 프로세스 중 예외 발생: {str(e)}")
+        logger.error("롤백 프로세스 중 예외 발생: %s", e)
         print(f"ERROR: {str(e)}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if rollback_manager is not None:
+            rollback_manager.close()
 
 
 if __name__ == "__main__":
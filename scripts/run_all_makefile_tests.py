@@ -7,12 +7,45 @@ Makefile 통합 테스트 실행기
 
 import os
 import sys
+import shutil
 import subprocess
-import json
+import re
 import time
-from typing import Dict, List, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 
+# 현재 스크립트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils import json_dumps, json_loads, terminate_process_group
+
+
+# 테스트 스크립트가 --inline-report로 출력하는 보고서 블록
+INLINE_REPORT_START = "---REPORT---"
+INLINE_REPORT_END = "---END---"
+INLINE_REPORT_PATTERN = re.compile(r'---REPORT---\n(.*?)\n---END---', re.S)
+
+
+def _load_report_file(path: Path) -> Optional[Any]:
+    """보고서 파일 로드 (빈 파일이면 None)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return json_loads(data) if data else None
+
+
+def _extract_inline_report(output: str) -> Optional[Dict[str, Any]]:
+    """출력에서 보고서 블록을 찾아 파싱 (없거나 잘못된 JSON이면 None)"""
+    match = INLINE_REPORT_PATTERN.search(output)
+    if not match:
+        return None
+    try:
+        return json_loads(match.group(1))
+    except ValueError:
+        return None
+
+
 class MakefileTestSuite:
     """Makefile 테스트 스위트"""
     
@@ -21,12 +54,28 @@ class MakefileTestSuite:
         self.scripts_dir = self.project_root / "scripts"
         self.test_results = {}
         self.overall_results = []
+        # 스위트를 병렬로 실행할 때 test_results 갱신 보호
+        self._results_lock = threading.Lock()
         
     def log(self, level: str, message: str):
         """로그 출력"""
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] [{level}] {message}")
         
+    @staticmethod
+    def _drain_output(stream, log_file, report_lines: List[str]):
+        """자식 프로세스 출력을 로그 파일로 옮기면서 보고서 블록 줄만 따로 보관"""
+        in_report = False
+        for line in stream:
+            log_file.write(line)
+            if line.rstrip('\n') == INLINE_REPORT_START:
+                in_report = True
+                report_lines.clear()
+            if in_report:
+                report_lines.append(line)
+                if line.rstrip('\n') == INLINE_REPORT_END:
+                    in_report = False
+    
     def run_test_script(self, script_name: str, report_name: str) -> bool:
         """개별 테스트 스크립트 실행"""
         script_path = self.scripts_dir / script_name
@@ -37,36 +86,59 @@ class MakefileTestSuite:
             
         self.log("INFO", f"테스트 스크립트 실행: {script_name}")
         
+        # 출력은 메모리에 모으지 않고 스위트별 로그 파일로 바로 기록
+        log_path = self.project_root / f"{script_path.stem}.log"
+        
         try:
-            result = subprocess.run(
-                [sys.executable, str(script_path), "--report", report_name],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5분 타임아웃
-            )
+            with open(log_path, 'w', encoding='utf-8') as log_file:
+                proc = subprocess.Popen(
+                    [sys.executable, str(script_path), "--report", report_name, "--inline-report"],
+                    cwd=self.project_root,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
+                    text=True,
+                    start_new_session=True
+                )
+                
+                report_lines = []
+                drain = threading.Thread(target=self._drain_output, args=(proc.stdout, log_file, report_lines), daemon=True)
+                drain.start()
+                
+                try:
+                    returncode = proc.wait(timeout=300)  # 5분 타임아웃
+                except subprocess.TimeoutExpired:
+                    # 시간 초과된 프로세스는 자식 프로세스까지 남겨두지 않고 종료
+                    terminate_process_group(proc, kill_grace=2)
+                    raise
+                finally:
+                    drain.join(timeout=5)
             
-            success = result.returncode == 0
+            success = returncode == 0
             
             if success:
                 self.log("SUCCESS", f"{script_name} 테스트 완료")
             else:
                 self.log("ERROR", f"{script_name} 테스트 실패")
-                self.log("ERROR", f"에러 출력: {result.stderr}")
+                self.log("ERROR", f"출력 로그: {log_path}")
                 
-            # 테스트 결과 로드
+            # 테스트 결과 로드 (출력의 보고서 블록 우선, 없으면 보고서 파일)
+            report_data = _extract_inline_report(''.join(report_lines))
             report_path = self.project_root / report_name
-            if report_path.exists():
+            if report_data is None and report_path.exists():
                 try:
-                    with open(report_path, 'r', encoding='utf-8') as f:
-                        self.test_results[script_name] = json.load(f)
+                    report_data = _load_report_file(report_path)
                 except Exception as e:
                     self.log("WARNING", f"테스트 보고서 로드 실패 ({script_name}): {e}")
+            
+            if report_data is not None:
+                with self._results_lock:
+                    self.test_results[script_name] = report_data
                     
             return success
             
         except subprocess.TimeoutExpired:
-            self.log("ERROR", f"{script_name} 테스트 시간 초과")
+            self.log("ERROR", f"{script_name} 테스트 시간 초과 (출력 로그: {log_path})")
             return False
         except Exception as e:
             self.log("ERROR", f"{script_name} 테스트 실행 중 예외: {e}")
@@ -91,36 +163,32 @@ class MakefileTestSuite:
         """통합 테스트"""
         self.log("INFO", "=== 통합 테스트 ===")
         
-        # 기본 시스템 요구사항 확인
+        # 기본 시스템 요구사항 확인 (버전 출력을 위해 프로세스를 띄우지 않고 PATH에서 실행 파일만 확인)
         checks = [
-            ("Make 설치 확인", ["make", "--version"]),
-            ("Python 설치 확인", [sys.executable, "--version"]),
-            ("Git 설치 확인", ["git", "--version"]),
+            ("Make 설치 확인", "make"),
+            ("Python 설치 확인", sys.executable),
+            ("Git 설치 확인", "git"),
         ]
         
         all_passed = True
         
-        for check_name, cmd in checks:
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    self.log("SUCCESS", f"{check_name}: {result.stdout.strip()}")
-                else:
-                    self.log("ERROR", f"{check_name} 실패")
-                    all_passed = False
-            except Exception as e:
-                self.log("ERROR", f"{check_name} 실행 실패: {e}")
+        for check_name, command in checks:
+            path = shutil.which(command)
+            if path:
+                self.log("SUCCESS", f"{check_name}: {path}")
+            else:
+                self.log("ERROR", f"{check_name} 실패")
                 all_passed = False
         
         # Makefile 존재 확인
         makefile_path = self.project_root / "Makefile"
-        if makefile_path.exists():
+        if makefile_path.is_file():
             self.log("SUCCESS", "Makefile 존재 확인")
         else:
             self.log("ERROR", "Makefile이 존재하지 않습니다")
             all_passed = False
             
-        # 필수 스크립트 존재 확인
+        # 필수 스크립트 존재 확인 (scripts 디렉토리를 한 번만 읽어 집합 차이로 확인)
         required_scripts = [
             "docker_manager.py",
             "fetch_secrets.py", 
@@ -131,52 +199,96 @@ class MakefileTestSuite:
             "utils.py"
         ]
         
+        try:
+            with os.scandir(self.scripts_dir) as it:
+                present_scripts = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            present_scripts = set()
+        
+        missing_scripts = set(required_scripts) - present_scripts
+        
         for script in required_scripts:
-            script_path = self.scripts_dir / script
-            if script_path.exists():
+            if script not in missing_scripts:
                 self.log("SUCCESS", f"스크립트 존재 확인: {script}")
-            else:
+        for script in required_scripts:
+            if script in missing_scripts:
                 self.log("ERROR", f"필수 스크립트 누락: {script}")
-                all_passed = False
+        
+        if missing_scripts:
+            all_passed = False
         
         return all_passed
     
-    def run_all_tests(self) -> bool:
-        """모든 테스트 실행"""
+    def _run_suite(self, suite_name: str, test_func: Callable[[], bool]) -> Dict[str, Any]:
+        """테스트 스위트 하나를 실행하고 결과 반환"""
+        try:
+            if test_func():
+                self.log("SUCCESS", f"{suite_name} 완료")
+                return {"suite": suite_name, "status": "PASS"}
+            else:
+                self.log("ERROR", f"{suite_name} 실패")
+                return {"suite": suite_name, "status": "FAIL"}
+        except Exception as e:
+            self.log("ERROR", f"{suite_name} 실행 중 예외: {e}")
+            return {"suite": suite_name, "status": "ERROR", "error": str(e)}
+    
+    def run_all_tests(self, sequential: bool = False) -> bool:
+        """모든 테스트 실행
+        
+        모든 스위트가 같은 프로젝트 트리에서 make를 실행하므로, 트리를 바꾸는 스위트
+        (make clean으로 .env.runtime을 지우는 기본 타겟 테스트, Makefile을 잘못된 구문으로
+        덮어쓰는 에러 처리 테스트)는 병렬 묶음이 끝난 뒤 하나씩 단독으로 실행합니다.
+        트리를 읽기만 하는 스위트만 동시에 실행하며, sequential=True이면 모두 하나씩 실행합니다.
+        """
         self.log("INFO", "Makefile 통합 테스트 시작")
         start_time = time.time()
         
+        # (스위트 이름, 실행 함수, 프로젝트 트리 변경 여부)
         test_suites = [
-            ("통합 테스트", self.run_integration_tests),
-            ("기본 Makefile 타겟 테스트", self.run_basic_makefile_tests),
-            ("환경 변수 검증 테스트", self.run_env_validation_tests),
-            ("에러 처리 테스트", self.run_error_handling_tests),
+            ("통합 테스트", self.run_integration_tests, False),
+            ("기본 Makefile 타겟 테스트", self.run_basic_makefile_tests, True),
+            ("환경 변수 검증 테스트", self.run_env_validation_tests, False),
+            ("에러 처리 테스트", self.run_error_handling_tests, True),
         ]
         
-        passed_suites = 0
-        failed_suites = 0
+        suite_results = {}
         
-        for suite_name, test_func in test_suites:
+        if sequential:
+            serial_suites = test_suites
+        else:
+            parallel_suites = [suite for suite in test_suites if not suite[2]]
+            serial_suites = [suite for suite in test_suites if suite[2]]
+            
+            self.log("INFO", f"트리를 읽기만 하는 테스트 스위트 {len(parallel_suites)}개 병렬 실행")
+            
+            # 각 스위트는 subprocess 대기가 대부분이므로 스레드로 충분
+            with ThreadPoolExecutor(max_workers=len(parallel_suites)) as executor:
+                futures = {
+                    executor.submit(self._run_suite, suite_name, test_func): suite_name
+                    for suite_name, test_func, _ in parallel_suites
+                }
+                for future in as_completed(futures):
+                    suite_results[futures[future]] = future.result()
+            
+            print()  # 빈 줄 추가
+        
+        # 트리를 바꾸는 스위트는 다른 스위트와 겹치지 않도록 하나씩 실행
+        for suite_name, test_func, _ in serial_suites:
             self.log("INFO", f"\n{'='*60}")
             self.log("INFO", f"테스트 스위트: {suite_name}")
             self.log("INFO", f"{'='*60}")
             
-            try:
-                if test_func():
-                    passed_suites += 1
-                    self.overall_results.append({"suite": suite_name, "status": "PASS"})
-                    self.log("SUCCESS", f"{suite_name} 완료")
-                else:
-                    failed_suites += 1
-                    self.overall_results.append({"suite": suite_name, "status": "FAIL"})
-                    self.log("ERROR", f"{suite_name} 실패")
-            except Exception as e:
-                failed_suites += 1
-                self.overall_results.append({"suite": suite_name, "status": "ERROR", "error": str(e)})
-                self.log("ERROR", f"{suite_name} 실행 중 예외: {e}")
+            suite_results[suite_name] = self._run_suite(suite_name, test_func)
             
             print()  # 빈 줄 추가
         
+        # 완료 순서와 관계없이 스위트 정의 순서대로 기록
+        for suite_name, _, _ in test_suites:
+            self.overall_results.append(suite_results[suite_name])
+        
+        passed_suites = len([r for r in suite_results.values() if r["status"] == "PASS"])
+        failed_suites = len(test_suites) - passed_suites
+        
         end_time = time.time()
         duration = end_time - start_time
         
@@ -228,8 +340,8 @@ class MakefileTestSuite:
             "recommendations": self.generate_recommendations()
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(comprehensive_report, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(json_dumps(comprehensive_report, indent=True))
             
         self.log("INFO", f"종합 테스트 보고서 저장: {output_file}")
         
@@ -263,35 +375,38 @@ class MakefileTestSuite:
         return recommendations
     
     def generate_text_summary(self, report: Dict[str, Any], output_file: str):
-        """텍스트 형태의 요약 보고서 생성"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("Makefile 테스트 결과 요약\n")
-            f.write("=" * 50 + "\n\n")
+        """텍스트 형태의 요약 보고서 생성 (문자열로 모아 한 번에 기록)"""
+        summary = report['overall_summary']
+        parts = [
+            "Makefile 테스트 결과 요약\n",
+            "=" * 50 + "\n\n",
             
-            f.write(f"테스트 실행 시간: {report['timestamp']}\n")
-            f.write(f"프로젝트 루트: {report['project_root']}\n\n")
+            f"테스트 실행 시간: {report['timestamp']}\n",
+            f"프로젝트 루트: {report['project_root']}\n\n",
             
             # 전체 요약
-            summary = report['overall_summary']
-            f.write("전체 요약:\n")
-            f.write(f"  - 테스트 스위트: {summary['total_test_suites']}개\n")
-            f.write(f"  - 통과한 스위트: {summary['passed_suites']}개\n")
-            f.write(f"  - 실패한 스위트: {summary['failed_suites']}개\n")
-            f.write(f"  - 개별 테스트: {summary['total_individual_tests']}개\n")
-            f.write(f"  - 통과한 테스트: {summary['total_passed_tests']}개\n")
-            f.write(f"  - 실패한 테스트: {summary['total_failed_tests']}개\n\n")
+            "전체 요약:\n",
+            f"  - 테스트 스위트: {summary['total_test_suites']}개\n",
+            f"  - 통과한 스위트: {summary['passed_suites']}개\n",
+            f"  - 실패한 스위트: {summary['failed_suites']}개\n",
+            f"  - 개별 테스트: {summary['total_individual_tests']}개\n",
+            f"  - 통과한 테스트: {summary['total_passed_tests']}개\n",
+            f"  - 실패한 테스트: {summary['total_failed_tests']}개\n\n",
             
             # 스위트별 결과
-            f.write("스위트별 결과:\n")
-            for suite in report['test_suites']:
-                status_icon = "✓" if suite['status'] == "PASS" else "✗"
-                f.write(f"  {status_icon} {suite['suite']}: {suite['status']}\n")
-            f.write("\n")
-            
-            # 권장사항
-            f.write("권장사항:\n")
-            for i, rec in enumerate(report['recommendations'], 1):
-                f.write(f"  {i}. {rec}\n")
+            "스위트별 결과:\n",
+        ]
+        for suite in report['test_suites']:
+            status_icon = "✓" if suite['status'] == "PASS" else "✗"
+            parts.append(f"  {status_icon} {suite['suite']}: {suite['status']}\n")
+        parts.append("\n")
+        
+        # 권장사항
+        parts.append("권장사항:\n")
+        for i, rec in enumerate(report['recommendations'], 1):
+            parts.append(f"  {i}. {rec}\n")
+        
+        Path(output_file).write_bytes(''.join(parts).encode('utf-8'))
         
         self.log("INFO", f"텍스트 요약 보고서 저장: {output_file}")
 
@@ -306,6 +421,8 @@ def main():
                        default="comprehensive_makefile_test_report.json")
     parser.add_argument("--quick", action="store_true", 
                        help="빠른 테스트만 실행 (에러 처리 테스트 제외)")
+    parser.add_argument("--sequential", action="store_true",
+                       help="테스트 스위트를 병렬 대신 순차 실행 (디버깅용)")
     
     args = parser.parse_args()
     
@@ -313,7 +430,7 @@ def main():
     test_suite = MakefileTestSuite(args.project_root)
     
     try:
-        success = test_suite.run_all_tests()
+        success = test_suite.run_all_tests(sequential=args.sequential)
         test_suite.generate_comprehensive_report(args.report)
         
         sys.exit(0 if success else 1)
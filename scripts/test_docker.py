@@ -3,131 +3,108 @@
 Docker 관련 기능 단위 테스트
 """
 
+import io
 import os
 import sys
-import unittest
-import tempfile
-import shutil
 import json
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
-# 현재 스크립트 디렉토리를 Python 경로에 추가
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
 from docker_manager import DockerImageManager
-from release_manager import ReleaseManager
 
 
-class TestDockerImageManager(unittest.TestCase):
-    """DockerImageManager 테스트"""
+def _seed_record(releases_dir: str, timestamp: str, service_kind: str, environment: str,
+                 status: str = 'success', **fields) -> str:
+    """배포 기록 파일을 직접 작성 (조회 로직만 검증하는 테스트용, create_deployment_record 생략)"""
+    deployment_id = f"{timestamp}-{service_kind}-{environment}"
+    record = {
+        'deployment_id': deployment_id,
+        'timestamp': timestamp,
+        'service_kind': service_kind,
+        'environment': environment,
+        'status': status,
+        **fields
+    }
+    with open(os.path.join(releases_dir, f"{deployment_id}.json"), 'w') as f:
+        json.dump(record, f)
+    return deployment_id
+
+
+class TestDockerImageManager:
+    """DockerImageManager 테스트 (fixture: conftest.py)"""
     
-    def setUp(self):
-        """테스트 설정"""
-        self.manager = DockerImageManager(registry='test.registry.com', repo_hub='test-hub')
+    @pytest.fixture(autouse=True)
+    def _setup(self, docker_manager):
+        """테스트 설정 (subprocess.run은 클래스 전체에서 하나의 patch로 대체)"""
+        self.manager = docker_manager
+        # 세션 동안 공유하는 인스턴스이므로 캐시된 Git SHA는 테스트마다 초기화
+        self.manager._git_sha = None
+        with patch('subprocess.run') as mock_run:
+            self.mock_run = mock_run
+            yield
     
     def test_generate_image_tag(self):
         """이미지 태그 생성 테스트"""
-        with patch('docker_manager.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = '20250128'
-            
-            tag = self.manager.generate_image_tag(
-                image_name='test-app',
-                service_kind='fe',
-                version='v1.0.0',
-                branch='main',
-                commit_sha='abcd1234567890'
-            )
-            
-            expected = 'test.registry.com/test-hub/test-app:fe-v1.0.0-main-20250128-abcd1234'
-            self.assertEqual(tag, expected)
-    
-    def test_clean_branch_name(self):
-        """브랜치명 정리 테스트"""
-        # 슬래시가 있는 브랜치
-        result = self.manager._clean_branch_name('feature/user-auth')
-        self.assertEqual(result, 'feature-user-auth')
-        
-        # 특수문자가 있는 브랜치
-        result = self.manager._clean_branch_name('hotfix/bug#123')
-        self.assertEqual(result, 'hotfix-bug123')
+        manager = DockerImageManager(
+            registry='test.registry.com',
+            repo_hub='test-hub',
+            clock=lambda: datetime(2025, 1, 28, 14, 30)
+        )
         
-        # 연속된 하이픈
-        result = self.manager._clean_branch_name('feature--test')
-        self.assertEqual(result, 'feature-test')
+        tag = manager.generate_image_tag(
+            image_name='test-app',
+            service_kind='fe',
+            version='v1.0.0',
+            branch='main',
+            commit_sha='abcd1234567890'
+        )
         
-        # 앞뒤 하이픈
-        result = self.manager._clean_branch_name('-feature-')
-        self.assertEqual(result, 'feature')
+        expected = 'test.registry.com/test-hub/test-app:fe-v1.0.0-main-20250128_143000-abcd1234'
+        assert tag == expected
+    
+    @pytest.mark.parametrize("branch, expected", [
+        ('feature/user-auth', 'feature-user-auth'),  # 슬래시가 있는 브랜치
+        ('hotfix/bug#123', 'hotfix-bug123'),          # 특수문자가 있는 브랜치
+        ('feature--test', 'feature-test'),            # 연속된 하이픈
+        ('-feature-', 'feature'),                     # 앞뒤 하이픈
+    ])
+    def test_clean_branch_name(self, branch, expected):
+        """브랜치명 정리 테스트"""
+        assert self.manager._clean_branch_name(branch) == expected
     
-    @patch('subprocess.run')
-    def test_get_current_git_sha_success(self, mock_run):
+    def test_get_current_git_sha_success(self):
         """Git SHA 조회 성공 테스트"""
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = 'abcd1234567890abcd1234567890abcd12345678\n'
+        self.mock_run.return_value.returncode = 0
+        self.mock_run.return_value.stdout = 'abcd1234567890abcd1234567890abcd12345678\n'
         
         sha = self.manager._get_current_git_sha()
-        self.assertEqual(sha, 'abcd1234567890abcd1234567890abcd12345678')
+        assert sha == 'abcd1234567890abcd1234567890abcd12345678'
         
-        mock_run.assert_called_once_with(
+        self.mock_run.assert_called_once_with(
             ['git', 'rev-parse', 'HEAD'],
             capture_output=True,
             text=True,
             cwd=self.manager.project_root
         )
     
-    @patch('subprocess.run')
-    def test_get_current_git_sha_failure(self, mock_run):
+    def test_get_current_git_sha_failure(self):
         """Git SHA 조회 실패 테스트"""
-        mock_run.return_value.returncode = 1
+        self.mock_run.return_value.returncode = 1
         
         sha = self.manager._get_current_git_sha()
-        self.assertIsNone(sha)
+        assert sha is None
     
-    @patch('subprocess.run')
-    def test_build_image_success(self, mock_run):
-        """이미지 빌드 성공 테스트"""
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stderr = ''
-        
-        result = self.manager.build_image(
-            dockerfile_path='Dockerfile',
-            context_path='.',
-            image_tag='test:latest'
-        )
-        
-        self.assertTrue(result)
-        mock_run.assert_called_once()
-        
-        # 호출된 명령어 확인
-        called_args = mock_run.call_args[0][0]
-        self.assertIn('docker', called_args)
-        self.assertIn('build', called_args)
-        self.assertIn('test:latest', called_args)
-    
-    @patch('subprocess.run')
-    def test_build_image_failure(self, mock_run):
-        """이미지 빌드 실패 테스트"""
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stderr = 'Build failed'
-        
-        result = self.manager.build_image(
-            dockerfile_path='Dockerfile',
-            context_path='.',
-            image_tag='test:latest'
-        )
-        
-        self.assertFalse(result)
-    
-    @patch('subprocess.run')
-    def test_build_image_with_build_args(self, mock_run):
-        """빌드 인수가 있는 이미지 빌드 테스트"""
-        mock_run.return_value.returncode = 0
-        
-        build_args = {
-            'NODE_ENV': 'production',
-            'API_URL': 'https://api.example.com'
-        }
+    @pytest.mark.parametrize("returncode, stderr, build_args, expected", [
+        (0, '', None, True),
+        (1, 'Build failed', None, False),
+        (0, '', {'NODE_ENV': 'production', 'API_URL': 'https://api.example.com'}, True),
+    ], ids=['success', 'failure', 'with_build_args'])
+    def test_build_image(self, returncode, stderr, build_args, expected):
+        """이미지 빌드 테스트 (성공/실패/빌드 인수)"""
+        self.mock_run.return_value.returncode = returncode
+        self.mock_run.return_value.stderr = stderr
         
         result = self.manager.build_image(
             dockerfile_path='Dockerfile',
@@ -136,50 +113,56 @@ class TestDockerImageManager(unittest.TestCase):
             build_args=build_args
         )
         
-        self.assertTrue(result)
+        assert result == expected
+        if not expected:
+            return
+        
+        self.mock_run.assert_called_once()
+        
+        # 호출된 명령어 확인
+        called_args = self.mock_run.call_args[0][0]
+        assert 'docker' in called_args
+        assert 'build' in called_args
+        assert 'test:latest' in called_args
         
         # 빌드 인수가 명령어에 포함되었는지 확인
-        called_args = mock_run.call_args[0][0]
-        self.assertIn('--build-arg', called_args)
-        self.assertIn('NODE_ENV=production', called_args)
-        self.assertIn('API_URL=https://api.example.com', called_args)
+        for name, value in (build_args or {}).items():
+            assert '--build-arg' in called_args
+            assert f'{name}={value}' in called_args
     
     @patch('docker_manager.DockerImageManager._get_image_digest')
-    @patch('subprocess.run')
-    def test_push_image_success(self, mock_run, mock_get_digest):
+    def test_push_image_success(self, mock_get_digest):
         """이미지 푸시 성공 테스트"""
-        mock_run.return_value.returncode = 0
+        self.mock_run.return_value.returncode = 0
         mock_get_digest.return_value = 'sha256:abcd1234567890'
         
         digest = self.manager.push_image('test:latest')
         
-        self.assertEqual(digest, 'sha256:abcd1234567890')
-        mock_run.assert_called_once_with(
+        assert digest == 'sha256:abcd1234567890'
+        self.mock_run.assert_called_once_with(
             ['docker', 'push', 'test:latest'],
             capture_output=True,
             text=True
         )
     
-    @patch('subprocess.run')
-    def test_push_image_failure(self, mock_run):
+    def test_push_image_failure(self):
         """이미지 푸시 실패 테스트"""
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stderr = 'Push failed'
+        self.mock_run.return_value.returncode = 1
+        self.mock_run.return_value.stderr = 'Push failed'
         
         digest = self.manager.push_image('test:latest')
         
-        self.assertIsNone(digest)
+        assert digest is None
     
-    @patch('subprocess.run')
-    def test_get_image_digest(self, mock_run):
+    def test_get_image_digest(self):
         """이미지 다이제스트 조회 테스트"""
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = 'test.registry.com/test-hub/test:latest@sha256:abcd1234567890\n'
+        self.mock_run.return_value.returncode = 0
+        self.mock_run.return_value.stdout = 'test.registry.com/test-hub/test:latest@sha256:abcd1234567890\n'
         
         digest = self.manager._get_image_digest('test:latest')
         
-        self.assertEqual(digest, 'sha256:abcd1234567890')
-        mock_run.assert_called_once_with(
+        assert digest == 'sha256:abcd1234567890'
+        self.mock_run.assert_called_once_with(
             ['docker', 'inspect', '--format={{index .RepoDigests 0}}', 'test:latest'],
             capture_output=True,
             text=True
@@ -187,129 +170,126 @@ class TestDockerImageManager(unittest.TestCase):
     
     def test_validate_dockerfile_success(self):
         """Dockerfile 유효성 검사 성공 테스트"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dockerfile', delete=False) as f:
-            f.write('FROM node:16\nRUN npm install\nCMD ["npm", "start"]')
-            dockerfile_path = f.name
-        
-        try:
-            result = self.manager.validate_dockerfile(dockerfile_path)
-            self.assertTrue(result)
-        finally:
-            os.unlink(dockerfile_path)
+        stream = io.StringIO('FROM node:16\nRUN npm install\nCMD ["npm", "start"]')
+        assert self.manager._validate_dockerfile_stream(stream)
     
     def test_validate_dockerfile_no_from(self):
         """FROM 명령어가 없는 Dockerfile 테스트"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dockerfile', delete=False) as f:
-            f.write('RUN npm install\nCMD ["npm", "start"]')
-            dockerfile_path = f.name
-        
-        try:
-            result = self.manager.validate_dockerfile(dockerfile_path)
-            self.assertFalse(result)
-        finally:
-            os.unlink(dockerfile_path)
+        stream = io.StringIO('RUN npm install\nCMD ["npm", "start"]')
+        assert not self.manager._validate_dockerfile_stream(stream)
     
     def test_validate_dockerfile_not_exists(self):
         """존재하지 않는 Dockerfile 테스트"""
         result = self.manager.validate_dockerfile('/nonexistent/Dockerfile')
-        self.assertFalse(result)
+        assert not result
 
 
-class TestReleaseManager(unittest.TestCase):
-    """ReleaseManager 테스트"""
-    
-    def setUp(self):
-        """테스트 설정"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.manager = ReleaseManager()
-        # 테스트용 RELEASES 디렉토리 설정
-        self.manager.releases_dir = os.path.join(self.temp_dir, 'RELEASES')
-        os.makedirs(self.manager.releases_dir, exist_ok=True)
+class TestReleaseManager:
+    """ReleaseManager 테스트 (fixture: conftest.py, 임시 디렉토리는 pytest가 정리)"""
     
-    def tearDown(self):
-        """테스트 정리"""
-        shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _setup(self, manager):
+        """테스트 설정 (배포 ID 타임스탬프 고정)"""
+        self.manager = manager
+        self.manager.timestamp_fn = lambda: '20250128-143000'
     
     def test_create_deployment_record(self):
         """배포 기록 생성 테스트"""
-        with patch('release_manager.get_current_timestamp') as mock_timestamp:
-            mock_timestamp.return_value = '20250128-143000'
-            
-            deployment_id = self.manager.create_deployment_record(
-                source_repo='test/app',
-                ref='main',
-                version='v1.0.0',
-                service_kind='fe',
-                environment='prod',
-                image_tag='test:latest',
-                image_digest='sha256:abcd1234567890'
-            )
-            
-            expected_id = '20250128-143000-fe-prod'
-            self.assertEqual(deployment_id, expected_id)
-            
-            # 파일이 생성되었는지 확인
-            record_file = os.path.join(self.manager.releases_dir, f'{expected_id}.json')
-            self.assertTrue(os.path.exists(record_file))
-            
-            # 파일 내용 확인
-            with open(record_file, 'r') as f:
-                record = json.load(f)
-            
-            self.assertEqual(record['deployment_id'], expected_id)
-            self.assertEqual(record['source_repo'], 'test/app')
-            self.assertEqual(record['service_kind'], 'fe')
-            self.assertEqual(record['environment'], 'prod')
-            self.assertEqual(record['status'], 'in_progress')
+        deployment_id = self.manager.create_deployment_record(
+            source_repo='test/app',
+            ref='main',
+            version='v1.0.0',
+            service_kind='fe',
+            environment='prod',
+            image_tag='test:latest',
+            image_digest='sha256:abcd1234567890'
+        )
+        
+        expected_id = '20250128-143000-fe-prod'
+        assert deployment_id == expected_id
+        
+        # 파일이 생성되었는지 확인
+        record_file = os.path.join(self.manager.releases_dir, f'{expected_id}.json')
+        assert os.path.exists(record_file)
+        
+        # 파일 내용 확인
+        with open(record_file, 'r') as f:
+            record = json.load(f)
+        
+        assert record['deployment_id'] == expected_id
+        assert record['source_repo'] == 'test/app'
+        assert record['service_kind'] == 'fe'
+        assert record['environment'] == 'prod'
+        assert record['status'] == 'in_progress'
     
     def test_update_deployment_status(self):
         """배포 상태 업데이트 테스트"""
         # 먼저 배포 기록 생성
-        with patch('release_manager.get_current_timestamp') as mock_timestamp:
-            mock_timestamp.return_value = '20250128-143000'
-            
-            deployment_id = self.manager.create_deployment_record(
-                source_repo='test/app',
-                ref='main',
-                version='v1.0.0',
-                service_kind='fe',
-                environment='prod',
-                image_tag='test:latest',
-                image_digest='sha256:abcd1234567890'
-            )
+        deployment_id = self.manager.create_deployment_record(
+            source_repo='test/app',
+            ref='main',
+            version='v1.0.0',
+            service_kind='fe',
+            environment='prod',
+            image_tag='test:latest',
+            image_digest='sha256:abcd1234567890'
+        )
         
         # 상태 업데이트
         result = self.manager.update_deployment_status(deployment_id, 'success')
-        self.assertTrue(result)
+        assert result
         
         # 업데이트된 내용 확인
         record = self.manager.get_deployment_record(deployment_id)
-        self.assertEqual(record['status'], 'success')
+        assert record['status'] == 'success'
     
     def test_get_deployment_record(self):
         """배포 기록 조회 테스트"""
         # 배포 기록 생성
-        with patch('release_manager.get_current_timestamp') as mock_timestamp:
-            mock_timestamp.return_value = '20250128-143000'
-            
-            deployment_id = self.manager.create_deployment_record(
-                source_repo='test/app',
-                ref='main',
-                version='v1.0.0',
-                service_kind='fe',
-                environment='prod',
-                image_tag='test:latest',
-                image_digest='sha256:abcd1234567890'
-            )
+        deployment_id = self.manager.create_deployment_record(
+            source_repo='test/app',
+            ref='main',
+            version='v1.0.0',
+            service_kind='fe',
+            environment='prod',
+            image_tag='test:latest',
+            image_digest='sha256:abcd1234567890'
+        )
         
         # 기록 조회
         record = self.manager.get_deployment_record(deployment_id)
-        self.assertIsNotNone(record)
-        self.assertEqual(record['deployment_id'], deployment_id)
+        assert record is not None
+        assert record['deployment_id'] == deployment_id
         
         # 존재하지 않는 기록 조회
         non_existent = self.manager.get_deployment_record('nonexistent-id')
-        self.assertIsNone(non_existent)
+        assert non_existent is None
+    
+    def test_status_filter_after_failed_index_append(self):
+        """인덱스 추가 실패 후에도 상태 필터가 최신 상태를 반영하는지 테스트"""
+        deployment_id = self.manager.create_deployment_record(
+            source_repo='test/app',
+            ref='main',
+            version='v1.0.0',
+            service_kind='fe',
+            environment='prod',
+            image_tag='test:latest',
+            image_digest='sha256:abcd1234567890'
+        )
+        
+        # 상태 변경 시 인덱스 추가만 실패하도록 설정
+        real_open = open
+        
+        def failing_open(path, mode='r', *args, **kwargs):
+            if str(path) == self.manager.index_file and mode == 'ab':
+                raise OSError("disk full")
+            return real_open(path, mode, *args, **kwargs)
+        
+        with patch('builtins.open', side_effect=failing_open):
+            assert self.manager.update_deployment_status(deployment_id, 'success')
+        
+        success_deployments = self.manager.list_deployments(status='success')
+        assert [d['deployment_id'] for d in success_deployments] == [deployment_id]
     
     def test_list_deployments(self):
         """배포 기록 목록 조회 테스트"""
@@ -321,175 +301,97 @@ class TestReleaseManager(unittest.TestCase):
         ]
         
         for timestamp, service_kind, environment, status in deployments_data:
-            with patch('release_manager.get_current_timestamp') as mock_timestamp:
-                mock_timestamp.return_value = timestamp
-                
-                deployment_id = self.manager.create_deployment_record(
-                    source_repo='test/app',
-                    ref='main',
-                    version='v1.0.0',
-                    service_kind=service_kind,
-                    environment=environment,
-                    image_tag='test:latest',
-                    image_digest='sha256:abcd1234567890'
-                )
-                
-                # 상태 업데이트
-                self.manager.update_deployment_status(deployment_id, status)
+            _seed_record(self.manager.releases_dir, timestamp, service_kind, environment, status, version='v1.0.0')
         
         # 전체 목록 조회
         all_deployments = self.manager.list_deployments()
-        self.assertEqual(len(all_deployments), 3)
+        assert len(all_deployments) == 3
         
         # 서비스 종류별 필터링
         fe_deployments = self.manager.list_deployments(service_kind='fe')
-        self.assertEqual(len(fe_deployments), 2)
+        assert len(fe_deployments) == 2
         
         # 환경별 필터링
         prod_deployments = self.manager.list_deployments(environment='prod')
-        self.assertEqual(len(prod_deployments), 2)
+        assert len(prod_deployments) == 2
         
         # 상태별 필터링
         success_deployments = self.manager.list_deployments(status='success')
-        self.assertEqual(len(success_deployments), 2)
+        assert len(success_deployments) == 2
         
         # 제한 개수 적용
         limited_deployments = self.manager.list_deployments(limit=2)
-        self.assertEqual(len(limited_deployments), 2)
+        assert len(limited_deployments) == 2
+        
+        # 기간 필터링 (since 이후 배포만)
+        recent_deployments = self.manager.list_deployments(since=datetime(2025, 1, 28, 14, 31))
+        assert len(recent_deployments) == 2
     
     def test_get_latest_successful_deployment(self):
         """최신 성공 배포 조회 테스트"""
-        # 성공한 배포 기록들 생성
-        with patch('release_manager.get_current_timestamp') as mock_timestamp:
-            # 첫 번째 성공 배포
-            mock_timestamp.return_value = '20250128-143000'
-            deployment_id1 = self.manager.create_deployment_record(
-                source_repo='test/app', ref='main', version='v1.0.0',
-                service_kind='fe', environment='prod',
-                image_tag='test:v1.0.0', image_digest='sha256:abcd1234567890'
-            )
-            self.manager.update_deployment_status(deployment_id1, 'success')
-            
-            # 두 번째 성공 배포 (더 최신)
-            mock_timestamp.return_value = '20250128-143100'
-            deployment_id2 = self.manager.create_deployment_record(
-                source_repo='test/app', ref='main', version='v1.0.1',
-                service_kind='fe', environment='prod',
-                image_tag='test:v1.0.1', image_digest='sha256:efgh1234567890'
-            )
-            self.manager.update_deployment_status(deployment_id2, 'success')
+        # 첫 번째 성공 배포
+        deployment_id1 = _seed_record(self.manager.releases_dir, '20250128-143000', 'fe', 'prod', version='v1.0.0')
+        
+        # 두 번째 성공 배포 (더 최신)
+        deployment_id2 = _seed_record(self.manager.releases_dir, '20250128-143100', 'fe', 'prod', version='v1.0.1')
         
         # 최신 성공 배포 조회
         latest = self.manager.get_latest_successful_deployment('fe', 'prod')
-        self.assertIsNotNone(latest)
-        self.assertEqual(latest['deployment_id'], deployment_id2)
-        self.assertEqual(latest['version'], 'v1.0.1')
+        assert latest is not None
+        assert latest['deployment_id'] == deployment_id2
+        assert latest['version'] == 'v1.0.1'
     
     def test_get_rollback_target(self):
         """롤백 대상 조회 테스트"""
-        # 성공한 배포들 생성
-        with patch('release_manager.get_current_timestamp') as mock_timestamp:
-            # 첫 번째 성공 배포
-            mock_timestamp.return_value = '20250128-143000'
-            deployment_id1 = self.manager.create_deployment_record(
-                source_repo='test/app', ref='main', version='v1.0.0',
-                service_kind='fe', environment='prod',
-                image_tag='test:v1.0.0', image_digest='sha256:abcd1234567890'
-            )
-            self.manager.update_deployment_status(deployment_id1, 'success')
-            
-            # 두 번째 성공 배포 (현재 배포)
-            mock_timestamp.return_value = '20250128-143100'
-            deployment_id2 = self.manager.create_deployment_record(
-                source_repo='test/app', ref='main', version='v1.0.1',
-                service_kind='fe', environment='prod',
-                image_tag='test:v1.0.1', image_digest='sha256:efgh1234567890'
-            )
-            self.manager.update_deployment_status(deployment_id2, 'success')
+        # 첫 번째 성공 배포
+        deployment_id1 = _seed_record(self.manager.releases_dir, '20250128-143000', 'fe', 'prod', version='v1.0.0')
+        
+        # 두 번째 성공 배포 (현재 배포)
+        deployment_id2 = _seed_record(self.manager.releases_dir, '20250128-143100', 'fe', 'prod', version='v1.0.1')
         
         # 롤백 대상 조회 (현재 배포 제외)
         rollback_target = self.manager.get_rollback_target('fe', 'prod', deployment_id2)
-        self.assertIsNotNone(rollback_target)
-        self.assertEqual(rollback_target['deployment_id'], deployment_id1)
-        self.assertEqual(rollback_target['version'], 'v1.0.0')
+        assert rollback_target is not None
+        assert rollback_target['deployment_id'] == deployment_id1
+        assert rollback_target['version'] == 'v1.0.0'
     
-    def test_validate_digest(self):
-        """다이제스트 검증 테스트"""
+    @pytest.mark.parametrize("digest, expected", [
         # 유효한 다이제스트
-        valid_digest = 'sha256:abcd1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234'
-        self.assertTrue(self.manager.validate_digest(valid_digest))
-        
+        ('sha256:abcd1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234', True),
         # 잘못된 접두사
-        invalid_prefix = 'sha1:abcd1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234'
-        self.assertFalse(self.manager.validate_digest(invalid_prefix))
-        
+        ('sha1:abcd1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234', False),
         # 잘못된 길이
-        invalid_length = 'sha256:abcd1234'
-        self.assertFalse(self.manager.validate_digest(invalid_length))
-        
+        ('sha256:abcd1234', False),
         # 잘못된 문자
-        invalid_chars = 'sha256:ghij1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234'
-        self.assertFalse(self.manager.validate_digest(invalid_chars))
+        ('sha256:ghij1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234', False),
+    ], ids=['valid', 'invalid_prefix', 'invalid_length', 'invalid_chars'])
+    def test_validate_digest(self, digest, expected):
+        """다이제스트 검증 테스트"""
+        assert self.manager.validate_digest(digest) is expected
     
     def test_cleanup_old_records(self):
         """오래된 기록 정리 테스트"""
         # 여러 배포 기록 생성
-        deployment_ids = []
         for i in range(10):
-            with patch('release_manager.get_current_timestamp') as mock_timestamp:
-                mock_timestamp.return_value = f'20250128-14{i:02d}00'
-                
-                deployment_id = self.manager.create_deployment_record(
-                    source_repo='test/app',
-                    ref='main',
-                    version=f'v1.0.{i}',
-                    service_kind='fe',
-                    environment='prod',
-                    image_tag=f'test:v1.0.{i}',
-                    image_digest=f'sha256:abcd123456789{i:01d}'
-                )
-                deployment_ids.append(deployment_id)
+            _seed_record(self.manager.releases_dir, f'20250128-14{i:02d}00', 'fe', 'prod', version=f'v1.0.{i}')
         
         # 5개만 유지하도록 정리
         deleted_count = self.manager.cleanup_old_records(keep_count=5)
-        self.assertEqual(deleted_count, 5)
+        assert deleted_count == 5
         
         # 남은 기록 확인
         remaining_deployments = self.manager.list_deployments()
-        self.assertEqual(len(remaining_deployments), 5)
-
-
-def run_tests():
-    """테스트 실행"""
-    # 테스트 스위트 생성
-    test_suite = unittest.TestSuite()
-    
-    # 테스트 클래스들 추가
-    test_classes = [
-        TestDockerImageManager,
-        TestReleaseManager
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # 테스트 실행
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    return result.wasSuccessful()
+        assert len(remaining_deployments) == 5
 
 
 if __name__ == "__main__":
-    print("Docker 관련 기능 단위 테스트 실행")
-    print("=" * 50)
+    args = [__file__, "-v"]
     
-    success = run_tests()
+    # pytest-xdist가 있으면 병렬 실행
+    try:
+        import xdist  # noqa: F401
+        args += ["-n", "auto"]
+    except ImportError:
+        pass
     
-    if success:
-        print("\n✅ 모든 테스트가 성공했습니다!")
-        sys.exit(0)
-    else:
-        print("\n❌ 일부 테스트가 실패했습니다.")
-        sys.exit(1)
\ No newline at end of file
+    sys.exit(pytest.main(args))
@@ -368,8 +368,8 @@ class ErrorHandlingTester:
             
         return failed == 0
     
-    def save_test_report(self, output_file: str = "error_handling_test_report.json"):
-        """테스트 결과를 JSON 파일로 저장"""
+    def save_test_report(self, output_file: str = "error_handling_test_report.json", inline: bool = False):
+        """테스트 결과를 JSON 파일로 저장 (inline=True이면 파일 대신 표준 출력에 보고서 블록 출력)"""
         report = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "project_root": str(self.project_root),
@@ -382,6 +382,11 @@ class ErrorHandlingTester:
             }
         }
         
+        if inline:
+            # 통합 테스트 실행기가 출력에서 바로 읽도록 구분자로 감싼 한 줄 JSON 출력
+            print(f"---REPORT---\n{json.dumps(report, ensure_ascii=False)}\n---END---", flush=True)
+            return
+        
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(report, f, indent=2, ensure_ascii=False)
             
@@ -395,6 +400,8 @@ def main():
     parser = argparse.ArgumentParser(description="Makefile 에러 상황 처리 테스트")
     parser.add_argument("--project-root", help="프로젝트 루트 디렉토리")
     parser.add_argument("--report", help="테스트 보고서 파일명", default="error_handling_test_report.json")
+    parser.add_argument("--inline-report", action="store_true",
+                       help="보고서를 파일 대신 표준 출력에 출력 (통합 테스트 실행기용)")
     
     args = parser.parse_args()
     
@@ -403,7 +410,7 @@ def main():
     
     try:
         success = tester.run_all_tests()
-        tester.save_test_report(args.report)
+        tester.save_test_report(args.report, inline=args.inline_report)
         
         sys.exit(0 if success else 1)
         
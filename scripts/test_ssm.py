@@ -14,7 +14,7 @@ from typing import Dict
 # 현재 스크립트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils import SSMClient, Logger, load_env_file
+from utils import SSMClient, Logger, load_env_file, load_env_file_cached
 from fetch_secrets import SecretsFetcher
 
 
@@ -172,6 +172,28 @@ MIXED_QUOTES="value with 'inner' quotes"
         }
         self.assertEqual(result, expected)
 
+    
+    def test_load_env_file_cached(self):
+        """변경되지 않은 환경 파일 파싱 결과 재사용 테스트"""
+        env_file_path = os.path.join(self.temp_dir, '.env.cached')
+        with open(env_file_path, 'w') as f:
+            f.write('NODE_ENV=test\n')
+        
+        with patch('utils.load_env_file', wraps=load_env_file) as mock_load:
+            first = load_env_file_cached(env_file_path)
+            second = load_env_file_cached(env_file_path)
+            
+            self.assertEqual(first, {'NODE_ENV': 'test'})
+            self.assertEqual(second, first)
+            self.assertEqual(mock_load.call_count, 1)
+            
+            # 파일이 바뀌면 다시 파싱
+            with open(env_file_path, 'w') as f:
+                f.write('NODE_ENV=production\n')
+            
+            self.assertEqual(load_env_file_cached(env_file_path), {'NODE_ENV': 'production'})
+            self.assertEqual(mock_load.call_count, 2)
+
 
 class TestSecretsFetcher(unittest.TestCase):
     """SecretsFetcher 테스트"""
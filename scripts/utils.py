@@ -6,9 +6,14 @@ AWS SSM 클라이언트 관리, 로깅, 에러 처리 등을 제공합니다.
 
 import os
 import sys
+import json
 import logging
+import functools
 import time
-from typing import Dict, List, Optional
+import signal
+import subprocess
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 try:
@@ -20,10 +25,17 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("requests가 설치되지 않았습니다. pip install requests를 실행하세요.")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # 선택적 의존성: 없으면 표준 json 모듈 사용
+
 
 # 공통 상수 및 설정
 class Config:
@@ -105,6 +117,7 @@ class Logger:
     """로깅 설정 및 관리"""
     
     _loggers = {}  # 로거 인스턴스 캐시
+    _instances = {}  # get_logger로 만든 Logger 래퍼 캐시 ((이름, 레벨) → Logger)
     
     def __init__(self, name: str = "cicd-runner", level: Optional[str] = None):
         self.name = name
@@ -149,30 +162,34 @@ class Logger:
         
         return logger
     
-    def info(self, message: str) -> None:
-        """정보 로그"""
-        self.logger.info(message)
+    def info(self, message: str, *args) -> None:
+        """정보 로그 (args가 있으면 %-포맷 인자로 전달되어 출력될 때만 포맷)"""
+        self.logger.info(message, *args)
     
-    def error(self, message: str, exc_info: bool = False) -> None:
-        """에러 로그"""
-        self.logger.error(message, exc_info=exc_info)
+    def error(self, message: str, *args, exc_info: bool = False) -> None:
+        """에러 로그 (args가 있으면 %-포맷 인자로 전달되어 출력될 때만 포맷)"""
+        self.logger.error(message, *args, exc_info=exc_info)
     
-    def warning(self, message: str) -> None:
-        """경고 로그"""
-        self.logger.warning(message)
+    def warning(self, message: str, *args) -> None:
+        """경고 로그 (args가 있으면 %-포맷 인자로 전달되어 출력될 때만 포맷)"""
+        self.logger.warning(message, *args)
     
-    def debug(self, message: str) -> None:
-        """디버그 로그"""
-        self.logger.debug(message)
+    def debug(self, message: str, *args) -> None:
+        """디버그 로그 (args가 있으면 %-포맷 인자로 전달되어 출력될 때만 포맷)"""
+        self.logger.debug(message, *args)
     
-    def critical(self, message: str) -> None:
-        """치명적 에러 로그"""
-        self.logger.critical(message)
+    def critical(self, message: str, *args) -> None:
+        """치명적 에러 로그 (args가 있으면 %-포맷 인자로 전달되어 출력될 때만 포맷)"""
+        self.logger.critical(message, *args)
     
     @classmethod
     def get_logger(cls, name: str, level: Optional[str] = None) -> 'Logger':
-        """로거 인스턴스 반환 (팩토리 메서드)"""
-        return cls(name, level)
+        """로거 인스턴스 반환 (팩토리 메서드, 같은 이름/레벨이면 같은 인스턴스 재사용)"""
+        key = (name, level)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances[key] = cls(name, level)
+        return instance
 
 
 class SSMClient:
@@ -283,26 +300,49 @@ class SlackNotifier:
     def __init__(self, webhook_url: Optional[str] = None):
         self.logger = Logger.get_logger("SlackNotifier")
         self.webhook_url = webhook_url or Config.SLACK_WEBHOOK_URL
+        self._batch: Optional[List[Dict]] = None  # batch() 내부에서 모아둔 attachment
         
         if not self.webhook_url:
             self.logger.warning("Slack 웹훅 URL이 설정되지 않았습니다.")
     
+    @contextmanager
+    def batch(self):
+        """블록 내에서 보낸 메시지를 모아 종료 시 한 번의 요청으로 전송"""
+        if self._batch is not None:
+            # 이미 배치 중이면 바깥 배치에 합류
+            yield self
+            return
+        
+        self._batch = []
+        try:
+            yield self
+        finally:
+            attachments, self._batch = self._batch, None
+            if attachments:
+                self._post(attachments)
+    
     def send_message(self, message: str, color: str = "good") -> bool:
-        """Slack 메시지 전송"""
+        """Slack 메시지 전송 (batch() 내부에서는 전송 대기열에 추가)"""
         if not self.webhook_url:
             self.logger.warning("Slack 웹훅 URL이 없어 알림을 전송할 수 없습니다.")
             return False
         
+        attachment = {
+            "color": color,
+            "text": self._mask_secrets(message),
+            "ts": int(time.time())
+        }
+        
+        if self._batch is not None:
+            self._batch.append(attachment)
+            return True
+        
+        return self._post([attachment])
+    
+    def _post(self, attachments: List[Dict]) -> bool:
+        """attachment 목록을 하나의 웹훅 요청으로 전송"""
         try:
-            payload = {
-                "attachments": [
-                    {
-                        "color": color,
-                        "text": self._mask_secrets(message),
-                        "ts": int(time.time())
-                    }
-                ]
-            }
+            payload = {"attachments": attachments}
             
             response = requests.post(
                 self.webhook_url,
@@ -311,7 +351,7 @@ class SlackNotifier:
             )
             
             if response.status_code == 200:
-                self.logger.info("Slack 알림 전송 성공")
+                self.logger.info(f"Slack 알림 전송 성공 ({len(attachments)}건)")
                 return True
             else:
                 self.logger.error(f"Slack 알림 전송 실패: {response.status_code}")
@@ -384,18 +424,44 @@ class SlackNotifier:
         return masked_text
 
 
+def create_http_session(pool_size: int = 10, retries: int = 0) -> requests.Session:
+    """keep-alive 커넥션 풀을 사용하는 HTTP 세션 생성
+    
+    기본값은 호출자(헬스 체크 재시도 루프)가 재시도를 담당하는 경우를 위해 어댑터 재시도를 끕니다.
+    """
+    session = requests.Session()
+    session.headers['Connection'] = 'keep-alive'
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.2)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class HealthChecker:
     """헬스 체크 유틸리티"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.logger = Logger.get_logger("HealthChecker")
+        # 재시도/다중 URL 체크 간 TCP/TLS 연결 재사용
+        self.session = session or requests.Session()
     
-    def check_url(self, url: str, timeout: Optional[int] = None, expected_status: int = 200) -> bool:
-        """URL 헬스 체크"""
+    def check_url(self, url: str, timeout: Optional[int] = None, expected_status: int = 200,
+                  method: str = 'GET') -> bool:
+        """URL 헬스 체크
+        
+        method='HEAD'이면 본문 없이 상태 코드만 확인하고,
+        서버가 HEAD를 지원하지 않으면(405/501) GET으로 다시 확인합니다.
+        """
         timeout = timeout or Config.HEALTH_CHECK_TIMEOUT
         
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self.session.request(method, url, timeout=timeout)
+            if method == 'HEAD' and response.status_code in (405, 501):
+                response = self.session.get(url, timeout=timeout)
             if response.status_code == expected_status:
                 self.logger.info(f"헬스 체크 성공: {url}")
                 return True
@@ -524,12 +590,96 @@ def load_env_file(file_path: str) -> Dict[str, str]:
         raise CICDError(error_msg) from e
 
 
+@functools.lru_cache(maxsize=8)
+def _load_env_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """(경로, mtime, 크기) 기준으로 파싱 결과 캐시 (불변 튜플 반환)"""
+    return tuple(load_env_file(file_path).items())
+
+
+def load_env_file_cached(file_path: str) -> Dict[str, str]:
+    """환경 파일 로드 (파일이 바뀌지 않았으면 이전 파싱 결과 재사용)"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return load_env_file(file_path)
+    
+    return dict(_load_env_cached(file_path, stat.st_mtime_ns, stat.st_size))
+
+
+def json_loads(data):
+    """JSON 파싱 (orjson이 있으면 사용, str/bytes 모두 허용)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """JSON 직렬화 (UTF-8 bytes 반환, orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def run_bounded(cmd: List[str], timeout: float, cwd: Optional[str] = None,
+                kill_grace: float = 5) -> subprocess.CompletedProcess:
+    """프로세스 그룹 단위 타임아웃으로 명령 실행
+    
+    새 세션에서 실행하므로 타임아웃 시 자식 프로세스(npx 등)까지 함께 종료합니다.
+    타임아웃되면 SIGTERM → (kill_grace초 후) SIGKILL 순으로 종료하고
+    subprocess.TimeoutExpired를 다시 발생시킵니다.
+    """
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd,
+        start_new_session=True
+    ) as process:
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            terminate_process_group(process, kill_grace)
+            process.communicate()
+            raise
+        
+        return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+
+
+def terminate_process_group(process: subprocess.Popen, kill_grace: float = 5) -> None:
+    """start_new_session=True로 시작한 프로세스를 자식 프로세스까지 종료
+    
+    SIGTERM을 보내고 kill_grace초 안에 끝나지 않으면 SIGKILL을 보냅니다.
+    먼저 종료된 리더 대신 남아있는 자식이 있을 수 있으므로 SIGKILL은 항상 그룹에 보냅니다.
+    """
+    _kill_process_group(process, signal.SIGTERM)
+    try:
+        process.wait(timeout=kill_grace)
+    except subprocess.TimeoutExpired:
+        pass
+    _kill_process_group(process, signal.SIGKILL)
+    process.wait()
+
+
+def _kill_process_group(process: subprocess.Popen, sig: int) -> None:
+    """프로세스 그룹에 시그널 전송 (이미 종료된 경우 무시)"""
+    try:
+        os.killpg(process.pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
 def get_current_timestamp() -> str:
     """현재 타임스탬프 반환 (배포 ID용)"""
     return datetime.now().strftime('%Y%m%d-%H%M%S')
 
 
-def validate_environment_variables(required_vars: List[str]) -> bool:
+def split_csv(value: str) -> List[str]:
+    """쉼표 구분 문자열을 공백 제거된 비어있지 않은 항목 목록으로 변환"""
+    return list(filter(None, map(str.strip, value.split(','))))
+
+
+def validate_environment_variables(required_vars: Sequence[str]) -> bool:
     """필수 환경 변수 검증"""
     logger = Logger.get_logger("utils")
     missing_vars = []